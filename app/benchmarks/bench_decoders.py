@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Benchmark page decoding and normalization for each available decoder.
+
+Run from the app directory: python -m benchmarks.bench_decoders
+"""
+
+import json
+import time
+from pathlib import Path
+
+from fetchers.decoders import JsonDecoder, get_decoder
+from processors.normalize import HostNormalizer
+
+DOCS_DIR = Path(__file__).resolve().parents[2] / "docs"
+REPEAT = 200
+
+
+def bench(source: str) -> None:
+    """Print decode and decode+normalize timings of a synthetic large page."""
+    sample = json.loads((DOCS_DIR / f"response-{source}.json").read_text())
+    page = json.dumps(sample * REPEAT).encode()
+    normalizer = HostNormalizer()
+
+    decoders = {JsonDecoder(), get_decoder(source, "orjson"), get_decoder(source)}
+    for decoder in sorted(decoders, key=lambda d: d.name):
+        start = time.perf_counter()
+        hosts = decoder.decode(page)
+        decoded = time.perf_counter() - start
+        for host in hosts:
+            if isinstance(host, dict):
+                host["source"] = source
+        normalizer.process(hosts)
+        total = time.perf_counter() - start
+        print(
+            f"{source:<12} {decoder.name:<8} {len(hosts):>7} hosts "
+            f"decode {decoded * 1000:8.1f} ms  decode+normalize {total * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    for name in ("qualys", "crowdstrike"):
+        bench(name)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Compare sequential and sharded parallel deduplication throughput.
+
+Run from the app directory: python -m benchmarks.bench_dedup [workers...]
+"""
+
+import logging
+import os
+import sys
+import time
+
+from benchmarks.bench_transform import synthetic_hosts
+from processors.deduplicate import DeduplicationProcessor
+from processors.normalize import HostNormalizer
+
+HOSTS = 1_000_000
+
+
+def main() -> None:
+    """Print the deduplication time of each worker count."""
+    logging.disable(logging.WARNING)
+    hosts = HostNormalizer().process(synthetic_hosts(HOSTS))
+    counts = [int(arg) for arg in sys.argv[1:]] or [1, os.cpu_count() or 1]
+    print(f"{HOSTS} normalized hosts, {os.cpu_count()} CPUs")
+    for workers in counts:
+        processor = DeduplicationProcessor(workers=workers)
+        start = time.perf_counter()
+        unique = (
+            processor.process_parallel(hosts)
+            if workers > 1
+            else processor.process(hosts)
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers:>2} workers {elapsed:6.2f} s  "
+            f"{HOSTS / elapsed / 1e6:5.2f} M hosts/s  {len(unique)} unique"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Compare the memory held by normalized Host records and plain dicts.
+
+Run from the app directory: python -m benchmarks.bench_memory
+"""
+
+import gc
+import logging
+import tracemalloc
+from typing import Any, Callable, List
+
+from benchmarks.bench_transform import synthetic_hosts
+from processors.normalize import HostNormalizer
+
+HOSTS = 300_000
+
+
+def allocated(build: Callable[[], List[Any]]) -> int:
+    """Return the bytes still allocated by the result of build()."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    """Print the memory of normalized hosts as Host records and as dicts."""
+    logging.disable(logging.WARNING)
+    raw = synthetic_hosts(HOSTS)
+    normalizer = HostNormalizer()
+    hosts = normalizer.process(raw)
+
+    # Field values are shared, so only the per-host containers are compared
+    as_records = allocated(lambda: [h.__class__(*h.astuple()) for h in hosts])
+    as_dicts = allocated(lambda: [h.to_dict() for h in hosts])
+    print(f"{HOSTS} normalized hosts")
+    for label, size in (("Host records", as_records), ("dicts", as_dicts)):
+        print(f"{label:<14} {size / 2**20:8.1f} MiB  {size / HOSTS:6.0f} B/host")
+    print(f"dicts use {as_dicts / as_records:.1f}x the memory of Host records")
+
+
+if __name__ == "__main__":
+    main()
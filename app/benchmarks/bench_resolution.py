@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Measure entity resolution throughput on hosts with near-duplicates.
+
+Run from the app directory: python -m benchmarks.bench_resolution
+"""
+
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from ipaddress import IPv4Address
+from typing import List
+
+from processors.entity_resolution import EntityResolver
+from processors.host import Host
+
+HOSTS = 1_000_000
+# Share of hosts that are a near-duplicate: FQDN or a new DHCP address
+NEAR_DUPLICATES = 0.1
+
+
+def hosts_with_near_duplicates(count: int) -> List[Host]:
+    """Return distinct normalized hosts followed by variants of a sample of them."""
+    rng = random.Random(7)
+    seen = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    distinct = int(count / (1 + NEAR_DUPLICATES))
+    hosts = [
+        Host(
+            "qualys" if n % 2 else "crowdstrike",
+            f"host-{n}",
+            IPv4Address((10 << 24) + n),
+            "Ubuntu 22.04" if n % 2 else "Windows",
+            seen,
+            "Ubuntu" if n % 2 else "Windows",
+        )
+        for n in range(distinct)
+    ]
+    for host in rng.sample(hosts, count - distinct):
+        variant = Host(*host.astuple())
+        if rng.random() < 0.5:
+            variant.hostname = f"{host.hostname}.corp.local"
+        else:
+            # Another address in the same /24
+            variant.ip = IPv4Address(int(host.ip) ^ rng.randint(1, 255))
+        hosts.append(variant)
+    return hosts
+
+
+def main() -> None:
+    """Print the entity resolution time and the merged host count."""
+    logging.disable(logging.WARNING)
+    hosts = hosts_with_near_duplicates(HOSTS)
+    expected = HOSTS - int(HOSTS / (1 + NEAR_DUPLICATES))
+    print(f"{len(hosts)} hosts, {expected} near-duplicates")
+
+    start = time.perf_counter()
+    resolved = EntityResolver().process(hosts)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Entity resolution {elapsed:6.2f} s  {len(hosts) / elapsed / 1e3:6.1f} k hosts/s"
+        f"  {len(hosts) - len(resolved)} merged"
+    )
+
+
+if __name__ == "__main__":
+    main()
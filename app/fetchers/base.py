@@ -1,28 +1,312 @@
+import asyncio
 import os
 import logging
+import threading
+import time
 from abc import ABC
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 import requests
 
+from fetchers.cache import PageCache
+from fetchers.checkpoint import BaseCheckpointStore
+from fetchers.decoders import JsonDecoder, PageDecoder
+from fetchers.hedging import HedgePolicy
+from fetchers.rate_limit import RateLimiter, get_rate_limiter
+from fetchers.retry import (
+    RETRYABLE_STATUS_CODES,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+)
+from fetchers.streaming import DEFAULT_CHUNK_SIZE, iter_json_array, maybe_gunzip
+from fetchers.transport import HttpTransport, get_default_transport
+
 logger = logging.getLogger(__name__)
 
+# Number of page requests kept in flight by ``fetch_async``
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Upper bound tried when probing for the largest accepted page size
+DEFAULT_MAX_PROBE_LIMIT = 64
+
+# Largest page size accepted by each source, discovered by probing
+_page_size_cache: Dict[str, int] = {}
+
+
+@dataclass
+class FetchStats:  # pylint: disable=too-many-instance-attributes
+    """Request counters of a fetcher, reported in the run summary."""
 
-class BaseFetcher(ABC):
-    def __init__(self, base_url: str, source_name: str) -> None:
+    requests: int = 0
+    retries: int = 0
+    backoff_seconds: float = 0.0
+    circuit_rejections: int = 0
+    cache_hits: int = 0
+    hedges: int = 0
+    hedges_won: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **counts: float) -> None:
+        """Increment counters in a thread-safe way."""
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+class BaseFetcher(ABC):  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        base_url: str,
+        source_name: str,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        transport: Optional[HttpTransport] = None,
+        probe: bool = False,
+        checkpoint_store: Optional[BaseCheckpointStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        page_cache: Optional[PageCache] = None,
+        decoder: Optional[PageDecoder] = None,
+        stream: bool = False,
+        hedge_policy: Optional[HedgePolicy] = None,
+    ) -> None:
         self.base_url = base_url
         self.source_name = source_name
         self.page_size = 2  # Use 2 for better performance
+        self.max_in_flight = max_in_flight
+        self.probe = probe
+        self.checkpoint_store = checkpoint_store
         self.api_token = os.getenv("API_TOKEN")
+        self.transport = transport or get_default_transport()
+        self.rate_limiter = rate_limiter or get_rate_limiter(base_url)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.page_cache = page_cache
+        self.decoder = decoder or JsonDecoder()
+        self.stream = stream
+        self.hedge_policy = hedge_policy
+        self._hedge_executor = self._new_hedge_executor()
+        self.stats = FetchStats()
+        self._session_headers: Optional[Dict[str, Any]] = None
 
     def __str__(self) -> str:
         """Return a human-readable representation of the fetcher"""
         return self.__class__.__name__
 
+    def _check_token(self) -> None:
+        """Raise if the API token is missing."""
+        if not self.api_token:
+            logger.error("❌ API_TOKEN not set in environment variables")
+            raise ValueError("API_TOKEN not set in environment variables")
+
+    def _headers(self) -> Dict[str, Any]:
+        """Return request headers for the API, built once per fetcher."""
+        if self._session_headers is None:
+            self._session_headers = {
+                "token": self.api_token,
+                "accept": "application/json",
+            }
+        return self._session_headers
+
+    def _send(self, skip: int, limit: int, stream: bool = False) -> requests.Response:
+        """Send a single page request to the API through the rate limiter."""
+        self.stats.add(requests=1)
+        with self.rate_limiter.slot() as slot:
+            response = self.transport.post(
+                self.base_url,
+                params={"skip": skip, "limit": limit},
+                headers=self._headers(),
+                stream=stream,
+            )
+            slot.healthy = not self._is_overloaded(response)
+        return response
+
+    def _new_hedge_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Return the pool sending hedged requests; threads start on first use."""
+        if self.hedge_policy is None:
+            return None
+        return ThreadPoolExecutor(
+            max_workers=2 * self.max_in_flight,
+            thread_name_prefix=f"hedge-{self.source_name}",
+        )
+
+    def _shutdown_hedge_executor(self) -> None:
+        """
+        Stop the hedge threads of a finished fetch, without waiting for the
+        losing requests, and keep an idle pool for the next fetch.
+        """
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = self._new_hedge_executor()
+
+    def _send_hedged(
+        self, skip: int, limit: int, stream: bool = False
+    ) -> requests.Response:
+        """
+        Send a request, duplicating it if it is slower than recent requests.
+        Whichever of the two responses arrives first wins.
+        """
+        if self.hedge_policy is None or self._hedge_executor is None or stream:
+            return self._send(skip, limit, stream)
+
+        policy = self.hedge_policy
+        delay = policy.delay()
+        start = time.monotonic()
+        if delay is None:
+            response = self._send(skip, limit)
+            policy.record(time.monotonic() - start)
+            return response
+
+        primary = self._hedge_executor.submit(self._send, skip, limit)
+        done, _ = wait([primary], timeout=delay)
+        if done or not policy.try_hedge():
+            response = primary.result()
+            policy.record(time.monotonic() - start)
+            return response
+
+        logger.debug(
+            "🏎️ Hedging %s request (skip=%d, limit=%d) after %.3fs",
+            self.source_name,
+            skip,
+            limit,
+            delay,
+        )
+        self.stats.add(hedges=1)
+        hedge = self._hedge_executor.submit(self._send, skip, limit)
+        for future in as_completed([primary, hedge]):
+            if future.exception() is None:
+                if future is hedge:
+                    self.stats.add(hedges_won=1)
+                policy.record(time.monotonic() - start)
+                return future.result()
+        return primary.result()
+
+    def _post(
+        self, skip: int, limit: int, idempotent: bool = True, stream: bool = False
+    ) -> requests.Response:
+        """
+        Return a page response, from the page cache when possible.
+        Args:
+            skip: Offset of the first host.
+            limit: Number of hosts requested.
+            idempotent: Whether the request may be retried.
+            stream: Leave the body unread; streamed pages bypass the cache.
+        Returns:
+            The cached or freshly received response.
+        """
+        if self.page_cache is None or stream:
+            return self._post_with_retries(skip, limit, idempotent, stream)
+
+        cached = self.page_cache.get(self.base_url, skip, limit)
+        if cached is not None:
+            self.stats.add(cache_hits=1)
+            response = requests.Response()
+            response.status_code, response._content = cached
+            response.encoding = "utf-8"
+            response.url = self.base_url
+            return response
+
+        response = self._post_with_retries(skip, limit, idempotent)
+        # Only deterministic answers are cached: pages and end-of-data errors
+        if response.status_code == 200 or (
+            response.status_code == 500 and self._is_pagination_end(response)
+        ):
+            self.page_cache.put(
+                self.base_url, skip, limit, response.status_code, response.content
+            )
+        return response
+
+    def _post_with_retries(
+        self, skip: int, limit: int, idempotent: bool = True, stream: bool = False
+    ) -> requests.Response:
+        """
+        Send a page request, retrying transient failures with backoff.
+        Page reads are POSTs with an empty body and no side effects, so they
+        are idempotent and safe to repeat.
+        Args:
+            skip: Offset of the first host.
+            limit: Number of hosts requested.
+            idempotent: Whether the request may be retried.
+            stream: Leave the body unread for incremental parsing.
+        Returns:
+            The last response; errors are left to the caller.
+        """
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow():
+                self.stats.add(circuit_rejections=1)
+                raise CircuitOpenError(f"Circuit breaker open for {self.source_name}")
+
+            attempt += 1
+            error: Optional[requests.exceptions.RequestException] = None
+            try:
+                response = self._send_hedged(skip, limit, stream)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as e:
+                error = e
+            except Exception:
+                # Counts as a failed probe, so a half-open circuit is not stuck
+                self.circuit_breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.circuit_breaker.record_success()
+                    return response
+
+            self.circuit_breaker.record_failure()
+            if not idempotent or attempt >= self.retry_policy.max_attempts:
+                if error is not None:
+                    raise error
+                return response
+
+            delay = self.retry_policy.backoff(attempt)
+            logger.warning(
+                "🔁 Retrying %s (skip=%d, limit=%d) in %.2fs after attempt %d: %s",
+                self.source_name,
+                skip,
+                limit,
+                delay,
+                attempt,
+                error or response.status_code,
+            )
+            self.stats.add(retries=1, backoff_seconds=delay)
+            time.sleep(delay)
+
+    def _tag_hosts(self, hosts: List[Any]) -> List[Any]:
+        """Tag every host (dict or typed record) of a page with the fetcher source."""
+        for host in hosts:
+            if isinstance(host, dict):
+                host["source"] = self.source_name
+            else:
+                host.source = self.source_name
+        return hosts
+
+    @staticmethod
+    def _is_pagination_end(response) -> bool:
+        """Return True if the error response means skip/limit is past the data."""
+        error_text = response.text.lower()
+        return (
+            "invalid skip/limit combo" in error_text or ">number of hosts" in error_text
+        )
+
+    def _is_overloaded(self, response) -> bool:
+        """Return True for throttling and server errors other than end of data."""
+        if response.status_code == 429:
+            return True
+        return response.status_code >= 500 and not self._is_pagination_end(response)
+
     def _handle_api_error(self, response, skip: int) -> tuple[bool, list]:
         """Handle API error responses and return (should_break, hosts_to_add)."""
-        error_text = response.text.lower()
-        if "invalid skip/limit combo" in error_text or ">number of hosts" in error_text:
+        if self._is_pagination_end(response):
             logger.debug(
                 "🔄 API returned pagination end for %s, "
                 "trying final page with limit=1",
@@ -30,24 +314,14 @@ class BaseFetcher(ABC):
             )
             # Try with page_size=1 for the last host
             if self.page_size == 2:
-                params = {"skip": skip, "limit": 1}
-                headers = {"token": self.api_token, "accept": "application/json"}
-                response = requests.post(
-                    self.base_url,
-                    params=params,
-                    headers=headers,
-                    data="",
-                    timeout=30,
-                )
+                response = self._post(skip, 1)
                 if response.status_code == 200:
-                    hosts = response.json()
+                    hosts = self.decoder.decode_response(response)
                     if hosts:
                         logger.debug(
                             "✅ Retrieved final host from %s", self.source_name
                         )
-                        for host in hosts:
-                            host["source"] = self.source_name
-                        return True, hosts
+                        return True, self._tag_hosts(hosts)
             return True, []
 
         # Other 500 error - raise it
@@ -60,95 +334,383 @@ class BaseFetcher(ABC):
         response.raise_for_status()
         return False, []
 
-    def fetch(self) -> List[Dict[str, Any]]:
-        """Fetch data from the API with hybrid pagination strategy"""
-        if not self.api_token:
-            logger.error("❌ API_TOKEN not set in environment variables")
-            raise ValueError("API_TOKEN not set in environment variables")
-
-        logger.info("📡 Starting data fetch from %s", self.source_name)
-        headers = {"token": self.api_token, "accept": "application/json"}
-        all_hosts: List[Dict[str, Any]] = []
-        skip = 0
-        page_count = 0
-
+    def _fetch_page(self, skip: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch the page starting at ``skip`` using the hybrid strategy.
+        Args:
+            skip: Offset of the first host of the page.
+        Returns:
+            Tuple of (tagged hosts, whether this is the last page).
+        """
         while True:
-            page_count += 1
-            # Use page_size=2 for most requests, but page_size=1 for last page
-            params = {"skip": skip, "limit": self.page_size}
-            try:
+            logger.debug(
+                "📄 Fetching page from %s (skip=%d, limit=%d)",
+                self.source_name,
+                skip,
+                self.page_size,
+            )
+            response = self._post(skip, self.page_size)
+
+            # Handle specific API error for invalid skip/limit combo
+            if response.status_code == 500:
                 logger.debug(
-                    "📄 Fetching page %d from %s (skip=%d, limit=%d)",
-                    page_count,
+                    "🔄 Got 500 error from %s at skip=%d, limit=%d",
                     self.source_name,
                     skip,
                     self.page_size,
                 )
-                response = requests.post(
-                    self.base_url,
-                    params=params,
-                    headers=headers,
-                    data="",
-                    timeout=30,
-                )
+                should_break, additional_hosts = self._handle_api_error(response, skip)
+                if should_break:
+                    return additional_hosts, True
+                continue
 
-                # Handle specific API error for invalid skip/limit combo
-                if response.status_code == 500:
-                    logger.debug(
-                        "🔄 Got 500 error from %s at skip=%d, limit=%d",
-                        self.source_name,
-                        skip,
-                        self.page_size,
+            response.raise_for_status()
+            hosts = self.decoder.decode_response(response)
+            logger.debug(
+                "📥 Got %d hosts from %s (skip=%d, limit=%d)",
+                len(hosts),
+                self.source_name,
+                skip,
+                self.page_size,
+            )
+            return self._tag_hosts(hosts), len(hosts) < self.page_size
+
+    def iter_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of hosts as soon as they are fetched and tagged.
+        With a checkpoint store, hosts fetched by an interrupted run are
+        yielded first and pagination resumes from the last good ``skip``.
+        Returns:
+            Iterator over non-empty pages of hosts tagged with the source.
+        """
+        self._check_token()
+
+        logger.info("📡 Starting data fetch from %s", self.source_name)
+        host_count = 0
+        skip = 0
+        page_count = 0
+
+        checkpoint = (
+            self.checkpoint_store.load(self.source_name)
+            if self.checkpoint_store
+            else None
+        )
+        if checkpoint is not None:
+            logger.info(
+                "♻️ Resuming %s from skip=%d (%d hosts restored)",
+                self.source_name,
+                checkpoint.skip,
+                len(checkpoint.hosts),
+            )
+            skip = checkpoint.skip
+            host_count = len(checkpoint.hosts)
+            if checkpoint.hosts:
+                yield checkpoint.hosts
+
+        try:
+            while True:
+                page_count += 1
+                try:
+                    hosts, is_last = self._fetch_page(skip)
+                except requests.exceptions.RequestException as e:
+                    logger.error(
+                        "❌ Error fetching data from %s: %s", self.source_name, e
                     )
-                    should_break, additional_hosts = self._handle_api_error(
-                        response, skip
+                    raise
+
+                host_count += len(hosts)
+                if self.checkpoint_store and not is_last:
+                    self.checkpoint_store.save(
+                        self.source_name, skip + self.page_size, hosts
                     )
-                    if additional_hosts:
-                        all_hosts.extend(additional_hosts)
+                if hosts:
+                    yield hosts
+                if is_last:
+                    logger.debug("📭 No more hosts from %s", self.source_name)
+                    break
+                skip += self.page_size
+        finally:
+            self._shutdown_hedge_executor()
+
+        if self.checkpoint_store:
+            self.checkpoint_store.clear(self.source_name)
+
+        logger.info(
+            "✅ Completed data fetch from %s: %d total hosts in %d pages",
+            self.source_name,
+            host_count,
+            page_count,
+        )
+        logger.debug("🔌 Transport stats: %s", self.transport.stats())
+
+    def iter_hosts(self) -> Iterator[Dict[str, Any]]:
+        """Yield hosts one by one, fetching pages lazily."""
+        if self.stream:
+            yield from self._iter_streamed_hosts()
+            return
+        for page in self.iter_pages():
+            yield from page
+
+    def _iter_streamed_hosts(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield hosts while each page body is parsed incrementally.
+        Peak memory is bounded by a single host rather than a page; gzip
+        bodies are decompressed on the fly. Pages are not materialized, so
+        checkpoints are not written in this mode.
+        Returns:
+            Iterator over hosts tagged with the source.
+        """
+        self._check_token()
+
+        logger.info("📡 Starting streamed data fetch from %s", self.source_name)
+        host_count = 0
+        skip = 0
+        page_count = 0
+
+        while True:
+            page_count += 1
+            try:
+                response = self._post(skip, self.page_size, stream=True)
+                if response.status_code == 500:
+                    should_break, hosts = self._handle_api_error(response, skip)
+                    host_count += len(hosts)
+                    yield from hosts
                     if should_break:
-                        logger.debug(
-                            "🔄 Breaking pagination loop for %s after error handling",
-                            self.source_name,
-                        )
                         break
                     continue
 
                 response.raise_for_status()
-                hosts = response.json()
-                logger.debug(
-                    "📥 Got %d hosts from %s (page %d, skip=%d, limit=%d)",
-                    len(hosts),
-                    self.source_name,
-                    page_count,
-                    skip,
-                    self.page_size,
-                )
+                count = 0
+                try:
+                    chunks = response.iter_content(DEFAULT_CHUNK_SIZE)
+                    for host in iter_json_array(maybe_gunzip(chunks)):
+                        host["source"] = self.source_name
+                        count += 1
+                        yield host
+                finally:
+                    response.close()
+            except requests.exceptions.RequestException as e:
+                logger.error("❌ Error fetching data from %s: %s", self.source_name, e)
+                raise
 
-                if not hosts:
-                    logger.debug("📭 No more hosts from %s", self.source_name)
-                    break
+            host_count += count
+            if count < self.page_size:
+                break
+            skip += self.page_size
 
-                for host in hosts:
-                    host["source"] = self.source_name
-                all_hosts.extend(hosts)
+        logger.info(
+            "✅ Completed streamed data fetch from %s: %d total hosts in %d pages",
+            self.source_name,
+            host_count,
+            page_count,
+        )
 
-                if len(hosts) < self.page_size:
-                    logger.debug(
-                        "📭 Got fewer hosts than limit (%d < %d), ending pagination",
-                        len(hosts),
-                        self.page_size,
+    def fetch(self) -> List[Dict[str, Any]]:
+        """Fetch data from the API with hybrid pagination strategy"""
+        if self.probe:
+            return self.fetch_planned()
+        return list(self.iter_hosts())
+
+    async def fetch_async(  # pylint: disable=too-many-locals
+        self, max_in_flight: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch data keeping a window of page requests in flight.
+        Pages are requested at increasing ``skip`` offsets until one of them
+        turns out to be the last page; results are returned in the same order
+        as ``fetch``.
+        Args:
+            max_in_flight: Maximum number of concurrent page requests.
+        Returns:
+            List of hosts tagged with the fetcher source.
+        """
+        self._check_token()
+        window = max(1, max_in_flight or self.max_in_flight)
+
+        logger.info(
+            "📡 Starting async data fetch from %s (window=%d)",
+            self.source_name,
+            window,
+        )
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        errors: Dict[int, BaseException] = {}
+        pending: Dict[asyncio.Future, int] = {}
+        end_skip: Optional[int] = None
+        next_skip = 0
+
+        try:
+            while True:
+                # Stop scheduling once the end of data or a failed page is known
+                while end_skip is None and not errors and len(pending) < window:
+                    task = asyncio.ensure_future(
+                        asyncio.to_thread(self._fetch_page, next_skip)
                     )
+                    pending[task] = next_skip
+                    next_skip += self.page_size
+                if not pending:
                     break
-                skip += self.page_size
 
-            except requests.exceptions.RequestException as e:
-                logger.error("❌ Error fetching data from %s: %s", self.source_name, e)
-                raise
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    skip = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        errors[skip] = error
+                        continue
+                    hosts, is_last = future.result()
+                    pages[skip] = hosts
+                    if is_last and (end_skip is None or skip < end_skip):
+                        end_skip = skip
+        finally:
+            self._shutdown_hedge_executor()
+
+        # Errors past the last page are irrelevant, anything before it is fatal
+        fatal = [skip for skip in errors if end_skip is None or skip <= end_skip]
+        if fatal:
+            error = errors[min(fatal)]
+            logger.error("❌ Error fetching data from %s: %s", self.source_name, error)
+            raise error
+
+        all_hosts: List[Dict[str, Any]] = []
+        for skip in sorted(pages):
+            if end_skip is not None and skip > end_skip:
+                break
+            all_hosts.extend(pages[skip])
+
+        logger.info(
+            "✅ Completed async data fetch from %s: %d total hosts in %d requests",
+            self.source_name,
+            len(all_hosts),
+            len(pages) + len(errors),
+        )
+        logger.debug("🔌 Transport stats: %s", self.transport.stats())
+        return all_hosts
+
+    def _probe(self, skip: int, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Request skip/limit and return the hosts, or None if it was rejected."""
+        response = self._post(skip, limit)
+        if response.status_code == 500 and self._is_pagination_end(response):
+            return None
+        response.raise_for_status()
+        return self.decoder.decode_response(response)
+
+    def _host_exists(self, skip: int) -> bool:
+        """Return True if there is a host at offset ``skip``."""
+        return bool(self._probe(skip, 1))
+
+    def probe_page_size(self, max_limit: int = DEFAULT_MAX_PROBE_LIMIT) -> int:
+        """
+        Find the largest page size accepted by the API, cached per source.
+        The API also rejects limits larger than the number of hosts, so for
+        small inventories the result is capped by the host count.
+        Args:
+            max_limit: Largest page size to try.
+        Returns:
+            Largest accepted page size (at least 1).
+        """
+        cached = _page_size_cache.get(self.source_name)
+        if cached:
+            return cached
+
+        # Double the limit until it is rejected, then bisect the gap
+        accepted, rejected = 0, max_limit + 1
+        limit = 1
+        while limit <= max_limit:
+            if self._probe(0, limit) is None:
+                rejected = limit
+                break
+            accepted = limit
+            limit *= 2
+        while rejected - accepted > 1:
+            middle = (accepted + rejected) // 2
+            if self._probe(0, middle) is None:
+                rejected = middle
+            else:
+                accepted = middle
+
+        page_size = max(1, accepted)
+        _page_size_cache[self.source_name] = page_size
+        logger.info("📏 Probed page size for %s: %d", self.source_name, page_size)
+        return page_size
+
+    def probe_total(self) -> int:
+        """
+        Locate the number of hosts with an exponential then binary search.
+        Returns:
+            Total number of hosts available from the source.
+        """
+        if not self._host_exists(0):
+            return 0
+
+        present, missing = 0, 1
+        while self._host_exists(missing):
+            present, missing = missing, missing * 2
+        while missing - present > 1:
+            middle = (present + missing) // 2
+            if self._host_exists(middle):
+                present = middle
+            else:
+                missing = middle
+
+        logger.info("🔢 Probed %d hosts in %s", present + 1, self.source_name)
+        return present + 1
+
+    @staticmethod
+    def plan_pages(total: int, page_size: int) -> List[Tuple[int, int]]:
+        """Return the (skip, limit) schedule that covers ``total`` hosts exactly."""
+        return [
+            (skip, min(page_size, total - skip)) for skip in range(0, total, page_size)
+        ]
+
+    def _fetch_planned_page(self, page: Tuple[int, int]) -> List[Dict[str, Any]]:
+        """Fetch one planned (skip, limit) page."""
+        skip, limit = page
+        response = self._post(skip, limit)
+        response.raise_for_status()
+        return self._tag_hosts(self.decoder.decode_response(response))
+
+    def fetch_planned(
+        self, max_in_flight: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Probe page size and host count, then fetch the exact schedule in parallel.
+        Args:
+            max_in_flight: Maximum number of concurrent page requests.
+        Returns:
+            List of hosts tagged with the fetcher source, in ``skip`` order.
+        """
+        self._check_token()
+        try:
+            self.page_size = self.probe_page_size()
+            plan = self.plan_pages(self.probe_total(), self.page_size)
+
+            logger.info(
+                "📡 Fetching %d planned pages from %s (page size %d)",
+                len(plan),
+                self.source_name,
+                self.page_size,
+            )
+            all_hosts: List[Dict[str, Any]] = []
+            if plan:
+                workers = max(1, min(max_in_flight or self.max_in_flight, len(plan)))
+                try:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        for hosts in executor.map(self._fetch_planned_page, plan):
+                            all_hosts.extend(hosts)
+                except requests.exceptions.RequestException as e:
+                    logger.error(
+                        "❌ Error fetching data from %s: %s", self.source_name, e
+                    )
+                    raise
+        finally:
+            self._shutdown_hedge_executor()
 
         logger.info(
             "✅ Completed data fetch from %s: %d total hosts in %d pages",
             self.source_name,
             len(all_hosts),
-            page_count,
+            len(plan),
         )
         return all_hosts
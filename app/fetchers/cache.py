@@ -0,0 +1,145 @@
+"""On-disk cache of API pages."""
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class PageCache:
+    """Gzip-compressed page bodies keyed by (url, skip, limit) with TTL and LRU size cap."""
+
+    def __init__(
+        self,
+        directory: str = "cache",
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        Args:
+            directory: Directory holding the cache entries.
+            ttl: Seconds an entry stays valid after it was written.
+            max_bytes: Total compressed size kept before evicting entries.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # Total size of the entries, scanned once and then tracked in memory
+        self._total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, skip: int, limit: int) -> str:
+        """Return the content address of a page."""
+        return hashlib.sha256(f"{url}\0{skip}\0{limit}".encode()).hexdigest()
+
+    def _path(self, url: str, skip: int, limit: int) -> Path:
+        return self.directory / f"{self.key(url, skip, limit)}.gz"
+
+    def get(self, url: str, skip: int, limit: int) -> Optional[Tuple[int, bytes]]:
+        """
+        Return a cached page.
+        Args:
+            url: Endpoint URL.
+            skip: Page offset.
+            limit: Page size.
+        Returns:
+            Tuple of (status code, body), or None on a miss or expired entry.
+        """
+        path = self._path(url, skip, limit)
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                self._track(-stat.st_size)
+                return None
+            data = gzip.decompress(path.read_bytes())
+            # Record the access time explicitly for LRU eviction
+            os.utime(path, (time.time(), stat.st_mtime))
+        except (OSError, EOFError):
+            return None
+
+        status, _, body = data.partition(b"\n")
+        return int(status), body
+
+    def put(self, url: str, skip: int, limit: int, status: int, body: bytes) -> None:
+        """Store a page body and evict old entries if over the size cap."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(b"%d\n" % status + body)
+        # Write atomically so concurrent readers never see partial entries
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        path = self._path(url, skip, limit)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        os.replace(tmp, path)
+        if self._track(len(data) - replaced) > self.max_bytes:
+            with self._lock:
+                self._evict()
+
+    def _track(self, delta: int) -> int:
+        """Add ``delta`` to the tracked total size and return it."""
+        with self._lock:
+            if self._total is None:
+                # The first scan already sees the entry the delta accounts for
+                self._total = self._scan()
+            else:
+                self._total += delta
+            return self._total
+
+    def _scan(self) -> int:
+        """Return the total size of the entries on disk."""
+        total = 0
+        for path in self.directory.glob("*.gz"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits ``max_bytes``.
+        Rescans the directory, so entries written by other processes count.
+        """
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.gz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+            total += stat.st_size
+        self._total = total
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total = total
+        logger.debug("🧹 Evicted page cache entries, %d bytes kept", total)
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            for path in self.directory.glob("*.gz"):
+                path.unlink(missing_ok=True)
+            self._total = 0
@@ -0,0 +1,130 @@
+"""Pagination checkpoints for resuming interrupted extractions."""
+
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from fetchers.records import to_builtins
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Checkpoint:
+    """Pagination state of a source: next offset and hosts fetched so far."""
+
+    skip: int
+    hosts: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class BaseCheckpointStore(ABC):
+    @abstractmethod
+    def load(self, source: str) -> Optional[Checkpoint]:
+        """Return the checkpoint of a source, if any"""
+
+    @abstractmethod
+    def save(self, source: str, skip: int, hosts: List[Dict[str, Any]]) -> None:
+        """Record a fetched page and the next offset to fetch"""
+
+    @abstractmethod
+    def clear(self, source: str) -> None:
+        """Drop the checkpoint of a source"""
+
+
+class FileCheckpointStore(BaseCheckpointStore):
+    """Stores checkpoints as append-only JSON lines, one file per source."""
+
+    def __init__(
+        self, directory: str = "checkpoints", max_age: Optional[float] = None
+    ) -> None:
+        """
+        Args:
+            directory: Directory holding the checkpoint files.
+            max_age: Seconds after which a checkpoint is considered stale.
+        """
+        self.directory = Path(directory)
+        self.max_age = max_age
+
+    def _path(self, source: str) -> Path:
+        return self.directory / f"{source}.jsonl"
+
+    def _is_stale(self, path: Path) -> bool:
+        return (
+            self.max_age is not None
+            and time.time() - path.stat().st_mtime > self.max_age
+        )
+
+    def load(self, source: str) -> Optional[Checkpoint]:
+        """
+        Load the checkpoint of a source.
+        Args:
+            source: Source name.
+        Returns:
+            Checkpoint, or None if there is no usable checkpoint.
+        """
+        path = self._path(source)
+        if not path.exists():
+            return None
+        if self._is_stale(path):
+            logger.info("🗑️ Discarding stale checkpoint for %s", source)
+            self.clear(source)
+            return None
+
+        checkpoint: Optional[Checkpoint] = None
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write leaves a truncated last line
+                    logger.warning(
+                        "⚠️ Ignoring truncated checkpoint entry for %s", source
+                    )
+                    break
+                if checkpoint is None:
+                    checkpoint = Checkpoint(entry["skip"])
+                checkpoint.skip = entry["skip"]
+                checkpoint.hosts.extend(entry["hosts"])
+        return checkpoint
+
+    def save(self, source: str, skip: int, hosts: List[Dict[str, Any]]) -> None:
+        """
+        Append a fetched page to the checkpoint of a source.
+        Args:
+            source: Source name.
+            skip: Offset of the next page to fetch.
+            hosts: Hosts of the page just fetched.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._path(source).open("a", encoding="utf-8") as f:
+            f.write(
+                json.dumps({"skip": skip, "hosts": hosts}, default=to_builtins) + "\n"
+            )
+
+    def clear(self, source: str) -> None:
+        """Remove the checkpoint file of a source."""
+        self._path(source).unlink(missing_ok=True)
+
+    def expire(self) -> int:
+        """
+        Remove the checkpoints older than ``max_age`` of every source,
+        including sources no longer fetched.
+        Returns:
+            Number of checkpoints removed.
+        """
+        removed = 0
+        for path in self.directory.glob("*.jsonl"):
+            try:
+                if not self._is_stale(path):
+                    continue
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        if removed:
+            logger.info("🗑️ Removed %d stale checkpoints", removed)
+        return removed
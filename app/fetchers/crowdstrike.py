@@ -1,9 +1,13 @@
+from typing import Any
+
 from fetchers.base import BaseFetcher
+from fetchers.decoders import get_decoder
 
 BASE_URL = "https://api.recruiting.app.silk.security/api"
 CROWDSTRIKE_URL = f"{BASE_URL}/crowdstrike/hosts/get"
 
 
 class CrowdstrikeFetcher(BaseFetcher):
-    def __init__(self) -> None:
-        super().__init__(CROWDSTRIKE_URL, "crowdstrike")
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("decoder", get_decoder("crowdstrike"))
+        super().__init__(CROWDSTRIKE_URL, "crowdstrike", **kwargs)
@@ -0,0 +1,131 @@
+"""Pluggable decoders turning API page bodies into host records."""
+
+import ipaddress
+import json
+import pickle
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Type
+
+from fetchers.records import RECORD_TYPES, msgspec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+class PageDecoder(ABC):
+    name = "base"
+
+    @abstractmethod
+    def decode(self, data: bytes) -> List[Any]:
+        """Decode a page body into a list of hosts"""
+
+    def decode_response(self, response) -> List[Any]:
+        """Decode the body of an HTTP response."""
+        return self.decode(response.content)
+
+
+class JsonDecoder(PageDecoder):
+    """Standard library decoder producing dicts."""
+
+    name = "json"
+
+    def decode(self, data: bytes) -> List[Any]:
+        return json.loads(data)
+
+    def decode_response(self, response) -> List[Any]:
+        return response.json()
+
+
+class OrjsonDecoder(PageDecoder):
+    """orjson decoder producing dicts."""
+
+    name = "orjson"
+
+    def decode(self, data: bytes) -> List[Any]:
+        return orjson.loads(data)  # pylint: disable=no-member
+
+
+class MsgspecDecoder(PageDecoder):
+    """msgspec decoder producing typed records, skipping unused fields."""
+
+    name = "msgspec"
+
+    def __init__(self, record_type: Type[Any]) -> None:
+        self._decoder = msgspec.json.Decoder(
+            List[record_type]  # type: ignore[valid-type]
+        )
+
+    def decode(self, data: bytes) -> List[Any]:
+        return self._decoder.decode(data)
+
+
+def get_decoder(
+    source_name: Optional[str] = None, preferred: str = "auto"
+) -> PageDecoder:
+    """
+    Return the fastest available decoder for a source.
+    Args:
+        source_name: Source whose typed records should be produced.
+        preferred: "auto", "msgspec", "orjson" or "json".
+    Returns:
+        The preferred decoder if installed, otherwise the next fastest one,
+        falling back to the standard library.
+    """
+    record_type = RECORD_TYPES.get(source_name or "")
+    if preferred in ("auto", "msgspec") and msgspec is not None and record_type:
+        return MsgspecDecoder(record_type)
+    if preferred in ("auto", "msgspec", "orjson") and orjson is not None:
+        return OrjsonDecoder()
+    return JsonDecoder()
+
+
+def loads(data: bytes) -> Any:
+    """Decode a single JSON document with the fastest available parser."""
+    if orjson is not None:
+        return orjson.loads(data)  # pylint: disable=no-member
+    return json.loads(data)
+
+
+_IPV4_EXT = 4
+_IPV6_EXT = 6
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode IP addresses as MessagePack extensions holding the packed bytes."""
+    if isinstance(obj, ipaddress.IPv4Address):
+        return msgspec.msgpack.Ext(_IPV4_EXT, obj.packed)
+    if isinstance(obj, ipaddress.IPv6Address):
+        return msgspec.msgpack.Ext(_IPV6_EXT, obj.packed)
+    raise NotImplementedError(f"Cannot encode {type(obj).__name__}")
+
+
+def _ext_hook(code: int, data: memoryview) -> Any:
+    if code == _IPV4_EXT:
+        return ipaddress.IPv4Address(bytes(data))
+    if code == _IPV6_EXT:
+        return ipaddress.IPv6Address(bytes(data))
+    raise NotImplementedError(f"Unknown extension type {code}")
+
+
+if msgspec is not None:
+    _packer = msgspec.msgpack.Encoder(enc_hook=_enc_hook)
+    _unpacker = msgspec.msgpack.Decoder(ext_hook=_ext_hook)
+
+
+def pack(data: Any) -> bytes:
+    """
+    Encode hosts (dicts or typed records) compactly to move them between
+    processes. Uses MessagePack when msgspec is installed, pickle otherwise.
+    """
+    if msgspec is not None:
+        return _packer.encode(data)
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def unpack(data: bytes) -> Any:
+    """Decode hosts encoded by ``pack``; typed records come back as dicts."""
+    if msgspec is not None:
+        return _unpacker.decode(data)
+    return pickle.loads(data)
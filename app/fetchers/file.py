@@ -0,0 +1,199 @@
+"""Fetcher reading bulk NDJSON / JSON exports from disk."""
+
+import logging
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from fetchers.base import BaseFetcher
+from fetchers.decoders import loads
+from fetchers.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    GZIP_MAGIC,
+    gunzip_chunks,
+    iter_json_array,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of hosts per page yielded by ``iter_pages``
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def _parse_range(path: str, start: int, end: int, source: str) -> List[Dict[str, Any]]:
+    """Parse one byte range of an NDJSON file (process pool worker)."""
+    return list(FileFetcher(path, source).iter_range(start, end))
+
+
+class FileFetcher(BaseFetcher):
+    """Reads host exports (NDJSON, JSON array, optionally gzip) from a file."""
+
+    def __init__(
+        self, path: str, source_name: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        super().__init__(path, source_name)
+        self.path = Path(path)
+        self.batch_size = batch_size
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.path.name})"
+
+    def _is_gzip(self) -> bool:
+        with self.path.open("rb") as f:
+            return f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+    def _read_chunks(self) -> Iterator[bytes]:
+        with self.path.open("rb") as f:
+            while chunk := f.read(DEFAULT_CHUNK_SIZE):
+                yield chunk
+
+    @staticmethod
+    def _iter_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Split a chunk stream into lines without loading the whole stream."""
+        rest = b""
+        for chunk in chunks:
+            lines = (rest + chunk).split(b"\n")
+            rest = lines.pop()
+            yield from lines
+        yield rest
+
+    def _iter_stream(self, chunks: Iterator[bytes]) -> Iterator[Dict[str, Any]]:
+        """Parse a JSON array or NDJSON chunk stream, detected by its first byte."""
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if head.strip():
+                break
+        stream = self._prepend(head, chunks)
+        if head.lstrip().startswith(b"["):
+            yield from iter_json_array(stream)
+            return
+        for line in self._iter_lines(stream):
+            if line.strip():
+                yield loads(line)
+
+    @staticmethod
+    def _prepend(head: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        yield head
+        yield from chunks
+
+    def iter_range(self, start: int, end: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the NDJSON records of an uncompressed file between two offsets.
+        Args:
+            start: Offset of the first line (a line start).
+            end: Offset just past the last line (a line start or file size).
+        Returns:
+            Iterator over records tagged with the source.
+        """
+        if start >= end:
+            return
+        with self.path.open("rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            pos = start
+            while pos < end:
+                newline = mm.find(b"\n", pos, end)
+                stop = end if newline == -1 else newline
+                line = mm[pos:stop]
+                pos = stop + 1
+                if line.strip():
+                    record = loads(line)
+                    record["source"] = self.source_name
+                    yield record
+
+    def split_ranges(self, parts: int) -> List[Tuple[int, int]]:
+        """
+        Split an uncompressed NDJSON file into byte ranges aligned on lines.
+        Args:
+            parts: Desired number of ranges.
+        Returns:
+            Non-empty (start, end) ranges covering the whole file.
+        Raises:
+            ValueError: If the file is compressed and cannot be split.
+        """
+        if self._is_gzip():
+            raise ValueError(f"Cannot split compressed file {self.path}")
+        size = self.path.stat().st_size
+        if size == 0:
+            return []
+
+        bounds = [0]
+        with self.path.open("rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            for i in range(1, max(1, parts)):
+                newline = mm.find(b"\n", max(bounds[-1], size * i // parts))
+                if newline == -1:
+                    break
+                bounds.append(newline + 1)
+        bounds.append(size)
+        return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+    def _is_ndjson(self) -> bool:
+        """Return True unless the uncompressed file holds a JSON array."""
+        for chunk in self._read_chunks():
+            stripped = chunk.lstrip()
+            if stripped:
+                return not stripped.startswith(b"[")
+        return True
+
+    def iter_hosts(self) -> Iterator[Dict[str, Any]]:
+        """Stream records from the file, tagged with the source."""
+        logger.info("📂 Reading hosts for %s from %s", self.source_name, self.path)
+        size = self.path.stat().st_size
+        if size == 0:
+            return
+        if self._is_gzip():
+            records = self._iter_stream(gunzip_chunks(self._read_chunks()))
+        elif self._is_ndjson():
+            yield from self.iter_range(0, size)
+            return
+        else:
+            records = iter_json_array(self._read_chunks())
+
+        for record in records:
+            record["source"] = self.source_name
+            yield record
+
+    def iter_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield records in batches of ``batch_size``."""
+        page: List[Dict[str, Any]] = []
+        for record in self.iter_hosts():
+            page.append(record)
+            if len(page) >= self.batch_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    def fetch_parallel(self, workers: int) -> List[Dict[str, Any]]:
+        """
+        Parse an uncompressed NDJSON file with several worker processes.
+        Compressed files and JSON arrays cannot be split and are read
+        sequentially.
+        Args:
+            workers: Number of worker processes (and byte ranges).
+        Returns:
+            Records in file order, tagged with the source.
+        """
+        if self._is_gzip() or not self._is_ndjson():
+            return self.fetch()
+
+        ranges = self.split_ranges(workers)
+        logger.info(
+            "📂 Parsing %s in %d byte ranges with %d workers",
+            self.path,
+            len(ranges),
+            workers,
+        )
+        all_hosts: List[Dict[str, Any]] = []
+        with ProcessPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [
+                executor.submit(_parse_range, str(self.path), a, b, self.source_name)
+                for a, b in ranges
+            ]
+            for future in futures:
+                all_hosts.extend(future.result())
+        return all_hosts
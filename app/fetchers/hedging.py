@@ -0,0 +1,59 @@
+"""Hedged requests: duplicate slow requests to cut tail latency."""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+
+class HedgePolicy:
+    """Decides when a duplicate request is sent, from recent latencies."""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_hedge_ratio: float = 0.05,
+        min_samples: int = 20,
+        window: int = 500,
+    ) -> None:
+        """
+        Args:
+            percentile: Latency percentile after which a request is hedged.
+            max_hedge_ratio: Maximum share of requests that may be hedged.
+            min_samples: Latencies needed before hedging starts.
+            window: Number of recent latencies kept.
+        """
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._requests = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def delay(self) -> Optional[float]:
+        """
+        Count a new request and return how long to wait before hedging it.
+        Returns:
+            The configured latency percentile, or None while warming up.
+        """
+        with self._lock:
+            self._requests += 1
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+    def try_hedge(self) -> bool:
+        """Reserve a hedge if the hedge rate stays under ``max_hedge_ratio``."""
+        with self._lock:
+            if self._hedges + 1 > self.max_hedge_ratio * self._requests:
+                return False
+            self._hedges += 1
+            return True
@@ -1,9 +1,13 @@
+from typing import Any
+
 from fetchers.base import BaseFetcher
+from fetchers.decoders import get_decoder
 
 BASE_URL = "https://api.recruiting.app.silk.security/api"
 QUALYS_URL = f"{BASE_URL}/qualys/hosts/get"
 
 
 class QualysFetcher(BaseFetcher):
-    def __init__(self) -> None:
-        super().__init__(QUALYS_URL, "qualys")
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("decoder", get_decoder("qualys"))
+        super().__init__(QUALYS_URL, "qualys", **kwargs)
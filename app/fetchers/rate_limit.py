@@ -0,0 +1,174 @@
+"""Shared rate limiting and adaptive concurrency for API calls."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests per second."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting for it if the bucket is empty.
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveConcurrency:  # pylint: disable=too-many-instance-attributes
+    """AIMD limit on the number of requests in flight."""
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 32,
+        decrease_factor: float = 0.5,
+        latency_factor: float = 3.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        """
+        Args:
+            initial: Starting concurrency limit.
+            minimum: Lowest limit the backoff can reach.
+            maximum: Highest limit the ramp-up can reach.
+            decrease_factor: Multiplier applied to the limit on backoff.
+            latency_factor: Latency above this multiple of the average is a spike.
+            smoothing: Weight of the newest sample in the latency average.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.average_latency: Optional[float] = None
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Wait until a request slot is free and take it."""
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, healthy: bool) -> None:
+        """
+        Free a slot and adjust the limit from the outcome of the request.
+        Args:
+            latency: Duration of the request in seconds.
+            healthy: False for throttling, server errors or failed requests.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            spike = (
+                self.average_latency is not None
+                and latency > self.average_latency * self.latency_factor
+            )
+            if not healthy or spike:
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                logger.debug(
+                    "📉 Backing off to concurrency %.1f (healthy=%s, latency=%.3fs)",
+                    self.limit,
+                    healthy,
+                    latency,
+                )
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            if healthy:
+                self.average_latency = (
+                    latency
+                    if self.average_latency is None
+                    else self.smoothing * latency
+                    + (1 - self.smoothing) * self.average_latency
+                )
+            self._condition.notify_all()
+
+
+class RequestSlot:
+    """Outcome of a rate-limited request, filled in by the caller."""
+
+    def __init__(self) -> None:
+        self.healthy = True
+
+
+class RateLimiter:
+    """Token bucket and adaptive concurrency limit for one endpoint."""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        **concurrency: Any,
+    ) -> None:
+        """
+        Args:
+            rate: Requests per second, or None for no rate cap.
+            burst: Number of requests allowed back to back.
+            concurrency: Keyword arguments for ``AdaptiveConcurrency``.
+        """
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.concurrency = AdaptiveConcurrency(**concurrency)
+
+    @contextmanager
+    def slot(self) -> Iterator[RequestSlot]:
+        """Hold a request slot; mark ``healthy = False`` on overload responses."""
+        if self.bucket is not None:
+            self.bucket.acquire()
+        self.concurrency.acquire()
+        slot = RequestSlot()
+        start = time.monotonic()
+        try:
+            yield slot
+        except BaseException:
+            slot.healthy = False
+            raise
+        finally:
+            self.concurrency.release(time.monotonic() - start, slot.healthy)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def configure_rate_limit(endpoint: str, **kwargs: Any) -> RateLimiter:
+    """Create (or replace) the shared limiter of an endpoint."""
+    with _limiters_lock:
+        _limiters[endpoint] = RateLimiter(**kwargs)
+        return _limiters[endpoint]
+
+
+def get_rate_limiter(endpoint: str) -> RateLimiter:
+    """Return the limiter shared by all fetchers calling ``endpoint``."""
+    with _limiters_lock:
+        if endpoint not in _limiters:
+            _limiters[endpoint] = RateLimiter()
+        return _limiters[endpoint]
@@ -0,0 +1,67 @@
+"""Typed per-source host records decoded straight from page bytes."""
+
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+# Record type of each source, empty when msgspec is not installed
+RECORD_TYPES: Dict[str, Type[Any]] = {}
+
+# Vendors send ids as numbers or strings; either decodes, as in a plain dict
+VendorId = Union[int, str]
+
+if msgspec is not None:
+
+    class HostRecord(msgspec.Struct, gc=False, omit_defaults=True):
+        """
+        Base record with read-only mapping access for dict-based consumers.
+        Unset fields are left out when encoded, matching ``__contains__``.
+        """
+
+        source: Optional[str] = None
+
+        def get(self, key: str, default: Any = None) -> Any:
+            return getattr(self, key, default)
+
+        def __getitem__(self, key: str) -> Any:
+            try:
+                return getattr(self, key)
+            except AttributeError as e:
+                raise KeyError(key) from e
+
+        def __contains__(self, key: str) -> bool:
+            return getattr(self, key, None) is not None
+
+        def to_dict(self) -> Dict[str, Any]:
+            return msgspec.structs.asdict(self)
+
+    class QualysHost(HostRecord, gc=False):
+        """Fields of a Qualys host used by the pipeline."""
+
+        id: Optional[VendorId] = None
+        name: Optional[str] = None
+        address: Optional[str] = None
+        os: Optional[str] = None
+        modified: Optional[str] = None
+
+    class CrowdstrikeHost(HostRecord, gc=False):
+        """Fields of a Crowdstrike host used by the pipeline."""
+
+        device_id: Optional[VendorId] = None
+        hostname: Optional[str] = None
+        local_ip: Optional[str] = None
+        platform_id: Optional[VendorId] = None
+        platform_name: Optional[str] = None
+        last_seen: Optional[str] = None
+
+    RECORD_TYPES.update({"qualys": QualysHost, "crowdstrike": CrowdstrikeHost})
+
+
+def to_builtins(record: Any) -> Any:
+    """Convert a typed record to a plain dict (``json.dumps`` default hook)."""
+    if hasattr(record, "to_dict"):
+        return record.to_dict()
+    raise TypeError(f"Object of type {type(record).__name__} is not JSON serializable")
@@ -0,0 +1,78 @@
+"""Retry policy and circuit breaker for API requests."""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: throttling and transient gateway errors
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised when requests to a source are refused by its circuit breaker."""
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retry number ``attempt`` (starting at 1)."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Stops calling a source after repeated failures until it cools down.
+    Once the timeout expired, one probe request is let through (half-open);
+    its outcome closes the circuit or re-arms the timeout.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self.failures >= self.failure_threshold
+
+    def allow(self) -> bool:
+        """
+        Return True if a request may be sent. An open circuit allows a single
+        probe after the timeout, until its success or failure is recorded.
+        """
+        with self._lock:
+            if not self.is_open:
+                return True
+            if self.probing or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self.probing = False
+            if self.is_open:
+                # Also re-arms the timeout after a failed half-open probe
+                self.opened_at = time.monotonic()
@@ -0,0 +1,129 @@
+"""Incremental parsing of JSON array bodies read as a stream of chunks."""
+
+import codecs
+import json
+import zlib
+from typing import Any, Iterable, Iterator
+
+GZIP_MAGIC = b"\x1f\x8b"
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+def gunzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress a stream of gzip chunks, including multi-member files."""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        while chunk:
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+            chunk = decompressor.unused_data
+            if decompressor.eof:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            elif chunk:
+                break
+    tail = decompressor.flush()
+    if tail:
+        yield tail
+
+
+def maybe_gunzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress the stream if it starts with the gzip magic number."""
+    iterator = iter(chunks)
+    head = b""
+    for chunk in iterator:
+        head += chunk
+        if len(head) >= len(GZIP_MAGIC):
+            break
+    if head.startswith(GZIP_MAGIC):
+        yield from gunzip_chunks(_prepend(head, iterator))
+    else:
+        yield from _prepend(head, iterator)
+
+
+def _prepend(head: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    if head:
+        yield head
+    yield from chunks
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array as soon as each is complete.
+    Only the element being parsed and the current chunk are held in memory.
+    Args:
+        chunks: Raw UTF-8 body chunks.
+    Returns:
+        Iterator over the decoded array elements.
+    Raises:
+        ValueError: If the body is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    iterator = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+    started = False
+
+    def fill() -> bool:
+        """Append the next chunk to the buffer, dropping consumed text."""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = next(iterator, None)
+        if chunk is None:
+            eof = True
+            buffer = buffer[pos:] + text.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + text.decode(chunk)
+        pos = 0
+        return True
+
+    def skip_whitespace() -> str:
+        """Return the next significant character, reading more data as needed."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                return ""
+
+    def delimited(end: int) -> bool:
+        """Tell whether a ``,`` or ``]`` follows position ``end`` in the buffer."""
+        while end < len(buffer) and buffer[end] in _WHITESPACE:
+            end += 1
+        return end < len(buffer) and buffer[end] in ",]"
+
+    if skip_whitespace() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    while True:
+        char = skip_whitespace()
+        if char == "]":
+            return
+        if started:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at {char!r}")
+            pos += 1
+            skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if fill():
+                    continue
+                raise
+            # A number may continue in the next chunk (``1`` of ``1.5e10``),
+            # so it is only accepted once a delimiter follows it
+            if type(value) in (int, float) and not delimited(end) and fill():
+                continue
+            break
+        pos = end
+        started = True
+        yield value
@@ -0,0 +1,100 @@
+"""Pooled HTTP transport shared by all fetchers."""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = 30
+
+
+class HttpTransport:
+    """Keep-alive HTTP session with per-host connection pools."""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Create a transport backed by a single ``requests.Session``.
+        Args:
+            pool_connections: Number of per-host pools to keep.
+            pool_maxsize: Maximum number of kept-alive connections per host.
+            timeout: Default request timeout in seconds.
+            headers: Headers sent with every request of the session.
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a POST request with an empty body through the pooled session."""
+        with self._lock:
+            self._requests += 1
+        return self.session.post(
+            url,
+            params=params,
+            headers=headers,
+            data="",
+            timeout=timeout or self.timeout,
+            **kwargs,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return connection reuse statistics.
+        Returns:
+            Dict with the number of requests sent, connections opened and
+            requests served over an already open connection.
+        """
+        pools = self._adapter.poolmanager.pools
+        connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+        return {
+            "requests": self._requests,
+            "connections_opened": connections,
+            "connections_reused": max(0, self._requests - connections),
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_default_transport: Optional[HttpTransport] = None  # pylint: disable=invalid-name
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """Return the process-wide transport shared by fetchers."""
+    global _default_transport  # pylint: disable=global-statement
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
@@ -2,12 +2,24 @@
 """Main ETL pipeline for processing host data from multiple sources."""
 
 import logging
+import os
 import time
+from typing import List, Optional
 from dotenv import load_dotenv
+from fetchers.base import BaseFetcher
+from fetchers.cache import PageCache
+from fetchers.checkpoint import FileCheckpointStore
+from fetchers.hedging import HedgePolicy
 from fetchers.qualys import QualysFetcher
 from fetchers.crowdstrike import CrowdstrikeFetcher
+from processors.columnar import ColumnarTransformer
 from processors.normalize import HostNormalizer
 from processors.deduplicate import DeduplicationProcessor
+from processors.entity_resolution import EntityResolver
+from processors.external_dedup import ExternalDeduplicationProcessor
+from processors.merge import MergingDeduplicationProcessor
+from processors.multi_key_dedup import MultiKeyDeduplicationProcessor
+from storage.bloom import DEFAULT_CAPACITY, DEFAULT_ERROR_RATE, KnownHostFilter
 from storage.mongo import MongoStorage
 from visualizations.charts import ChartsVisualizer
 from pipeline.host_processing_pipeline import HostProcessingPipeline
@@ -27,6 +39,50 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+def _hedge_policy(percentile: Optional[str]) -> Optional[HedgePolicy]:
+    """Build a per-fetcher hedge policy when hedging is enabled."""
+    return HedgePolicy(percentile=float(percentile)) if percentile else None
+
+
+def _deduplicator(memory_budget: Optional[str]) -> DeduplicationProcessor:
+    """Build the multi-key, merging, out-of-core or sharded deduplicator configured."""
+    if os.getenv("DEDUP_MULTI_KEY", "").lower() in ("1", "true"):
+        return MultiKeyDeduplicationProcessor()
+    if os.getenv("DEDUP_MERGE", "").lower() in ("1", "true"):
+        return MergingDeduplicationProcessor()
+    if not memory_budget:
+        return DeduplicationProcessor(workers=int(os.getenv("DEDUP_WORKERS", "1")))
+    return ExternalDeduplicationProcessor(
+        memory_budget=int(memory_budget), spill_dir=os.getenv("DEDUP_SPILL_DIR")
+    )
+
+
+def _transformer(
+    engine: str, normalizer: HostNormalizer
+) -> Optional[ColumnarTransformer]:
+    """Build the columnar engine, with the mappings of the normalizer, if selected."""
+    if engine == "python":
+        return None
+    if engine != "columnar":
+        raise ValueError(f"Unknown transform engine: {engine}")
+    return ColumnarTransformer(**normalizer.options())
+
+
+def _storage(known_hosts_path: Optional[str]) -> MongoStorage:
+    """Build the storage, with a known host filter when a filter file is set."""
+    if not known_hosts_path:
+        return MongoStorage()
+    known_hosts = KnownHostFilter(
+        known_hosts_path,
+        capacity=int(os.getenv("KNOWN_HOSTS_CAPACITY", str(DEFAULT_CAPACITY))),
+        error_rate=float(os.getenv("KNOWN_HOSTS_ERROR_RATE", str(DEFAULT_ERROR_RATE))),
+    )
+    storage = MongoStorage(known_hosts=known_hosts)
+    if os.getenv("KNOWN_HOSTS_REBUILD", "").lower() in ("1", "true"):
+        storage.rebuild_known_hosts()
+    return storage
+
+
 def main() -> None:
     """Main ETL pipeline execution."""
     start_time = time.time()
@@ -35,10 +91,29 @@ def main() -> None:
     try:
         # Initialize components
         logger.info("🔧 Initializing pipeline components")
-        fetchers = [QualysFetcher(), CrowdstrikeFetcher()]
-        normalizer = HostNormalizer()
-        deduplicator = DeduplicationProcessor()
-        storage = MongoStorage()
+        checkpoints = FileCheckpointStore(
+            os.getenv("CHECKPOINT_DIR", "checkpoints"),
+            max_age=float(os.getenv("CHECKPOINT_MAX_AGE", "86400")),
+        )
+        cache_dir = os.getenv("PAGE_CACHE_DIR")
+        page_cache = (
+            PageCache(cache_dir, ttl=float(os.getenv("PAGE_CACHE_TTL", "3600")))
+            if cache_dir
+            else None
+        )
+        hedge_percentile = os.getenv("HEDGE_PERCENTILE")
+        fetcher_options = {"checkpoint_store": checkpoints, "page_cache": page_cache}
+        fetchers: List[BaseFetcher] = [
+            QualysFetcher(
+                hedge_policy=_hedge_policy(hedge_percentile), **fetcher_options
+            ),
+            CrowdstrikeFetcher(
+                hedge_policy=_hedge_policy(hedge_percentile), **fetcher_options
+            ),
+        ]
+        normalizer = HostNormalizer(workers=int(os.getenv("NORMALIZE_WORKERS", "1")))
+        deduplicator = _deduplicator(os.getenv("DEDUP_MEMORY_BUDGET"))
+        storage = _storage(os.getenv("KNOWN_HOSTS_FILTER"))
         visualizer = ChartsVisualizer()
 
         # Create and run pipeline
@@ -49,6 +124,15 @@ def main() -> None:
             deduplicator=deduplicator,
             storage=storage,
             visualizer=visualizer,
+            streaming=os.getenv("PIPELINE_STREAMING", "").lower() in ("1", "true"),
+            transformer=_transformer(
+                os.getenv("TRANSFORM_ENGINE", "python"), normalizer
+            ),
+            resolver=(
+                EntityResolver()
+                if os.getenv("ENTITY_RESOLUTION", "").lower() in ("1", "true")
+                else None
+            ),
         )
         pipeline = HostProcessingPipeline(config)
 
@@ -56,6 +140,10 @@ def main() -> None:
         logger.info("▶️ Executing Host Processing Pipeline")
         pipeline.run()
 
+        # Completed sources cleared their checkpoints, drop stale ones left
+        # by sources that failed or are no longer fetched
+        checkpoints.expire()
+
         # Calculate execution time
         execution_time = time.time() - start_time
 
@@ -1,14 +1,16 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from fetchers.base import BaseFetcher
+from processors.columnar import ColumnarTransformer
 from processors.normalize import HostNormalizer
 from processors.deduplicate import DeduplicationProcessor
+from processors.entity_resolution import EntityResolver
 from storage.mongo import MongoStorage
 from visualizations.charts import ChartsVisualizer
 
 
 @dataclass
-class PipelineConfig:
+class PipelineConfig:  # pylint: disable=too-many-instance-attributes
     """Configuration class for HostProcessingPipeline components."""
 
     fetchers: List[BaseFetcher]
@@ -16,3 +18,33 @@ class PipelineConfig:
     deduplicator: DeduplicationProcessor
     storage: MongoStorage
     visualizer: ChartsVisualizer
+    extract_concurrency: int = 2
+    streaming: bool = False
+    # Optional Polars engine replacing normalizer and deduplicator, batch mode only
+    transformer: Optional[ColumnarTransformer] = None
+    # Optional fuzzy merge of near-duplicate hosts, batch mode only
+    resolver: Optional[EntityResolver] = None
+
+    def __post_init__(self) -> None:
+        """
+        Check that the columnar engine computes what the normalizer and
+        deduplicator it replaces would.
+        Raises:
+            ValueError: If the transformer and the processors disagree.
+        """
+        if self.transformer is None:
+            return
+        if self.transformer.options() != self.normalizer.options():
+            raise ValueError(
+                "The columnar transformer must use the mappings of the normalizer"
+            )
+        if (
+            type(self.deduplicator)  # pylint: disable=unidiomatic-typecheck
+            is not DeduplicationProcessor
+            or self.deduplicator.workers != 1
+        ):
+            raise ValueError(
+                "The columnar transformer only keeps the first host of each key, "
+                f"it cannot replace {type(self.deduplicator).__name__} "
+                f"with {self.deduplicator.workers} workers"
+            )
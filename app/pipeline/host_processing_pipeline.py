@@ -1,11 +1,26 @@
 import logging
-from typing import List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator, List, Dict, Any, Optional
+from fetchers.base import BaseFetcher
 from pipeline.config import PipelineConfig
 
 logger = logging.getLogger(__name__)
 
 
-class HostProcessingPipeline:
+@dataclass
+class ExtractResult:
+    """Outcome of extracting hosts from a single source."""
+
+    source: str
+    hosts: List[Dict[str, Any]] = field(default_factory=list)
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+class HostProcessingPipeline:  # pylint: disable=too-many-instance-attributes
     """ETL pipeline for processing and deduplicating host data from multiple sources."""
 
     def __init__(self, config: PipelineConfig) -> None:
@@ -15,11 +30,20 @@ class HostProcessingPipeline:
         self.deduplicator = config.deduplicator
         self.storage = config.storage
         self.visualizer = config.visualizer
+        self.extract_concurrency = config.extract_concurrency
+        self.streaming = config.streaming
+        self.transformer = config.transformer
+        self.resolver = config.resolver
+        self.extract_results: List[ExtractResult] = []
 
     def run(self) -> None:
         """Execute the complete ETL pipeline with deduplication."""
         logger.info("🔄 Starting Host Processing Pipeline")
 
+        if self.streaming:
+            self._run_streaming()
+            return
+
         # Extract
         logger.info("[📥 EXTRACT]: Fetching data from all sources")
         all_hosts = self._extract()
@@ -40,23 +64,129 @@ class HostProcessingPipeline:
         self._visualize(unique_hosts)
         logger.info("[📊 VISUALIZE]: Completed - Charts generated")
 
-    def _extract(self) -> List[Dict[str, Any]]:
-        """Extract data from all sources."""
-        all_hosts = []
+    def _run_streaming(self) -> None:
+        """Execute the pipeline with hosts flowing one by one through all stages."""
+        logger.info("[🌊 STREAM]: Extracting, transforming and loading hosts")
+        if self.resolver is not None:
+            logger.warning("⚠️ Entity resolution needs whole batches, skipped")
+        if self.transformer is not None:
+            logger.warning("⚠️ The columnar engine needs whole batches, skipped")
+        stored = self.storage.save_iter(self._transform_stream(self._extract_stream()))
+        logger.info("[🌊 STREAM]: Completed - %d unique hosts stored", stored)
+
+        logger.info("[📊 VISUALIZE]: Generating charts and statistics")
+        self._visualize([])
+        logger.info("[📊 VISUALIZE]: Completed - Charts generated")
+
+    def _extract_stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield hosts from each source in turn, without collecting them.
+        A failing source is logged and skipped, keeping the hosts it already
+        yielded; the error is only raised when every source failed.
+        """
+        self.extract_results = []
         for fetcher in self.fetchers:
-            logger.info("📡 Fetching data from %s", fetcher)
-            hosts = fetcher.fetch()
-            all_hosts.extend(hosts)
-            logger.debug("📡 Fetched %d hosts from %s", len(hosts), fetcher)
+            logger.info("📡 Streaming data from %s", fetcher)
+            result = ExtractResult(str(fetcher))
+            count = 0
+            start = time.perf_counter()
+            try:
+                hosts = (
+                    fetcher.iter_hosts()
+                    if isinstance(fetcher, BaseFetcher)
+                    else fetcher.fetch()
+                )
+                for host in hosts:
+                    count += 1
+                    yield host
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("❌ Failed to fetch data from %s: %s", fetcher, e)
+                result.error = e
+            result.duration = time.perf_counter() - start
+            if isinstance(fetcher, BaseFetcher):
+                result.stats = fetcher.stats.as_dict()
+            self.extract_results.append(result)
+            logger.info(
+                "⏱️ %s: %d hosts in %.2fs%s %s",
+                result.source,
+                count,
+                result.duration,
+                " (failed)" if result.error is not None else "",
+                result.stats,
+            )
+
+        errors = [r.error for r in self.extract_results if r.error is not None]
+        if errors and len(errors) == len(self.extract_results):
+            raise errors[0]
+
+    def _transform_stream(
+        self, hosts: Iterator[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Normalize and deduplicate a stream of hosts lazily."""
+        return self.deduplicator.iter_process(self.normalizer.iter_process(hosts))
+
+    def _extract(self) -> List[Dict[str, Any]]:
+        """
+        Extract data from all sources in parallel.
+        A failing source is logged and skipped so the other sources keep their
+        results; the error is only raised when every source failed.
+        """
+        workers = max(1, min(self.extract_concurrency, len(self.fetchers)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            self.extract_results = list(
+                executor.map(self._extract_source, self.fetchers)
+            )
+
+        all_hosts: List[Dict[str, Any]] = []
+        for result in self.extract_results:
+            if result.error is None:
+                all_hosts.extend(result.hosts)
+            logger.info(
+                "⏱️ %s: %d hosts in %.2fs%s %s",
+                result.source,
+                len(result.hosts),
+                result.duration,
+                " (failed)" if result.error is not None else "",
+                result.stats,
+            )
+
+        errors = [r.error for r in self.extract_results if r.error is not None]
+        if errors and len(errors) == len(self.extract_results):
+            raise errors[0]
         return all_hosts
 
+    def _extract_source(self, fetcher: BaseFetcher) -> ExtractResult:
+        """Extract data from a single source, capturing timing and errors."""
+        logger.info("📡 Fetching data from %s", fetcher)
+        start = time.perf_counter()
+        result = ExtractResult(str(fetcher))
+        try:
+            result.hosts = fetcher.fetch()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("❌ Failed to fetch data from %s: %s", fetcher, e)
+            result.error = e
+        else:
+            logger.debug("📡 Fetched %d hosts from %s", len(result.hosts), fetcher)
+        result.duration = time.perf_counter() - start
+        if isinstance(fetcher, BaseFetcher):
+            result.stats = fetcher.stats.as_dict()
+        return result
+
     def _transform(self, hosts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Transform and deduplicate hosts."""
-        logger.info("🧹 Normalizing host data")
-        normalized_hosts = self.normalizer.process(hosts)
+        if self.transformer is not None:
+            logger.info("🧮 Normalizing and deduplicating hosts as columns")
+            unique_hosts = self.transformer.process(hosts)
+        else:
+            logger.info("🧹 Normalizing host data")
+            normalized_hosts = self.normalizer.process(hosts)
+
+            logger.info("🧠 Deduplicating hosts")
+            unique_hosts = self.deduplicator.process(normalized_hosts)
 
-        logger.info("🧠 Deduplicating hosts")
-        unique_hosts = self.deduplicator.process(normalized_hosts)
+        if self.resolver is not None:
+            logger.info("🧩 Merging near-duplicate hosts")
+            unique_hosts = self.resolver.process(unique_hosts)
         return unique_hosts
 
     def _load(self, hosts: List[Dict[str, Any]]) -> None:
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Iterable, Iterator, List, Dict, Any
 
 
 class BaseProcessor(ABC):
     @abstractmethod
     def process(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process data and return processed data"""
+
+    def iter_process(self, data: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """Process an iterable lazily, yielding records as they are ready"""
+        yield from self.process(list(data))
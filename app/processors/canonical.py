@@ -0,0 +1,124 @@
+"""Canonical forms of host fields, computed once at normalization time."""
+
+import ipaddress
+import socket
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+# Substring of a lowercased OS name -> OS family, first match wins
+OS_FAMILIES: Dict[str, str] = {
+    "amazon linux": "Linux",
+    "linux": "Linux",
+    "windows": "Windows",
+    "mac": "macOS",
+    "darwin": "macOS",
+    "ubuntu": "Ubuntu",
+    "centos": "CentOS",
+    "red hat": "Red Hat",
+    "rhel": "Red Hat",
+}
+
+_TIMESTAMP_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d")
+
+
+def canonical_ip(value: Any) -> Union[IPAddress, str, None]:
+    """
+    Parse an IP address so that equivalent spellings compare equal.
+    Returns:
+        An ``ipaddress`` object, the stripped text if it is not a valid
+        address, or None for an empty value.
+    """
+    if value is None or isinstance(
+        value, (ipaddress.IPv4Address, ipaddress.IPv6Address)
+    ):
+        return value
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        # inet_pton is several times faster than ipaddress' own IPv4 parser
+        return ipaddress.IPv4Address(socket.inet_pton(socket.AF_INET, text))
+    except OSError:
+        pass
+    try:
+        return ipaddress.ip_address(text)
+    except ValueError:
+        return text.lower()
+
+
+def canonical_hostname(value: Any) -> Optional[str]:
+    """Lowercase a hostname and drop surrounding blanks and the FQDN root dot."""
+    if value is None:
+        return None
+    hostname = str(value).strip().rstrip(".").lower()
+    return hostname or None
+
+
+def canonical_id(value: Any) -> Optional[str]:
+    """Return a vendor host id as stripped text, None if empty."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp into an aware UTC datetime.
+    Naive timestamps are taken as UTC. Unparsable values give None.
+    """
+    if value is None or value == "":
+        return None
+    parsed: Optional[datetime]
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = str(value).strip()
+        if text.endswith(("Z", "z")):
+            text = text[:-1] + "+00:00"
+        try:
+            parsed = datetime.fromisoformat(text)
+            if parsed.tzinfo is None:
+                # Re-parsing with an offset is cheaper than replace(tzinfo=...)
+                parsed = datetime.fromisoformat(text + "+00:00")
+        except ValueError:
+            parsed = _parse_fallback(text)
+            if parsed is None:
+                return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    if parsed.tzinfo is timezone.utc:
+        return parsed
+    return parsed.astimezone(timezone.utc)
+
+
+def _parse_fallback(text: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _os_family(name: str) -> str:
+    name = name.lower()
+    for key, family in OS_FAMILIES.items():
+        if key in name:
+            return family
+    return "Other"
+
+
+def os_family(value: Any) -> str:
+    """Map an OS name to its family, "Unknown" if empty and "Other" if unmapped."""
+    if not value:
+        return "Unknown"
+    return _os_family(str(value))
@@ -0,0 +1,264 @@
+"""Columnar transform engine normalizing and deduplicating hosts with Polars."""
+
+import io
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from processors.canonical import OS_FAMILIES, canonical_ip, parse_timestamp
+from processors.normalize import DEFAULT_SOURCE, SOURCE_MAPPINGS, SOURCE_MARKERS
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_OCTET = r"(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+_IPV4 = rf"^{_OCTET}(\.{_OCTET}){{3}}$"
+
+
+def _present(field: str) -> str:
+    """Return the name of the column telling whether records have a field key."""
+    return f"_has_{field}"
+
+
+class ColumnarTransformer:
+    """
+    Vectorized equivalent of HostNormalizer followed by DeduplicationProcessor.
+    Hosts are loaded into a Polars frame restricted to the mapped fields, and
+    field renames, source detection and the dedup key are column expressions.
+    Canonical IP addresses are kept as their text form, an Arrow-native type.
+    """
+
+    def __init__(
+        self,
+        mappings: Optional[Mapping[str, Mapping[str, str]]] = None,
+        markers: Optional[Mapping[str, Sequence[str]]] = None,
+        default_source: str = DEFAULT_SOURCE,
+        canonical: bool = True,
+    ) -> None:
+        """
+        Args:
+            mappings: Field mapping of each source, defaults to SOURCE_MAPPINGS.
+            markers: Fields detecting the source of records that do not name
+                it, defaults to SOURCE_MARKERS.
+            default_source: Source of records matching no marker.
+            canonical: Canonicalize fields like HostNormalizer.
+        Raises:
+            ImportError: If polars is not installed.
+        """
+        if pl is None:
+            raise ImportError("The columnar transform engine requires polars")
+        self.mappings = SOURCE_MAPPINGS if mappings is None else mappings
+        self.markers = SOURCE_MARKERS if markers is None else markers
+        self.default_source = default_source
+        self.canonical = canonical
+
+        self.targets: List[str] = ["source"]
+        self.fields: List[str] = ["source"]
+        for mapping in self.mappings.values():
+            self.targets += [t for t in mapping if t not in self.targets]
+            self.fields += [f for f in mapping.values() if f not in self.fields]
+        for fields in self.markers.values():
+            self.fields += [f for f in fields if f not in self.fields]
+        self.schema = {field: pl.String for field in self.fields}
+
+    def options(self) -> Dict[str, Any]:
+        """Return the mapping options, comparable with HostNormalizer.options()."""
+        return {
+            "mappings": {s: dict(mapping) for s, mapping in self.mappings.items()},
+            "markers": {s: tuple(fields) for s, fields in self.markers.items()},
+            "default_source": self.default_source,
+            "canonical": self.canonical,
+        }
+
+    def from_records(self, hosts: Iterable[Any]) -> "pl.DataFrame":
+        """
+        Load raw host dicts or typed records into a frame of mapped fields.
+        A marker field set to null still detects its source in HostNormalizer,
+        so whether each record has the marker key is kept as a boolean column.
+        """
+        rows = [h if isinstance(h, dict) else h.to_dict() for h in hosts]
+        frame = pl.from_dicts(rows, schema=self.schema)
+        markers = {f for fields in self.markers.values() for f in fields}
+        return frame.with_columns(
+            pl.Series(_present(f), [f in row for row in rows], dtype=pl.Boolean)
+            for f in sorted(markers)
+        )
+
+    def from_pages(self, pages: Iterable[bytes], source: str) -> "pl.DataFrame":
+        """
+        Load raw JSON page bodies of a source straight into a frame.
+        Args:
+            pages: Page bodies, each a JSON array of hosts.
+            source: Source tag of every host.
+        Returns:
+            Frame of mapped fields with the source column set.
+        """
+        frames = []
+        for body in pages:
+            page = pl.read_json(io.BytesIO(body), infer_schema_length=None)
+            frames.append(
+                page.select(
+                    [
+                        (
+                            pl.col(field).cast(pl.String)
+                            if field in page.columns
+                            else pl.lit(None, pl.String).alias(field)
+                        )
+                        for field in self.fields
+                        if field != "source"
+                    ]
+                ).with_columns(pl.lit(source).alias("source"))
+            )
+        if not frames:
+            return pl.DataFrame(schema=self.schema)
+        return pl.concat(frames, how="vertical_relaxed").select(self.fields)
+
+    def normalize(self, frame: "pl.DataFrame") -> "pl.DataFrame":
+        """
+        Rename source fields to the unified host fields.
+        Records naming an unknown source are dropped, as in HostNormalizer.
+        Frames without the marker key columns of from_records detect sources
+        by non-null marker values instead.
+        """
+        detected = pl.lit(self.default_source)
+        for source, fields in reversed(list(self.markers.items())):
+            present = pl.any_horizontal(
+                [
+                    (
+                        pl.col(_present(f))
+                        if _present(f) in frame.columns
+                        else pl.col(f).is_not_null()
+                    )
+                    for f in fields
+                ]
+            )
+            detected = pl.when(present).then(pl.lit(source)).otherwise(detected)
+        kind = pl.coalesce(pl.col("source"), detected)
+
+        columns = [pl.col("source")]
+        for target in self.targets[1:]:
+            value = pl.lit(None, pl.String)
+            for source, mapping in self.mappings.items():
+                if target in mapping:
+                    value = (
+                        pl.when(kind == source)
+                        .then(pl.col(mapping[target]))
+                        .otherwise(value)
+                    )
+            columns.append(value.alias(target))
+
+        normalized = frame.filter(kind.is_in(list(self.mappings))).select(columns)
+        return self.canonicalize(normalized) if self.canonical else normalized
+
+    @staticmethod
+    def canonicalize(frame: "pl.DataFrame") -> "pl.DataFrame":
+        """
+        Canonicalize normalized columns like processors.canonical does.
+        Hostnames and OS families are column expressions; IPs and timestamps
+        the vectorized parsers miss are parsed once per distinct value.
+        """
+        hostname = (
+            pl.col("hostname").str.strip_chars().str.strip_chars_end(".")
+        ).str.to_lowercase()
+        os_name = pl.col("os").str.to_lowercase()
+        family = pl.lit("Other")
+        for key, name in reversed(list(OS_FAMILIES.items())):
+            family = (
+                pl.when(os_name.str.contains(key, literal=True))
+                .then(pl.lit(name))
+                .otherwise(family)
+            )
+        text = pl.col("last_seen").str.strip_chars()
+        seen = pl.coalesce(
+            text.str.to_datetime(
+                "%Y-%m-%dT%H:%M:%S%.f", strict=False, time_unit="us"
+            ).dt.replace_time_zone("UTC"),
+            text.str.replace(r"[Zz]$", "+00:00").str.to_datetime(
+                "%Y-%m-%dT%H:%M:%S%.f%z",
+                strict=False,
+                time_unit="us",
+                time_zone="UTC",
+            ),
+        )
+        if "source_id" in frame.columns:
+            source_id = pl.col("source_id").str.strip_chars()
+            frame = frame.with_columns(
+                pl.when(source_id != "").then(source_id).alias("source_id")
+            )
+        frame = frame.with_columns(
+            pl.when(hostname != "").then(hostname).alias("hostname"),
+            pl.when(pl.col("os").is_null() | (pl.col("os") == ""))
+            .then(pl.lit("Unknown"))
+            .otherwise(family)
+            .alias("os_family"),
+            seen.alias("_seen"),
+            pl.col("ip").str.strip_chars().str.contains(_IPV4).alias("_ipv4"),
+        )
+
+        # Dotted quads are already canonical, parse only the other values
+        others = frame.filter(~pl.col("_ipv4"))["ip"]
+        ips = {
+            value: None if ip is None else str(ip)
+            for value in others.drop_nulls().unique()
+            for ip in [canonical_ip(value)]
+        }
+        missed = frame.filter(pl.col("_seen").is_null())["last_seen"]
+        seen_fallback = {
+            value: parse_timestamp(value) for value in missed.drop_nulls().unique()
+        }
+        return frame.with_columns(
+            pl.when(pl.col("_ipv4"))
+            .then(pl.col("ip").str.strip_chars())
+            .otherwise(
+                pl.col("ip").replace_strict(ips, default=None, return_dtype=pl.String)
+            )
+            .alias("ip"),
+            pl.coalesce(
+                pl.col("_seen"),
+                pl.col("last_seen").replace_strict(
+                    seen_fallback,
+                    default=None,
+                    return_dtype=pl.Datetime("us", "UTC"),
+                ),
+            ).alias("last_seen"),
+        ).drop("_seen", "_ipv4")
+
+    @staticmethod
+    def deduplicate(frame: "pl.DataFrame") -> "pl.DataFrame":
+        """
+        Keep the first host of each (ip, hostname) / (ip,) / (hostname,) key.
+        Hosts with neither field are all kept. Unset key fields are null, so
+        an IP-only key never matches a hostname-only key.
+        """
+        has_ip = pl.col("ip").is_not_null() & (pl.col("ip") != "")
+        has_hostname = pl.col("hostname").is_not_null() & (pl.col("hostname") != "")
+        ip = pl.when(has_ip).then(pl.col("ip"))
+        hostname = pl.when(has_hostname).then(pl.col("hostname"))
+        unkeyed = ~has_ip & ~has_hostname
+        return frame.filter(
+            unkeyed
+            | pl.struct(ip.alias("ip"), hostname.alias("hostname")).is_first_distinct()
+        )
+
+    def transform(self, frame: "pl.DataFrame") -> "pl.DataFrame":
+        """Normalize and deduplicate a frame of raw hosts."""
+        unique = self.deduplicate(self.normalize(frame))
+        logger.info(
+            "✅ Columnar transform completed: %d -> %d unique hosts",
+            frame.height,
+            unique.height,
+        )
+        return unique
+
+    def process(self, data: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Normalize and deduplicate raw hosts, like the per-dict processors.
+        Args:
+            data: Raw host dicts or typed records.
+        Returns:
+            List of unique normalized host dicts, in input order.
+        """
+        return self.transform(self.from_records(data)).to_dicts()
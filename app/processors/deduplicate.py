@@ -1,15 +1,69 @@
 """Deduplication processor for host data."""
 
 import logging
-from typing import List, Dict, Any, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
+from fetchers.decoders import pack, unpack
 from processors.base import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Hosts inherited by forked parallel deduplication workers
+_shared_hosts: List[Dict[str, Any]] = []  # pylint: disable=invalid-name
+
+# Swaps the bytes of a keep mask (1 = kept host) to mark the dropped hosts
+_INVERT_MASK = bytes.maketrans(b"\0\1", b"\1\0")
+
+
+def dedup_key(host: Dict[str, Any]) -> Optional[tuple[Any, ...]]:
+    """
+    Return the deduplication key of a host.
+    Returns:
+        (ip, hostname), (ip,) or (hostname,) depending on the fields set, or
+        None for a host with neither.
+    """
+    return _key(host.get("ip"), host.get("hostname"))
+
+
+def _key(ip: Any, hostname: Any) -> Optional[tuple[Any, ...]]:
+    if ip and hostname:
+        return (ip, hostname)
+    if ip:
+        return (ip,)
+    if hostname:
+        return (hostname,)
+    return None
+
+
+def log_completed(total: int, unique: int) -> None:
+    """Log the host counts of a finished deduplication."""
+    logger.info(
+        "✅ Deduplication completed: %d -> %d unique hosts (%d duplicates removed)",
+        total,
+        unique,
+        total - unique,
+    )
+
 
 class DeduplicationProcessor(BaseProcessor):
     """Processor for deduplicating host data based on (ip, hostname)."""
 
+    def __init__(
+        self, *, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """
+        Args:
+            workers: Worker processes used by process() for inputs larger
+                than one chunk; 1 deduplicates in the calling process.
+            chunk_size: Records per chunk sent to a worker.
+        """
+        self.workers = workers
+        self.chunk_size = chunk_size
+
     def process(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Deduplicate hosts based on (ip, hostname) and return unique hosts.
@@ -24,46 +78,210 @@ class DeduplicationProcessor(BaseProcessor):
 
         logger.info("🧠 Starting deduplication of %d hosts", len(data))
 
+        # Listing every duplicate key is costly, only done for debug logs
+        duplicates: Optional[list] = [] if logger.isEnabledFor(logging.DEBUG) else None
+        if self.workers > 1:
+            unique_hosts = self.process_parallel(data, duplicates=duplicates)
+        else:
+            unique_hosts = list(self._deduplicate(data, duplicates))
+        if duplicates:
+            logger.debug("🔑 Duplicate keys: %s", duplicates)
+
+        return unique_hosts
+
+    def process_parallel(
+        self,
+        data: List[Dict[str, Any]],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        duplicates: Optional[list] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Deduplicate hosts in a process pool, sharded by a hash of the key.
+        Forked workers read the hosts inherited from this process, so only
+        positions and masks travel between processes. Each worker first
+        deduplicates a contiguous slice and shards the positions of its first
+        hosts of each key; each shard is then deduplicated across slices in
+        input order; last, each slice gets a keep mask of one byte per host,
+        which this process only concatenates.
+        Inputs of one chunk or less, a single worker, or platforms without
+        fork are deduplicated in process.
+        The pool is forked although fetcher threads may still run: workers
+        only run the pure functions below, which take no locks and do no
+        logging or I/O, so they cannot wait on a lock held by another thread.
+        Args:
+            data: List of host dictionaries.
+            workers: Number of worker processes and shards, defaults to
+                ``self.workers``.
+            chunk_size: Records per slice, defaults to ``self.chunk_size``.
+            duplicates: List the duplicate keys are appended to, in input order.
+        Returns:
+            List of unique hosts, in input order.
+        """
+        workers = max(1, workers or self.workers)
+        chunk_size = chunk_size or self.chunk_size
+        if workers == 1 or len(data) <= chunk_size:
+            return list(self._deduplicate(data, duplicates))
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("⚠️ Parallel deduplication needs fork, running in process")
+            return list(self._deduplicate(data, duplicates))
+
+        keep, unkeyed = _keep_mask(data, workers, chunk_size)
+        for seq in unkeyed:
+            logger.warning("⚠️ Host without IP and hostname: %s", data[seq])
+        if duplicates is not None:
+            dropped_hosts = compress(data, keep.translate(_INVERT_MASK))
+            duplicates.extend(dedup_key(host) for host in dropped_hosts)
+        unique_hosts = list(compress(data, keep))
+        log_completed(len(data), len(unique_hosts))
+        return unique_hosts
+
+    def iter_process(self, data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Deduplicate hosts lazily, yielding each host the first time it is seen.
+        Only the keys seen so far are kept in memory.
+        Args:
+            data: Iterable of host dictionaries.
+        Returns:
+            Iterator over unique hosts, in input order.
+        """
+        yield from self._deduplicate(data, None)
+
+    def _deduplicate(
+        self, data: Iterable[Dict[str, Any]], duplicates: Optional[list]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield unique hosts, appending duplicate keys to ``duplicates``."""
         seen_keys: set[tuple[Any, ...]] = set()
-        unique_hosts: List[Dict[str, Any]] = []
-        duplicates_count = 0
-        duplicates: list = []
+        total = 0
+        unique = 0
 
         for host in data:
-            ip = host.get("ip")
-            hostname = host.get("hostname")
-            key: Optional[tuple[Any, ...]]
-            if ip and hostname:
-                key = (ip, hostname)
-            elif ip:
-                key = (ip,)
-            elif hostname:
-                key = (hostname,)
-            else:
-                key = None
-
+            total += 1
+            key = dedup_key(host)
             if key is not None and key not in seen_keys:
                 seen_keys.add(key)
-                unique_hosts.append(host)
+                unique += 1
+                yield host
             elif key is None:
                 logger.warning("⚠️ Host without IP and hostname: %s", host)
-                unique_hosts.append(host)
+                unique += 1
+                yield host
             else:
-                duplicates_count += 1
-                duplicates.append(key)
+                if duplicates is not None:
+                    duplicates.append(key)
                 logger.debug(
                     "🔄 Duplicate host found: %s (%s)",
                     host.get("hostname", "Unknown"),
-                    ip,
+                    host.get("ip"),
                 )
 
-        logger.info(
-            "✅ Deduplication completed: %d -> %d unique hosts (%d duplicates removed)",
-            len(data),
-            len(unique_hosts),
-            duplicates_count,
-        )
-        if duplicates:
-            logger.info("🔑 Duplicate keys: %s", duplicates)
+        log_completed(total, unique)
 
-        return unique_hosts
+
+def _keep_mask(
+    data: List[Dict[str, Any]], workers: int, chunk_size: int
+) -> Tuple[bytes, List[int]]:
+    """
+    Run the parallel deduplication rounds in a forked process pool.
+    Args:
+        data: List of host dictionaries, shared with the workers.
+        workers: Number of worker processes and shards.
+        chunk_size: Records per slice.
+    Returns:
+        Keep mask with one byte per host, and the positions of the hosts
+        without a key.
+    """
+    global _shared_hosts  # pylint: disable=global-statement
+    slices = [
+        (start, min(start + chunk_size, len(data)), workers)
+        for start in range(0, len(data), chunk_size)
+    ]
+    _shared_hosts = data
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            sharded = list(executor.map(_shard_slice, slices))
+            shards = ([s[1][i] for s in sharded] for i in range(workers))
+            found = list(executor.map(_find_duplicates, shards))
+            tasks = (
+                (start, mask, [dropped[i] for dropped in found])
+                for i, ((start, _, _), (mask, _, _)) in enumerate(zip(slices, sharded))
+            )
+            keep = b"".join(executor.map(_drop_duplicates, tasks))
+    finally:
+        _shared_hosts = []
+    return keep, [seq for _, _, unkeyed in sharded for seq in unpack(unkeyed)]
+
+
+def _shard_slice(task: Tuple[int, int, int]) -> Tuple[bytes, List[bytes], bytes]:
+    """
+    Deduplicate one slice of the shared hosts and split the positions of its
+    first host of each key into key shards (process pool worker).
+    Args:
+        task: Start and end position of the slice, and the number of shards.
+    Returns:
+        Keep mask of the slice without its duplicates within the slice, the
+        packed positions of each shard, and the packed positions of the
+        hosts without a key.
+    """
+    start, end, count = task
+    mask = bytearray(b"\1") * (end - start)
+    shards: List[List[int]] = [[] for _ in range(count)]
+    unkeyed = []
+    seen_keys: set[tuple[Any, ...]] = set()
+    hosts = _shared_hosts
+    for seq in range(start, end):
+        host = hosts[seq]
+        key = _key(host.get("ip"), host.get("hostname"))
+        if key is None:
+            unkeyed.append(seq)
+        elif key in seen_keys:
+            mask[seq - start] = 0
+        else:
+            seen_keys.add(key)
+            # Forked workers share the hash seed, so shards agree across slices
+            shards[hash(key) % count].append(seq)
+    return bytes(mask), [pack(shard) for shard in shards], pack(unkeyed)
+
+
+def _find_duplicates(payloads: List[bytes]) -> List[bytes]:
+    """
+    Find the duplicates of one shard across slices, given its positions in
+    each slice in input order (process pool worker).
+    Returns:
+        Packed positions of the duplicate hosts of each slice.
+    """
+    # Only hosts with a key are sharded
+    seen_keys: set = set()
+    found = []
+    hosts = _shared_hosts
+    for payload in payloads:
+        duplicates = []
+        for seq in unpack(payload):
+            host = hosts[seq]
+            key = _key(host.get("ip"), host.get("hostname"))
+            if key in seen_keys:
+                duplicates.append(seq)
+            else:
+                seen_keys.add(key)
+        found.append(pack(duplicates))
+    return found
+
+
+def _drop_duplicates(task: Tuple[int, bytes, List[bytes]]) -> bytes:
+    """
+    Clear the duplicates found in other slices from the keep mask of a slice
+    (process pool worker).
+    Args:
+        task: Start position and keep mask of the slice, and the packed
+            positions of its duplicates found by each shard.
+    Returns:
+        Keep mask of the slice.
+    """
+    start, keep, payloads = task
+    mask = bytearray(keep)
+    for payload in payloads:
+        for seq in unpack(payload):
+            mask[seq - start] = 0
+    return bytes(mask)
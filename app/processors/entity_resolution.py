@@ -0,0 +1,204 @@
+"""Fuzzy entity resolution of near-duplicate hosts."""
+
+import ipaddress
+import logging
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional
+
+from processors.base import BaseProcessor
+from processors.canonical import canonical_hostname, canonical_ip, os_family
+from processors.host import Host
+from processors.union_find import UnionFind
+
+logger = logging.getLogger(__name__)
+
+# Share of the match score of each field, when both hosts have it
+HOSTNAME_WEIGHT = 0.65
+IP_WEIGHT = 0.2
+OS_WEIGHT = 0.15
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_WINDOW = 5
+
+
+class Features(NamedTuple):
+    """Comparable fields of a host, extracted once."""
+
+    hostname: Optional[str]
+    stem: Optional[str]
+    ip: Any
+    network: Optional[int]
+    family: Optional[str]
+
+
+def features(host: Any) -> Features:
+    """Extract the fields compared by entity resolution from a host."""
+    hostname = canonical_hostname(host.get("hostname"))
+    ip = canonical_ip(host.get("ip"))
+    family = host.get("os_family") or os_family(host.get("os"))
+    return Features(
+        hostname,
+        hostname.split(".", 1)[0] if hostname else None,
+        ip,
+        int(ip) >> 8 if isinstance(ip, ipaddress.IPv4Address) else None,
+        None if family == "Unknown" else family,
+    )
+
+
+def overlap_ratio(first: str, second: str) -> float:
+    """
+    Return the share of characters of two strings in their common prefix
+    and suffix, in [0, 1]. Cheaper than difflib's ratio, and equal to it
+    for strings differing by a single edit such as ``web01`` and ``web-01``.
+    """
+    shortest = min(len(first), len(second))
+    prefix = 0
+    while prefix < shortest and first[prefix] == second[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and first[-1 - suffix] == second[-1 - suffix]:
+        suffix += 1
+    return 2 * (prefix + suffix) / (len(first) + len(second))
+
+
+def hostname_similarity(first: Features, second: Features) -> float:
+    """
+    Score two hostnames in [0, 1]: 1 if equal, 0.9 if only the domain
+    differs (``web01`` vs ``web01.corp.local``), otherwise the squared
+    overlap ratio of their first labels. Labels with different digits, such
+    as ``web1`` and ``web10``, name different hosts and score 0.
+    """
+    if first.hostname == second.hostname:
+        return 1.0
+    if first.stem == second.stem:
+        return 0.9
+    stem, other = first.stem or "", second.stem or ""
+    if _digits(stem) != _digits(other):
+        return 0.0
+    return overlap_ratio(stem, other) ** 2
+
+
+def _digits(text: str) -> str:
+    return "".join(filter(str.isdigit, text))
+
+
+def similarity(first: Features, second: Features) -> float:
+    """
+    Score two hosts in [0, 1], weighting only the fields both hosts have.
+    Hosts sharing neither a hostname nor an IP field score 0, and so do
+    hosts on different addresses outside one /24 network: generic hostnames
+    such as ``localhost`` or ``ubuntu`` name different hosts there.
+    """
+    score = 0.0
+    weight = 0.0
+    if first.hostname and second.hostname:
+        score += HOSTNAME_WEIGHT * hostname_similarity(first, second)
+        weight += HOSTNAME_WEIGHT
+    if first.ip is not None and second.ip is not None:
+        if first.ip == second.ip:
+            score += IP_WEIGHT
+        elif first.network is not None and first.network == second.network:
+            score += IP_WEIGHT / 2
+        else:
+            return 0.0
+        weight += IP_WEIGHT
+    if not weight:
+        return 0.0
+    if first.family and second.family:
+        score += OS_WEIGHT * (first.family == second.family)
+        weight += OS_WEIGHT
+    return score / weight
+
+
+def blocking_keys(host: Features) -> List[Hashable]:
+    """Return the blocks of a host: its hostname stem, IP, and /24 and OS family."""
+    keys: List[Hashable] = []
+    if host.stem:
+        keys.append(("stem", host.stem))
+    if host.ip is not None:
+        keys.append(("ip", host.ip))
+    if host.network is not None:
+        keys.append(("network", host.network, host.family))
+    return keys
+
+
+def merge_cluster(hosts: List[Any]) -> Any:
+    """Return a copy of the first host with its empty fields filled from the others."""
+    first = hosts[0]
+    merged = Host(*first.astuple()) if isinstance(first, Host) else dict(first)
+    for host in hosts[1:]:
+        for field in host:
+            if field in merged and not merged[field] and host[field]:
+                merged[field] = host[field]
+    return merged
+
+
+class EntityResolver(BaseProcessor):
+    """
+    Merges hosts the vendors report differently, such as ``web01`` and
+    ``web01.corp.local``, or one host on two DHCP addresses.
+    Hosts are only compared within blocks sharing a hostname stem, an IP, or
+    a /24 network and OS family. Within a block sorted by hostname, each
+    host is compared with its next ``window`` neighbours, so the work grows
+    linearly with the input. Matches are clustered transitively.
+    """
+
+    def __init__(
+        self, threshold: float = DEFAULT_THRESHOLD, window: int = DEFAULT_WINDOW
+    ) -> None:
+        """
+        Args:
+            threshold: Similarity score from which two hosts match.
+            window: Following hosts of a block each host is compared with.
+        """
+        self.threshold = threshold
+        self.window = window
+
+    def process(self, data: List[Any]) -> List[Any]:
+        """
+        Merge the clusters of matching hosts.
+        Args:
+            data: List of normalized hosts.
+        Returns:
+            One merged host per cluster, in order of first appearance.
+        """
+        if not data:
+            logger.info("📭 No data to resolve")
+            return []
+
+        logger.info("🧩 Resolving entities among %d hosts", len(data))
+        resolved = [merge_cluster([data[i] for i in c]) for c in self.clusters(data)]
+        logger.info(
+            "✅ Entity resolution completed: %d -> %d hosts (%d merged)",
+            len(data),
+            len(resolved),
+            len(data) - len(resolved),
+        )
+        return resolved
+
+    def clusters(self, data: List[Any]) -> List[List[int]]:
+        """
+        Cluster matching hosts.
+        Returns:
+            Lists of host positions, each sorted, ordered by first position.
+        """
+        hosts = [features(host) for host in data]
+        blocks: Dict[Hashable, List[int]] = {}
+        for i, host in enumerate(hosts):
+            for key in blocking_keys(host):
+                blocks.setdefault(key, []).append(i)
+
+        clusters = UnionFind(len(hosts))
+        compared = 0
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            members.sort(key=lambda i: (hosts[i].hostname or "", i))
+            for offset, i in enumerate(members):
+                for j in members[offset + 1 : offset + 1 + self.window]:
+                    if clusters.find(i) == clusters.find(j):
+                        continue
+                    compared += 1
+                    if similarity(hosts[i], hosts[j]) >= self.threshold:
+                        clusters.union(i, j)
+        logger.debug("🧩 Compared %d host pairs in %d blocks", compared, len(blocks))
+        return clusters.groups()
@@ -0,0 +1,174 @@
+"""Out-of-core deduplication spilling hash partitions to disk."""
+
+import heapq
+import logging
+import struct
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fetchers.decoders import pack, unpack
+from processors.deduplicate import DeduplicationProcessor, dedup_key, log_completed
+from processors.host import Host
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITIONS = 64
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+# Oversized partitions are split again with a new hash salt up to this depth
+MAX_SPLIT_DEPTH = 3
+
+_LENGTH = struct.Struct("<I")
+_BUFFER_SIZE = 64 * 1024
+
+# Spilled entry: (input position, is a Host record, fields or dict)
+Entry = Tuple[int, bool, Any]
+
+
+def _write_entry(file: BinaryIO, entry: Entry) -> None:
+    payload = pack(entry)
+    file.write(_LENGTH.pack(len(payload)))
+    file.write(payload)
+
+
+def _read_entries(path: Path) -> Iterator[Entry]:
+    with open(path, "rb", buffering=_BUFFER_SIZE) as file:
+        while header := file.read(_LENGTH.size):
+            (size,) = _LENGTH.unpack(header)
+            seq, is_host, fields = unpack(file.read(size))
+            yield seq, is_host, fields
+
+
+def _to_entry(seq: int, host: Any) -> Entry:
+    if isinstance(host, Host):
+        return seq, True, host.astuple()
+    return seq, False, host
+
+
+def _from_entry(entry: Entry) -> Any:
+    _, is_host, fields = entry
+    return Host(*fields) if is_host else fields
+
+
+class ExternalDeduplicationProcessor(DeduplicationProcessor):
+    """
+    Deduplicates inputs larger than memory, with the same result and order
+    as DeduplicationProcessor.
+    Hosts are spilled to hash partitions of their dedup key, so duplicates
+    always share a partition. Each partition is deduplicated on its own,
+    and the survivors are merged back in input order.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        partitions: int = DEFAULT_PARTITIONS,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            memory_budget: Largest partition file, in bytes, deduplicated in
+                memory; bigger partitions are split again.
+            partitions: Number of hash partitions per split.
+            spill_dir: Directory for the temporary spill files, defaults to
+                the system temporary directory.
+        """
+        super().__init__()
+        self.memory_budget = memory_budget
+        self.partitions = partitions
+        self.spill_dir = spill_dir
+
+    def _deduplicate(
+        self, data: Iterable[Dict[str, Any]], duplicates: Optional[list]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield unique hosts in input order, spilling partitions to disk."""
+        with tempfile.TemporaryDirectory(
+            prefix="dedup-", dir=self.spill_dir
+        ) as directory:
+            root = Path(directory)
+            entries = (_to_entry(seq, host) for seq, host in enumerate(data))
+            spilled, total = self._spill(entries, root / "p", 0)
+            logger.info(
+                "💽 Spilled %d hosts to %d partitions in %s",
+                total,
+                len(spilled),
+                root,
+            )
+
+            unique_files: List[Path] = []
+            for path in spilled:
+                unique_files += self._dedup_partition(path, 0, duplicates)
+
+            unique = 0
+            merged = heapq.merge(
+                *(_read_entries(path) for path in unique_files), key=lambda e: e[0]
+            )
+            for entry in merged:
+                unique += 1
+                yield _from_entry(entry)
+
+        log_completed(total, unique)
+
+    def _spill(
+        self, entries: Iterable[Entry], prefix: Path, depth: int
+    ) -> Tuple[List[Path], int]:
+        """
+        Write entries to hash partition files.
+        Returns:
+            The non-empty partition files and the number of entries written.
+        """
+        paths = [prefix.with_name(f"{prefix.name}-{i}") for i in range(self.partitions)]
+        used = [False] * self.partitions
+        total = 0
+        with ExitStack() as stack:
+            files = [
+                stack.enter_context(open(path, "wb", buffering=_BUFFER_SIZE))
+                for path in paths
+            ]
+            for entry in entries:
+                key = dedup_key(_from_entry(entry))
+                # Keyless hosts are all kept, spread them by input position
+                index = hash((depth, entry[0] if key is None else key))
+                index %= self.partitions
+                _write_entry(files[index], entry)
+                used[index] = True
+                total += 1
+        for path, is_used in zip(paths, used):
+            if not is_used:
+                path.unlink()
+        return [path for path, is_used in zip(paths, used) if is_used], total
+
+    def _dedup_partition(
+        self, path: Path, depth: int, duplicates: Optional[list]
+    ) -> List[Path]:
+        """
+        Deduplicate one partition, splitting it first if over the budget.
+        Returns:
+            Files of unique entries, each in input order.
+        """
+        if path.stat().st_size > self.memory_budget and depth < MAX_SPLIT_DEPTH:
+            spilled, _ = self._spill(_read_entries(path), path, depth + 1)
+            path.unlink()
+            unique_files: List[Path] = []
+            for sub_path in spilled:
+                unique_files += self._dedup_partition(sub_path, depth + 1, duplicates)
+            return unique_files
+
+        seen_keys: set[tuple[Any, ...]] = set()
+        unique_path = path.with_name(path.name + ".unique")
+        with open(unique_path, "wb", buffering=_BUFFER_SIZE) as file:
+            for entry in _read_entries(path):
+                host = _from_entry(entry)
+                key = dedup_key(host)
+                if key is None:
+                    logger.warning("⚠️ Host without IP and hostname: %s", host)
+                elif key in seen_keys:
+                    if duplicates is not None:
+                        duplicates.append(key)
+                    continue
+                else:
+                    seen_keys.add(key)
+                _write_entry(file, entry)
+        path.unlink()
+        return [unique_path]
@@ -0,0 +1,103 @@
+"""Compact normalized host record passed between pipeline stages."""
+
+from typing import Any, Dict, Iterator, Tuple
+
+
+class Host:  # pylint: disable=too-many-instance-attributes
+    """
+    Normalized host stored in slots instead of a per-instance dict.
+    Supports the read/write mapping operations used by the processors, so it
+    can stand in for the normalized host dicts.
+    """
+
+    __slots__ = (
+        "source",
+        "hostname",
+        "ip",
+        "os",
+        "last_seen",
+        "os_family",
+        "source_id",
+        "sources",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        source: Any = None,
+        hostname: Any = None,
+        ip: Any = None,
+        os: Any = None,
+        last_seen: Any = None,
+        os_family: Any = None,
+        source_id: Any = None,
+        sources: Any = None,
+    ) -> None:
+        self.source = source
+        self.hostname = hostname
+        self.ip = ip
+        self.os = os
+        self.last_seen = last_seen
+        self.os_family = os_family
+        self.source_id = source_id
+        self.sources = sources
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def astuple(self) -> Tuple[Any, ...]:
+        """Return the field values in slot order."""
+        return (
+            self.source,
+            self.hostname,
+            self.ip,
+            self.os,
+            self.last_seen,
+            self.os_family,
+            self.source_id,
+            self.sources,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self.__slots__, self.astuple()))
+
+    def to_document(self) -> Dict[str, Any]:
+        """Return the BSON-encodable document written to storage."""
+        document = self.to_dict()
+        if document["ip"] is not None and not isinstance(document["ip"], str):
+            document["ip"] = str(document["ip"])
+        if document["sources"] is None:
+            # Only set by merging deduplication, keep the stored list otherwise
+            del document["sources"]
+        return document
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Host):
+            return self.astuple() == other.astuple()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in zip(self.__slots__, self.astuple()))
+        return f"Host({fields})"
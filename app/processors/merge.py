@@ -0,0 +1,141 @@
+"""Deduplication merging the fields of duplicate hosts."""
+
+import logging
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from processors.deduplicate import DeduplicationProcessor, dedup_key, log_completed
+from processors.host import Host
+from processors.normalize import DERIVED_FIELDS
+
+logger = logging.getLogger(__name__)
+
+NEWEST = "newest"
+
+# Field -> NEWEST (largest value wins) or sources in order of precedence.
+# Other fields keep the first non-empty value.
+Precedence = Mapping[str, Union[str, Sequence[str]]]
+DEFAULT_PRECEDENCE: Dict[str, Union[str, Sequence[str]]] = {
+    "source": ("crowdstrike", "qualys"),
+    "source_id": ("crowdstrike", "qualys"),
+    "os": ("crowdstrike", "qualys"),
+    "last_seen": NEWEST,
+}
+
+# Rank of a value from a source missing from the precedence list
+_UNRANKED = 1 << 30
+
+
+class MergingDeduplicationProcessor(DeduplicationProcessor):
+    """
+    Combines duplicate hosts into one record instead of keeping the first.
+    Each field takes its value by a per-field precedence, so the merged
+    record does not depend on which source was fetched first, and a
+    ``sources`` field lists the sources of every merged host. Fields derived
+    at normalization (``os_family``) are derived again from the merged values.
+    """
+
+    def __init__(self, precedence: Optional[Precedence] = None) -> None:
+        """
+        Args:
+            precedence: Field -> "newest" or a sequence of sources, first
+                wins; defaults to DEFAULT_PRECEDENCE.
+        """
+        super().__init__()
+        precedence = DEFAULT_PRECEDENCE if precedence is None else precedence
+        self.newest = {f for f, rule in precedence.items() if rule == NEWEST}
+        self.ranks: Dict[str, Dict[Any, int]] = {
+            field: {source: rank for rank, source in enumerate(rule)}
+            for field, rule in precedence.items()
+            if rule != NEWEST
+        }
+
+    def iter_process(self, data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Merge duplicate hosts, yielding one record per key.
+        A later duplicate can change an earlier record, so the whole input is
+        read before the first record is yielded.
+        Args:
+            data: Iterable of host dictionaries.
+        Returns:
+            Iterator over merged hosts, in order of first appearance.
+        """
+        yield from self._deduplicate(data, None)
+
+    def _deduplicate(
+        self, data: Iterable[Dict[str, Any]], duplicates: Optional[list]
+    ) -> Iterator[Dict[str, Any]]:
+        """Merge hosts by key in one pass, appending duplicate keys."""
+        merged: List[Tuple[Any, Dict[str, int]]] = []
+        by_key: Dict[tuple, Tuple[Any, Dict[str, int]]] = {}
+        total = 0
+        for host in data:
+            total += 1
+            key = dedup_key(host)
+            state = None if key is None else by_key.get(key)
+            if state is None:
+                if key is None:
+                    logger.warning("⚠️ Host without IP and hostname: %s", host)
+                state = self._start(host)
+                merged.append(state)
+                if key is not None:
+                    by_key[key] = state
+            else:
+                if duplicates is not None:
+                    duplicates.append(key)
+                self._merge(state, host)
+
+        log_completed(total, len(merged))
+        for record, _ in merged:
+            for target, (origin, func) in DERIVED_FIELDS.items():
+                if record.get(target) is not None:
+                    record[target] = func(record.get(origin))
+            yield record
+
+    def _start(self, host: Any) -> Tuple[Any, Dict[str, int]]:
+        """Return a merge state: a copy of the host and its field ranks."""
+        record = Host(*host.astuple()) if isinstance(host, Host) else dict(host)
+        source = host.get("source")
+        record["sources"] = [source] if source else []
+        ranks = {
+            field: order.get(source, _UNRANKED)
+            for field, order in self.ranks.items()
+            if host.get(field)
+        }
+        return record, ranks
+
+    def _merge(self, state: Tuple[Any, Dict[str, int]], host: Any) -> None:
+        """Merge the fields of a duplicate host into a merge state."""
+        record, ranks = state
+        source = host.get("source")
+        if source and source not in record["sources"]:
+            record["sources"] = sorted([*record["sources"], source])
+        is_host = isinstance(record, Host)
+        for field in host:
+            value = host[field]
+            if not value or field == "sources" or (is_host and field not in record):
+                continue
+            current = record.get(field)
+            if field in self.newest:
+                try:
+                    if current is None or value > current:
+                        record[field] = value
+                except TypeError:
+                    logger.debug("🔄 Cannot compare %s values %r", field, value)
+            elif field in self.ranks:
+                rank = self.ranks[field].get(source, _UNRANKED)
+                if not current or rank < ranks.get(field, _UNRANKED):
+                    record[field] = value
+                    ranks[field] = rank
+            elif not current:
+                record[field] = value
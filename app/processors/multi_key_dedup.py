@@ -0,0 +1,86 @@
+"""Transitive deduplication over every identifier of a host."""
+
+import logging
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence
+
+from processors.deduplicate import DeduplicationProcessor, dedup_key, log_completed
+from processors.union_find import UnionFind
+
+logger = logging.getLogger(__name__)
+
+# Normalized fields identifying a host; vendor ids are scoped to their source
+DEFAULT_KEYS = ("ip", "hostname", "source_id")
+
+
+class MultiKeyDeduplicationProcessor(DeduplicationProcessor):
+    """
+    Merges hosts sharing any identifier, transitively: a host seen with only
+    an IP merges with the same IP seen with a hostname, which in turn merges
+    with a vendor record of that hostname. Records are clustered with a
+    union-find over an index of identifiers, in near-linear time, and the
+    first host of each cluster is kept.
+    """
+
+    def __init__(self, keys: Sequence[str] = DEFAULT_KEYS) -> None:
+        """
+        Args:
+            keys: Host fields indexed as identifiers. ``source_id`` values
+                only match ids of the same source.
+        """
+        super().__init__()
+        self.keys = tuple(keys)
+
+    def identifiers(self, host: Any) -> List[Hashable]:
+        """Return the identifiers of a host, tagged with their field."""
+        found: List[Hashable] = []
+        for field in self.keys:
+            value = host.get(field)
+            if value:
+                if field == "source_id":
+                    found.append((field, host.get("source"), value))
+                else:
+                    found.append((field, value))
+        return found
+
+    def clusters(self, hosts: List[Any]) -> List[List[int]]:
+        """
+        Cluster hosts sharing an identifier, directly or transitively.
+        Returns:
+            Lists of host positions, each sorted, ordered by first position.
+        """
+        clusters = UnionFind(len(hosts))
+        first_seen: Dict[Hashable, int] = {}
+        for i, host in enumerate(hosts):
+            identifiers = self.identifiers(host)
+            if not identifiers:
+                logger.warning("⚠️ Host without identifiers: %s", host)
+            for identifier in identifiers:
+                j = first_seen.setdefault(identifier, i)
+                if j != i:
+                    clusters.union(i, j)
+        return clusters.groups()
+
+    def iter_process(self, data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Deduplicate hosts, yielding the first host of each cluster.
+        A later host can join earlier clusters, so the whole input is read
+        before the first host is yielded.
+        Args:
+            data: Iterable of host dictionaries.
+        Returns:
+            Iterator over unique hosts, in input order.
+        """
+        yield from self._deduplicate(data, None)
+
+    def _deduplicate(
+        self, data: Iterable[Dict[str, Any]], duplicates: Optional[list]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the first host of each cluster, appending merged host keys."""
+        hosts = list(data)
+        groups = self.clusters(hosts)
+        if duplicates is not None:
+            for group in groups:
+                duplicates.extend(dedup_key(hosts[i]) for i in group[1:])
+        log_completed(len(hosts), len(groups))
+        for group in groups:
+            yield hosts[group[0]]
@@ -1,71 +1,352 @@
 """Host normalization processor."""
 
-from typing import List, Dict, Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from fetchers.decoders import pack, unpack
+from fetchers.records import RECORD_TYPES
 from processors.base import BaseProcessor
+from processors.host import Host
+from processors.canonical import (
+    canonical_hostname,
+    canonical_id,
+    canonical_ip,
+    os_family,
+    parse_timestamp,
+)
+
+# Normalized field -> source field, declared per source
+SOURCE_MAPPINGS: Dict[str, Dict[str, str]] = {
+    "qualys": {
+        "hostname": "name",
+        "ip": "address",
+        "os": "os",
+        "last_seen": "modified",
+        "source_id": "id",
+    },
+    "crowdstrike": {
+        "hostname": "hostname",
+        "ip": "local_ip",
+        "os": "platform_name",
+        "last_seen": "last_seen",
+        "source_id": "device_id",
+    },
+}
+
+# Fields identifying the source of a record that does not name it
+SOURCE_MARKERS: Dict[str, Sequence[str]] = {
+    "crowdstrike": ("platform_name", "platform_id"),
+}
+
+# Source assumed for records without a source or any marker field
+DEFAULT_SOURCE = "qualys"
+
+# Records per chunk sent to a worker process in parallel mode
+DEFAULT_CHUNK_SIZE = 50_000
+
+Extractor = Callable[[Any], Any]
+# Source field of an output field, or None if unreadable, and its conversion
+Column = Tuple[Optional[str], Optional[Extractor]]
+
+# Normalized field -> function giving its canonical form
+CANONICAL_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "hostname": canonical_hostname,
+    "ip": canonical_ip,
+    "last_seen": parse_timestamp,
+    "source_id": canonical_id,
+}
+
+# Field added by canonicalization -> (normalized field it derives from, function)
+DERIVED_FIELDS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "os_family": ("os", os_family),
+}
+
+
+def _reader(
+    fields: Sequence[str], record_type: Optional[Type[Any]]
+) -> Callable[[Any], Iterable[Any]]:
+    """Return a function reading the given fields of a record in one call."""
+    if record_type is None:
+        return lambda item: map(item.get, fields)
+    if len(fields) > 1:
+        return attrgetter(*fields)
+    return lambda item: [getattr(item, field) for field in fields]
+
+
+def _plan(
+    mapping: Mapping[str, str],
+    record_type: Optional[Type[Any]],
+    canonical: bool,
+) -> Tuple[bool, Tuple[str, ...], List[Column]]:
+    """
+    Plan the output fields of compile_mapping.
+    Returns:
+        Whether the output is a Host, the output field names, and the
+        (source field or None if unreadable, conversion) of each field.
+    """
+    declared = getattr(record_type, "__struct_fields__", ())
+    # Output field -> column, in mapping order
+    plan: Dict[str, Column] = {
+        target: (field if record_type is None or field in declared else None, None)
+        for target, field in {"source": "source", **mapping}.items()
+    }
+    if canonical:
+        for target, (origin, func) in DERIVED_FIELDS.items():
+            if origin in plan:
+                plan[target] = (plan[origin][0], func)
+        for target, func in CANONICAL_FIELDS.items():
+            if target in plan:
+                plan[target] = (plan[target][0], func)
+
+    is_host = set(plan) <= set(Host.__slots__)
+    if is_host:
+        # Host arguments in slot order, up to the last one set
+        last = max(Host.__slots__.index(name) for name in plan)
+        names: Tuple[str, ...] = Host.__slots__[: last + 1]
+    else:
+        names = tuple(plan)
+    columns = [plan.get(name, (None, None)) for name in names]
+    return is_host, names, columns
+
+
+def compile_mapping(
+    mapping: Mapping[str, str],
+    record_type: Optional[Type[Any]] = None,
+    canonical: bool = False,
+) -> Extractor:
+    """
+    Compile a field mapping into a function building a normalized host.
+    The source values are read in output order in one call (``attrgetter``
+    for typed records, ``get`` mapped over a dict), then only the fields
+    with a conversion or a constant value are replaced, from precomputed
+    (position, function) pairs, so each record costs no mapping lookups.
+    Args:
+        mapping: Normalized field name -> source field name.
+        record_type: Typed record class read by attribute access instead of
+            ``get``; fields it does not declare normalize to None.
+        canonical: Apply CANONICAL_FIELDS and add DERIVED_FIELDS.
+    Returns:
+        Callable taking a raw record and returning the normalized host.
+    """
+    is_host, names, columns = _plan(mapping, record_type, canonical)
+
+    # Unreadable fields read "source" as a placeholder, then take the
+    # constant value of None converted
+    read = _reader([field or "source" for field, _ in columns], record_type)
+    conversions = tuple(
+        (i, func) for i, (field, func) in enumerate(columns) if field and func
+    )
+    constants = tuple(
+        (i, func(None) if func else None)
+        for i, (field, func) in enumerate(columns)
+        if not field
+    )
+
+    def extract(item: Any) -> Any:
+        row = list(read(item))
+        for i, func in conversions:
+            row[i] = func(row[i])
+        for i, constant in constants:
+            row[i] = constant
+        return Host(*row) if is_host else dict(zip(names, row))
+
+    return extract
 
 
 class HostNormalizer(BaseProcessor):
     """Normalizes host data from different sources to unified format."""
 
+    def __init__(
+        self,
+        mappings: Optional[Mapping[str, Mapping[str, str]]] = None,
+        markers: Optional[Mapping[str, Sequence[str]]] = None,
+        default_source: str = DEFAULT_SOURCE,
+        *,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        canonical: bool = True,
+    ) -> None:
+        """
+        Args:
+            mappings: Field mapping of each source, defaults to SOURCE_MAPPINGS.
+            markers: Fields used to detect records of each source when the
+                record does not name its source, defaults to SOURCE_MARKERS.
+            default_source: Source of records matching no marker.
+            workers: Worker processes used by process() for inputs larger
+                than one chunk; 1 normalizes in the calling process.
+            chunk_size: Records per chunk sent to a worker.
+            canonical: Canonicalize fields (see processors.canonical): parsed
+                IP addresses, lowercased hostnames, UTC datetimes and an
+                ``os_family`` field. False keeps the raw source values.
+        """
+        mappings = SOURCE_MAPPINGS if mappings is None else mappings
+        markers = SOURCE_MARKERS if markers is None else markers
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._config = (
+            {source: dict(mapping) for source, mapping in mappings.items()},
+            {source: tuple(fields) for source, fields in markers.items()},
+            default_source,
+            canonical,
+        )
+        self._extractors: Dict[Any, Extractor] = {
+            source: compile_mapping(mapping, canonical=canonical)
+            for source, mapping in mappings.items()
+        }
+        self._typed_extractors: Dict[type, Extractor] = {
+            RECORD_TYPES[source]: compile_mapping(
+                mapping, RECORD_TYPES[source], canonical
+            )
+            for source, mapping in mappings.items()
+            if source in RECORD_TYPES
+        }
+        self._markers = [
+            (field, self._extractors[source])
+            for source, fields in markers.items()
+            for field in fields
+        ]
+        self._default = self._extractors[default_source]
+
+    def options(self) -> Dict[str, Any]:
+        """Return the mapping options, as accepted by ColumnarTransformer."""
+        mappings, markers, default_source, canonical = self._config
+        return {
+            "mappings": mappings,
+            "markers": markers,
+            "default_source": default_source,
+            "canonical": canonical,
+        }
+
     @staticmethod
     def normalize_hosts(
         qualys_data: List[Dict[str, Any]], crowdstrike_data: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Any]:
         """
         Normalize Qualys and Crowdstrike data to unified host format.
         Args:
             qualys_data: List of Qualys host dicts.
             crowdstrike_data: List of Crowdstrike host dicts.
         Returns:
-            List of normalized host dicts.
+            List of normalized Host records.
         """
-        normalized: List[Dict[str, Any]] = []
-
-        for item in qualys_data:
-            normalized.append(
-                {
-                    "source": item.get("source"),
-                    "hostname": item.get("name"),
-                    "ip": item.get("address"),
-                    "os": item.get("os"),
-                    "last_seen": item.get("modified"),
-                }
-            )
+        qualys = _DEFAULT_EXTRACTORS["qualys"]
+        crowdstrike = _DEFAULT_EXTRACTORS["crowdstrike"]
+        return [qualys(item) for item in qualys_data] + [
+            crowdstrike(item) for item in crowdstrike_data
+        ]
 
-        for item in crowdstrike_data:
-            normalized.append(
-                {
-                    "source": item.get("source"),
-                    "hostname": item.get("hostname"),
-                    "ip": item.get("local_ip"),
-                    "os": item.get("platform_name"),
-                    "last_seen": item.get("last_seen"),
-                }
-            )
+    def _detect(self, item: Any) -> Extractor:
+        """Return the extractor of a record that does not name its source."""
+        for field, extractor in self._markers:
+            if field in item:
+                return extractor
+        return self._default
 
-        return normalized
+    def process(self, data: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Process raw data from multiple sources and normalize it in one pass.
+        Records of an unknown explicit source are skipped.
+        Args:
+            data: List of raw host dicts or typed records.
+        Returns:
+            List of normalized Host records, in input order.
+        """
+        if self.workers > 1 and len(data) > self.chunk_size:
+            return self.process_parallel(data)
+        return list(self.iter_process(data))
 
-    def process(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def process_parallel(
+        self,
+        data: List[Dict[str, Any]],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[Any]:
         """
-        Process raw data from multiple sources and normalize it.
+        Normalize chunks of records in a process pool.
+        Chunks travel to and from the workers as MessagePack bytes instead
+        of pickled dicts, which is smaller and cheaper to (de)serialize.
         Args:
-            data: List of raw host dicts.
+            data: List of raw host dicts or typed records.
+            workers: Number of worker processes, defaults to ``self.workers``.
+            chunk_size: Records per chunk, defaults to ``self.chunk_size``.
         Returns:
-            List of normalized host dicts.
+            List of normalized Host records, in input order.
         """
-        qualys_data: List[Dict[str, Any]] = []
-        crowdstrike_data: List[Dict[str, Any]] = []
+        workers = workers or self.workers
+        chunk_size = chunk_size or self.chunk_size
+        chunks = (
+            pack(data[i : i + chunk_size]) for i in range(0, len(data), chunk_size)
+        )
+        normalized: List[Any] = []
+        with ProcessPoolExecutor(
+            max_workers=max(1, workers),
+            initializer=_init_worker,
+            initargs=self._config,
+        ) as executor:
+            for payload in executor.map(_normalize_chunk, chunks):
+                normalized.extend(
+                    Host(*host) if isinstance(host, list) else host
+                    for host in unpack(payload)
+                )
+        return normalized
 
+    def iter_process(self, data: Iterable[Any]) -> Iterator[Any]:
+        """
+        Normalize records lazily, holding only the current record.
+        Args:
+            data: Iterable of raw host dicts or typed records.
+        Returns:
+            Iterator over normalized Host records, in input order.
+        """
+        typed = self._typed_extractors
+        extractors = self._extractors
+        detect = self._detect
         for item in data:
-            if "source" in item:
-                if item["source"] == "qualys":
-                    qualys_data.append(item)
-                elif item["source"] == "crowdstrike":
-                    crowdstrike_data.append(item)
-            else:
-                if "platform_name" in item or "platform_id" in item:
-                    crowdstrike_data.append(item)
+            extract = typed.get(type(item))
+            if extract is None:
+                if "source" in item:
+                    extract = extractors.get(item["source"])
                 else:
-                    qualys_data.append(item)
+                    extract = detect(item)
+            if extract is not None:
+                yield extract(item)
+
+
+_DEFAULT_EXTRACTORS = {
+    source: compile_mapping(mapping, canonical=True)
+    for source, mapping in SOURCE_MAPPINGS.items()
+}
+
+_worker_normalizer: Optional[HostNormalizer] = None  # pylint: disable=invalid-name
+
+
+def _init_worker(
+    mappings: Dict[str, Dict[str, str]],
+    markers: Dict[str, Tuple[str, ...]],
+    default_source: str,
+    canonical: bool,
+) -> None:
+    """Build the normalizer of a worker process once (process pool initializer)."""
+    global _worker_normalizer  # pylint: disable=global-statement
+    _worker_normalizer = HostNormalizer(
+        mappings, markers, default_source, canonical=canonical
+    )
+
 
-        return self.normalize_hosts(qualys_data, crowdstrike_data)
+def _normalize_chunk(payload: bytes) -> bytes:
+    """Normalize one packed chunk of records (process pool worker)."""
+    assert _worker_normalizer is not None
+    hosts = _worker_normalizer.process(unpack(payload))
+    return pack([h.astuple() if isinstance(h, Host) else h for h in hosts])
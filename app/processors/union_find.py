@@ -0,0 +1,54 @@
+"""Disjoint-set forest used to cluster matching hosts."""
+
+from typing import Dict, List
+
+
+class UnionFind:
+    """
+    Disjoint sets over the integers 0..size-1, with union by size and path
+    halving, so any sequence of operations runs in near-linear time.
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        self.parent: List[int] = list(range(size))
+        self.size: List[int] = [1] * size
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        """Add a new singleton set and return its element."""
+        element = len(self.parent)
+        self.parent.append(element)
+        self.size.append(1)
+        return element
+
+    def find(self, element: int) -> int:
+        """Return the representative element of the set holding ``element``."""
+        parent = self.parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, first: int, second: int) -> bool:
+        """
+        Merge the sets holding two elements.
+        Returns:
+            True if they were in different sets.
+        """
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return False
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+        return True
+
+    def groups(self) -> List[List[int]]:
+        """Return every set as a sorted list, ordered by smallest element."""
+        groups: Dict[int, List[int]] = {}
+        for element in range(len(self.parent)):
+            groups.setdefault(self.find(element), []).append(element)
+        return list(groups.values())
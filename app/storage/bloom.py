@@ -0,0 +1,200 @@
+"""Persistent Bloom filter of hosts already written to storage."""
+
+import hashlib
+import logging
+import math
+import os
+import struct
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 1_000_000
+DEFAULT_ERROR_RATE = 0.001
+
+_MAGIC = b"HBF1"
+# magic, capacity, error rate, number of hashes, number of items added
+_HEADER = struct.Struct("<4sQdIQ")
+
+
+class BloomFilter:
+    """
+    Fixed-size set membership test with no false negatives.
+    The bit array and number of hashes are sized so that the false-positive
+    rate stays at ``error_rate`` until ``capacity`` items were added.
+    """
+
+    def __init__(
+        self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE
+    ) -> None:
+        """
+        Args:
+            capacity: Number of items the filter is sized for.
+            error_rate: False-positive rate at full capacity, in (0, 1).
+        Raises:
+            ValueError: If capacity or error_rate is out of range.
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: bytes) -> Iterable[int]:
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: bytes) -> None:
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: bytes) -> bool:
+        bits = self.bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(
+            _MAGIC, self.capacity, self.error_rate, self.hashes, self.count
+        )
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Rebuild a filter serialized with to_bytes.
+        Raises:
+            ValueError: If the data is not a serialized filter.
+        """
+        try:
+            magic, capacity, error_rate, hashes, count = _HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError("Truncated Bloom filter") from e
+        bloom = cls(capacity, error_rate)
+        if magic != _MAGIC or hashes != bloom.hashes:
+            raise ValueError("Not a Bloom filter")
+        bits = data[_HEADER.size :]
+        if len(bits) != len(bloom.bits):
+            raise ValueError("Truncated Bloom filter")
+        bloom.bits[:] = bits
+        bloom.count = count
+        return bloom
+
+
+def _fingerprint_value(value: Any) -> Any:
+    """Return a value as it reads back from MongoDB, for stable fingerprints."""
+    if isinstance(value, datetime):
+        # BSON datetimes are naive UTC with millisecond precision
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.replace(microsecond=value.microsecond // 1000 * 1000).isoformat()
+    return value
+
+
+def host_key(document: Mapping[str, Any]) -> bytes:
+    """Return the filter item of a host document: its (ip, hostname) key."""
+    return repr((document.get("ip"), document.get("hostname"))).encode()
+
+
+def fingerprint(document: Mapping[str, Any]) -> str:
+    """
+    Return a digest of the fields of a host document, stored with it as
+    ``fingerprint`` so an unchanged host can be told from a changed one.
+    """
+    fields = sorted(
+        (name, _fingerprint_value(value))
+        for name, value in document.items()
+        if name not in ("_id", "fingerprint")
+    )
+    return hashlib.blake2b(repr(fields).encode(), digest_size=16).hexdigest()
+
+
+class KnownHostFilter:
+    """
+    Keys of the hosts already stored, persisted across pipeline runs.
+    A host whose key is not in the filter is new for certain and written
+    without a lookup; only possibly known hosts have their stored
+    fingerprint read back. A false positive costs one such lookup.
+    """
+
+    def __init__(
+        self,
+        path: str = "known_hosts.bloom",
+        capacity: int = DEFAULT_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE,
+    ) -> None:
+        """
+        Args:
+            path: File the filter is loaded from and saved to.
+            capacity: Number of hosts the filter is sized for.
+            error_rate: False-positive rate at full capacity.
+        """
+        self.path = Path(path)
+        self.bloom = BloomFilter(capacity, error_rate)
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            bloom = BloomFilter.from_bytes(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️ Ignoring unreadable known host filter: %s", e)
+            return
+        if (bloom.capacity, bloom.error_rate) != (
+            self.bloom.capacity,
+            self.bloom.error_rate,
+        ):
+            logger.warning("⚠️ Known host filter settings changed, starting empty")
+            return
+        self.bloom = bloom
+        logger.info("🌸 Loaded known host filter with %d hosts", bloom.count)
+
+    def may_contain(self, document: Mapping[str, Any]) -> bool:
+        """Tell whether a host with the key of ``document`` may be stored."""
+        return host_key(document) in self.bloom
+
+    def add(self, document: Mapping[str, Any]) -> None:
+        item = host_key(document)
+        if item not in self.bloom:
+            self.bloom.add(item)
+
+    def rebuild(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replace the filter contents with the keys of the given stored documents.
+        Returns:
+            Number of keys added.
+        """
+        self.bloom = BloomFilter(self.bloom.capacity, self.bloom.error_rate)
+        for document in documents:
+            self.add(document)
+        logger.info("🌸 Rebuilt known host filter with %d hosts", self.bloom.count)
+        return self.bloom.count
+
+    def save(self) -> None:
+        """Write the filter atomically to its file."""
+        if self.bloom.count > self.bloom.capacity:
+            logger.warning(
+                "⚠️ Known host filter holds %d hosts over its capacity of %d, "
+                "raise the capacity and rebuild it",
+                self.bloom.count,
+                self.bloom.capacity,
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.bloom.to_bytes())
+        os.replace(tmp, self.path)
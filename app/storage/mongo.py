@@ -1,8 +1,11 @@
 import os
 import logging
-from typing import List, Dict, Any
+from itertools import islice
+from typing import Iterable, List, Dict, Any, Optional
 from pymongo import MongoClient, ASCENDING, UpdateOne
 from pymongo.errors import OperationFailure
+from processors.host import Host
+from storage.bloom import KnownHostFilter, fingerprint
 from storage.base import BaseStorage
 
 logger = logging.getLogger(__name__)
@@ -11,7 +14,40 @@ db = client["hosts_db"]
 collection = db["hosts"]
 
 
+def to_document(host: Any) -> Dict[str, Any]:
+    """Convert a normalized host (Host record or dict) to a BSON document."""
+    if isinstance(host, Host):
+        return host.to_document()
+    ip = host.get("ip")
+    if ip is None or isinstance(ip, str):
+        return host
+    return {**host, "ip": str(ip)}
+
+
 class MongoStorage(BaseStorage):
+    def __init__(self, known_hosts: Optional[KnownHostFilter] = None) -> None:
+        """
+        Args:
+            known_hosts: Filter of the keys already stored. Documents then
+                carry a ``fingerprint`` and hosts stored unchanged are not
+                written again.
+        """
+        self.known_hosts = known_hosts
+
+    def rebuild_known_hosts(self) -> int:
+        """
+        Rebuild the known host filter from the stored collection.
+        Returns:
+            Number of stored hosts added to the filter.
+        """
+        if self.known_hosts is None:
+            return 0
+        count = self.known_hosts.rebuild(
+            collection.find({}, {"_id": 0, "ip": 1, "hostname": 1})
+        )
+        self.known_hosts.save()
+        return count
+
     def save(self, data: List[Dict[str, Any]], batch_size: int = 1000) -> None:
         """
         Save data to MongoDB in batches using bulk_write.
@@ -24,7 +60,51 @@ class MongoStorage(BaseStorage):
             return
 
         logger.info("💾 Saving %d hosts to MongoDB", len(data))
+        self._save_batches(data, batch_size)
+
+    def save_iter(self, data: Iterable[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        Save a stream of hosts, holding at most one batch in memory.
+        Args:
+            data: Iterable of host dicts.
+            batch_size: Number of records per batch.
+        Returns:
+            Number of hosts consumed from the stream.
+        """
+        logger.info("💾 Saving host stream to MongoDB")
+        return self._save_batches(data, batch_size)
+
+    @staticmethod
+    def _changed(
+        documents: List[Dict[str, Any]], known: KnownHostFilter
+    ) -> List[Dict[str, Any]]:
+        """
+        Fingerprint documents and drop those stored with the same fingerprint.
+        Only documents whose key may be known are looked up, in one query.
+        """
+        documents = [{**d, "fingerprint": fingerprint(d)} for d in documents]
+        candidates = [d for d in documents if known.may_contain(d)]
+        if not candidates:
+            return documents
+        stored = {
+            (d.get("ip"), d.get("hostname")): d.get("fingerprint")
+            for d in collection.find(
+                {
+                    "$or": [
+                        {"ip": d["ip"], "hostname": d["hostname"]} for d in candidates
+                    ]
+                },
+                {"_id": 0, "ip": 1, "hostname": 1, "fingerprint": 1},
+            )
+        }
+        return [
+            d
+            for d in documents
+            if stored.get((d["ip"], d["hostname"])) != d["fingerprint"]
+        ]
 
+    def _save_batches(self, data: Iterable[Dict[str, Any]], batch_size: int) -> int:
+        """Upsert hosts batch by batch and return the number of hosts read."""
         # Create index if it doesn't exist
         try:
             collection.create_index(
@@ -35,11 +115,22 @@ class MongoStorage(BaseStorage):
             logger.warning("⚠️ Could not create index: %s", e)
 
         saved_count = 0
+        skipped = 0
+        total = 0
+        iterator = iter(data)
+        known = self.known_hosts
 
-        for i in range(0, len(data), batch_size):
-            batch = data[i : i + batch_size]
+        while batch := list(islice(iterator, batch_size)):
+            i = total
+            total += len(batch)
+            documents = list(map(to_document, batch))
+            if known is not None:
+                documents = self._changed(documents, known)
+                skipped += len(batch) - len(documents)
+                if not documents:
+                    continue
             operations = []
-            for host in batch:
+            for host in documents:
                 operations.append(
                     UpdateOne(
                         {"ip": host["ip"], "hostname": host["hostname"]},
@@ -49,6 +140,9 @@ class MongoStorage(BaseStorage):
                 )
             try:
                 result = collection.bulk_write(operations, ordered=False)
+                if known is not None:
+                    for host in documents:
+                        known.add(host)
                 saved_count += result.upserted_count + result.modified_count
                 logger.info(
                     "💾 Batch %d-%d: %d upserted, %d modified",
@@ -65,4 +159,8 @@ class MongoStorage(BaseStorage):
                     e,
                 )
 
+        if known is not None:
+            known.save()
+            logger.info("🌸 Skipped %d known unchanged hosts", skipped)
         logger.info("✅ Successfully processed %d hosts to MongoDB", saved_count)
+        return total
@@ -0,0 +1,100 @@
+"""
+Fake vendor API shared by the fetcher tests.
+Shared test infrastructure: it replaces the copies each fetcher test
+module (base fetcher, cache, checkpoint, decoders, hedging, retry,
+streaming) used to define for itself.
+"""
+
+import gzip
+import io
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pytest
+import requests
+
+
+def make_response(
+    status_code: int = 200, body: Any = None, stream: bool = False
+) -> requests.Response:
+    """
+    Build a response the way the transport receives it.
+    Args:
+        status_code: HTTP status code.
+        body: Raw body bytes, or a value sent as JSON; defaults to no hosts.
+        stream: Serve the body from ``raw``, as a streamed response.
+    Returns:
+        Response whose content, text and json() read the body.
+    """
+    if body is None:
+        body = []
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    if stream:
+        response.raw = io.BytesIO(body)
+    else:
+        response._content = body  # pylint: disable=protected-access
+    return response
+
+
+class FakeApi:
+    """
+    Vendor API honouring skip/limit, patched in for Session.post. Pages past
+    the last host, or larger than ``page_size``, fail with the 500 error of
+    the hybrid pagination. Requested (skip, limit) pairs are recorded.
+    """
+
+    def __init__(
+        self,
+        hosts: Sequence[Dict[str, Any]],
+        page_size: Optional[int] = None,
+        fail_at: Optional[int] = None,
+        gzipped: bool = False,
+    ) -> None:
+        """
+        Args:
+            hosts: Hosts served, in order.
+            page_size: Largest accepted limit, unbounded by default.
+            fail_at: Skip whose first request fails with a connection error.
+            gzipped: Gzip the bodies of streamed responses.
+        """
+        self.hosts = hosts
+        self.page_size = page_size
+        self.fail_at = fail_at
+        self.gzipped = gzipped
+        self.calls: List[Tuple[int, int]] = []
+
+    @property
+    def skips(self) -> List[int]:
+        return [skip for skip, _ in self.calls]
+
+    def __call__(
+        self, url: str, params: Dict[str, Any], stream: bool = False, **kwargs: Any
+    ) -> requests.Response:
+        skip, limit = params["skip"], params["limit"]
+        self.calls.append((skip, limit))
+        if skip == self.fail_at:
+            self.fail_at = None
+            raise requests.exceptions.ConnectionError("Connection reset")
+        too_large = self.page_size is not None and limit > self.page_size
+        if too_large or skip + limit > len(self.hosts):
+            return make_response(500, b"invalid skip/limit combo")
+        body = json.dumps(self.hosts[skip : skip + limit]).encode()
+        if stream and self.gzipped:
+            body = gzip.compress(body)
+        return make_response(200, body, stream=stream)
+
+
+@pytest.fixture
+def api_response():
+    """Factory of fake API responses, see make_response."""
+    return make_response
+
+
+@pytest.fixture
+def fake_api():
+    """Factory of fake vendor APIs, see FakeApi."""
+    return FakeApi
@@ -1,5 +1,10 @@
+import asyncio
 from unittest.mock import patch, Mock
+
+import pytest
+import requests
 from fetchers.base import BaseFetcher
+from fetchers.retry import RetryPolicy
 
 
 class MockFetcher(BaseFetcher):
@@ -10,7 +15,7 @@ def test_pagination_with_page_size_2():
     """Test pagination with page_size=2"""
     fetcher = MockFetcher("http://test.com", "test")
 
-    with patch("fetchers.base.requests.post") as mock_post:
+    with patch("fetchers.transport.requests.Session.post") as mock_post:
         # Mock first page with 2 items
         mock_response1 = Mock()
         mock_response1.status_code = 200
@@ -44,7 +49,7 @@ def test_pagination_stops_on_500():
     """Test that pagination stops when server returns 500"""
     fetcher = MockFetcher("http://test.com", "test")
 
-    with patch("fetchers.base.requests.post") as mock_post:
+    with patch("fetchers.transport.requests.Session.post") as mock_post:
         # Mock first page with 2 items
         mock_response1 = Mock()
         mock_response1.status_code = 200
@@ -77,3 +82,120 @@ def test_pagination_stops_on_500():
             assert result[0]["hostname"] == "host1"
             assert result[1]["hostname"] == "host2"
             assert result[2]["hostname"] == "host3"
+
+
+def test_fetch_async_matches_sync_order(fake_api):
+    """Test that fetch_async returns the same hosts in the same order as fetch"""
+    hosts = [{"hostname": f"host{i}"} for i in range(7)]
+    fetcher = MockFetcher("http://test.com", "test")
+    fetcher.api_token = "test_token"
+
+    with patch(
+        "fetchers.transport.requests.Session.post",
+        side_effect=fake_api(hosts, page_size=2),
+    ):
+        sync_result = fetcher.fetch()
+        async_result = asyncio.run(fetcher.fetch_async(max_in_flight=3))
+
+    assert [h["hostname"] for h in async_result] == [h["hostname"] for h in hosts]
+    assert async_result == sync_result
+    assert all(h["source"] == "test" for h in async_result)
+
+
+def test_fetch_async_raises_on_failed_page(fake_api):
+    """Test that a failed page before the end of data aborts fetch_async"""
+    fetcher = MockFetcher(
+        "http://test.com", "test", retry_policy=RetryPolicy(max_attempts=1)
+    )
+    fetcher.api_token = "test_token"
+    api = fake_api([{"hostname": f"host{i}"} for i in range(10)], page_size=2)
+
+    def post(url, params=None, **kwargs):
+        if params["skip"] == 4:
+            raise requests.exceptions.ConnectionError("Connection refused")
+        return api(url, params=params, **kwargs)
+
+    with patch("fetchers.transport.requests.Session.post", side_effect=post):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            asyncio.run(fetcher.fetch_async(max_in_flight=4))
+
+
+def test_iter_pages_is_lazy(fake_api):
+    """Test that iter_pages yields a page before requesting the next one"""
+    hosts = [{"hostname": f"host{i}"} for i in range(5)]
+    fetcher = MockFetcher("http://test.com", "test")
+    fetcher.api_token = "test_token"
+
+    with patch(
+        "fetchers.transport.requests.Session.post",
+        side_effect=fake_api(hosts, page_size=2),
+    ) as mock_post:
+        pages = fetcher.iter_pages()
+        first_page = next(pages)
+        assert [h["hostname"] for h in first_page] == ["host0", "host1"]
+        assert mock_post.call_count == 1
+
+        remaining = list(pages)
+
+    assert [len(page) for page in remaining] == [2, 1]
+    assert all(h["source"] == "test" for page in remaining for h in page)
+
+
+def test_iter_hosts_matches_fetch(fake_api):
+    """Test that fetch collects the same hosts as iter_hosts streams"""
+    hosts = [{"hostname": f"host{i}"} for i in range(4)]
+    fetcher = MockFetcher("http://test.com", "test")
+    fetcher.api_token = "test_token"
+
+    with patch(
+        "fetchers.transport.requests.Session.post",
+        side_effect=fake_api(hosts, page_size=2),
+    ):
+        streamed = list(fetcher.iter_hosts())
+        fetched = fetcher.fetch()
+
+    assert streamed == fetched
+    assert [h["hostname"] for h in fetched] == ["host0", "host1", "host2", "host3"]
+
+
+def test_probe_page_size_and_total(fake_api):
+    """Test that probing finds the accepted page size and host count"""
+    hosts = [{"hostname": f"host{i}"} for i in range(21)]
+    fetcher = MockFetcher("http://test.com", "probe-test")
+    fetcher.api_token = "test_token"
+
+    with patch(
+        "fetchers.transport.requests.Session.post",
+        side_effect=fake_api(hosts, page_size=6),
+    ) as mock_post:
+        assert fetcher.probe_page_size(max_limit=16) == 6
+        assert fetcher.probe_total() == 21
+
+        # The page size is cached per source
+        calls = mock_post.call_count
+        assert fetcher.probe_page_size(max_limit=16) == 6
+        assert mock_post.call_count == calls
+
+    assert fetcher.plan_pages(21, 6) == [(0, 6), (6, 6), (12, 6), (18, 3)]
+    assert fetcher.plan_pages(0, 6) == []
+
+
+def test_fetch_planned_requests_no_failing_pages(fake_api):
+    """Test that the planned fetch returns all hosts without hitting 500s"""
+    hosts = [{"hostname": f"host{i}"} for i in range(9)]
+    fetcher = MockFetcher("http://test.com", "planned-test", probe=True)
+    fetcher.api_token = "test_token"
+    api = fake_api(hosts, page_size=4)
+    pages = []
+
+    def post(url, params=None, **kwargs):
+        response = api(url, params=params, **kwargs)
+        pages.append((params["skip"], params["limit"], response.status_code))
+        return response
+
+    with patch("fetchers.transport.requests.Session.post", side_effect=post):
+        result = fetcher.fetch()
+
+    assert [h["hostname"] for h in result] == [h["hostname"] for h in hosts]
+    # After probing, exactly the planned pages are requested
+    assert set(pages[-3:]) == {(0, 4, 200), (4, 4, 200), (8, 1, 200)}
@@ -19,7 +19,7 @@ class TestFetcher(BaseFetcher):
         return super().fetch()
 
 
-@patch("fetchers.base.requests.post")
+@patch("fetchers.transport.requests.Session.post")
 @patch("fetchers.base.logger")
 def test_handle_api_error_pagination_end(mock_logger, mock_post):
     """Test handling of API errors related to pagination limits"""
@@ -51,7 +51,7 @@ def test_handle_api_error_pagination_end(mock_logger, mock_post):
     assert mock_post.call_count == 1
 
 
-@patch("fetchers.base.requests.post")
+@patch("fetchers.transport.requests.Session.post")
 @patch("fetchers.base.logger")
 def test_handle_api_error_with_rate_limit(mock_logger, mock_post):
     """Test handling of API rate limiting errors"""
@@ -79,7 +79,7 @@ def test_handle_api_error_with_rate_limit(mock_logger, mock_post):
     mock_logger.error.assert_called()
 
 
-@patch("fetchers.base.requests.post")
+@patch("fetchers.transport.requests.Session.post")
 @patch("fetchers.base.logger")
 def test_handle_api_error_with_server_error(mock_logger, mock_post):
     """Test handling of server errors (5xx)"""
@@ -106,7 +106,7 @@ def test_handle_api_error_with_server_error(mock_logger, mock_post):
     mock_logger.error.assert_called()
 
 
-@patch("fetchers.base.requests.post")
+@patch("fetchers.transport.requests.Session.post")
 @patch("fetchers.base.logger")
 def test_fetch_with_auth_error(mock_logger, mock_post):
     """Test fetch with authentication error"""
@@ -129,9 +129,10 @@ def test_fetch_with_auth_error(mock_logger, mock_post):
     mock_logger.error.assert_called()
 
 
-@patch("fetchers.base.requests.post")
+@patch("fetchers.base.time.sleep")
+@patch("fetchers.transport.requests.Session.post")
 @patch("fetchers.base.logger")
-def test_fetch_with_connection_error(mock_logger, mock_post):
+def test_fetch_with_connection_error(mock_logger, mock_post, mock_sleep):
     """Test fetch with connection error"""
     fetcher = TestFetcher()
 
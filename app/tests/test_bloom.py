@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from storage.bloom import BloomFilter, KnownHostFilter, fingerprint
+from storage.mongo import MongoStorage
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"host{i}".encode() for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other{i}".encode() in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_round_trip():
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+    bloom.add(b"host")
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+    assert b"host" in restored
+    assert restored.count == 1
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(bloom.to_bytes()[:-1])
+
+
+@patch("storage.bloom.logger")
+def test_known_host_filter_persists_keys(_logger, tmp_path):
+    path = tmp_path / "known.bloom"
+    host = {"ip": "1.1.1.1", "hostname": "host", "os": "Linux"}
+    known = KnownHostFilter(str(path), capacity=100)
+    known.add(host)
+    known.save()
+
+    reloaded = KnownHostFilter(str(path), capacity=100)
+    assert reloaded.may_contain({"ip": "1.1.1.1", "hostname": "host"})
+    assert not reloaded.may_contain({"ip": "1.1.1.1", "hostname": "other"})
+    assert not KnownHostFilter(str(path), capacity=200).may_contain(host)
+
+
+def test_fingerprint_matches_stored_form():
+    host = {
+        "ip": "1.1.1.1",
+        "hostname": "host",
+        "last_seen": datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+    }
+    # Stored form: naive UTC, millisecond precision, with an _id
+    stored = {**host, "_id": 1, "last_seen": datetime(2024, 1, 1, 12, 0, 0, 123000)}
+
+    assert fingerprint(stored) == fingerprint(host)
+    assert fingerprint({**stored, "fingerprint": "x"}) == fingerprint(host)
+    assert fingerprint({**host, "os": "Linux"}) != fingerprint(host)
+
+
+class FakeCollection:
+    """Hosts collection keeping the $set documents by (ip, hostname)."""
+
+    def __init__(self):
+        self.documents = {}
+        self.writes = 0
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            key = (operation._filter["ip"], operation._filter["hostname"])
+            self.documents[key] = operation._doc["$set"]
+            self.writes += 1
+        return Mock(upserted_count=len(operations), modified_count=0)
+
+    def find(self, query, projection=None):
+        if "$or" not in query:
+            return list(self.documents.values())
+        keys = {(q["ip"], q["hostname"]) for q in query["$or"]}
+        return [d for k, d in self.documents.items() if k in keys]
+
+
+@patch("storage.bloom.logger")
+@patch("storage.mongo.logger")
+def test_storage_skips_only_hosts_stored_unchanged(_logger, _bloom_logger, tmp_path):
+    fake = FakeCollection()
+    fake.documents[("1.1.1.1", "a")] = {"ip": "1.1.1.1", "hostname": "a"}
+    host_a = {"ip": "2.2.2.2", "hostname": "b", "os": "Ubuntu"}
+    host_b = {**host_a, "os": "Linux"}
+    with patch("storage.mongo.collection", fake):
+        storage = MongoStorage(
+            known_hosts=KnownHostFilter(str(tmp_path / "known.bloom"))
+        )
+        assert storage.rebuild_known_hosts() == 1
+
+        storage.save([host_a])
+        storage.save([host_a])
+        assert fake.writes == 1
+
+        # A -> B -> A must write A again, the store holds B
+        storage.save([host_b])
+        storage.save([host_a])
+        assert fake.writes == 3
+        assert fake.documents[("2.2.2.2", "b")]["os"] == "Ubuntu"
+
+        # Stored hosts without a fingerprint are written once to get one
+        storage.save([{"ip": "1.1.1.1", "hostname": "a"}])
+        storage.save([{"ip": "1.1.1.1", "hostname": "a"}])
+        assert fake.writes == 4
@@ -0,0 +1,86 @@
+import json
+from unittest.mock import patch
+
+from fetchers.base import BaseFetcher
+from fetchers.cache import PageCache
+
+
+class MockFetcher(BaseFetcher):
+    """Mock fetcher for testing the page cache"""
+
+
+def test_page_cache_roundtrip(tmp_path):
+    """Test that stored pages are returned compressed on disk"""
+    cache = PageCache(str(tmp_path))
+    body = json.dumps([{"name": "host"}] * 50).encode()
+
+    assert cache.get("http://api", 0, 2) is None
+    cache.put("http://api", 0, 2, 200, body)
+
+    assert cache.get("http://api", 0, 2) == (200, body)
+    assert cache.get("http://api", 2, 2) is None
+    (entry,) = tmp_path.glob("*.gz")
+    assert entry.stat().st_size < len(body)
+
+
+def test_page_cache_expires_entries(tmp_path):
+    """Test that entries older than the TTL are dropped"""
+    cache = PageCache(str(tmp_path), ttl=60)
+    cache.put("http://api", 0, 2, 200, b"[]")
+
+    with patch("fetchers.cache.time.time", return_value=10**12):
+        assert cache.get("http://api", 0, 2) is None
+    assert not list(tmp_path.glob("*.gz"))
+
+
+def test_page_cache_evicts_least_recently_used(tmp_path):
+    """Test that the cache stays under its size cap"""
+    cache = PageCache(str(tmp_path), max_bytes=10**9)
+    for skip in range(3):
+        cache.put("http://api", skip, 1, 200, bytes(range(256)) * skip)
+    sizes = sorted(p.stat().st_size for p in tmp_path.glob("*.gz"))
+
+    cache.max_bytes = sum(sizes) - 1
+    cache.get("http://api", 0, 1)
+    cache.put("http://api", 3, 1, 200, b"")
+
+    assert cache.get("http://api", 0, 1) is not None
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.gz")) <= cache.max_bytes
+
+
+def test_page_cache_scans_directory_only_when_over_cap(tmp_path):
+    """Test that puts under the size cap track the size without rescanning"""
+    PageCache(str(tmp_path)).put("http://api", 0, 1, 200, b"stale")
+    cache = PageCache(str(tmp_path), max_bytes=10**9)
+
+    with patch.object(cache, "_evict", wraps=cache._evict) as evict:
+        for skip in range(20):
+            cache.put("http://api", skip, 1, 200, bytes(range(256)) * skip)
+        assert not evict.called
+
+        cache.max_bytes = cache._total - 1
+        cache.put("http://api", 0, 1, 200, b"")
+        assert evict.call_count == 1
+
+    on_disk = sum(p.stat().st_size for p in tmp_path.glob("*.gz"))
+    assert cache._total == on_disk <= cache.max_bytes
+
+
+def test_repeat_fetch_is_served_from_cache(tmp_path, fake_api):
+    """Test that a second run within the TTL sends no requests"""
+    hosts = [{"hostname": f"host{i}"} for i in range(5)]
+    fetcher = MockFetcher(
+        "http://test.com", "test", page_cache=PageCache(str(tmp_path))
+    )
+    fetcher.api_token = "test_token"
+    api = fake_api(hosts)
+
+    with patch("fetchers.transport.requests.Session.post", side_effect=api):
+        first = fetcher.fetch()
+        requests_sent = len(api.calls)
+        second = fetcher.fetch()
+
+    assert first == second
+    assert [h["hostname"] for h in second] == [h["hostname"] for h in hosts]
+    assert len(api.calls) == requests_sent
+    assert fetcher.stats.cache_hits == requests_sent
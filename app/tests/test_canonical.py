@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from ipaddress import ip_address
+
+from processors.canonical import (
+    canonical_hostname,
+    canonical_ip,
+    os_family,
+    parse_timestamp,
+)
+
+
+def test_canonical_ip():
+    """Test that IP spellings are parsed and invalid values kept as text"""
+    assert canonical_ip(" 10.0.0.1 ") == ip_address("10.0.0.1")
+    assert canonical_ip("::FFFF:10.0.0.1") == ip_address("::ffff:10.0.0.1")
+    assert canonical_ip("010.0.0.1") == "010.0.0.1"
+    assert canonical_ip("  ") is None
+
+
+def test_canonical_hostname():
+    """Test hostname case, padding and FQDN root dot normalization"""
+    assert canonical_hostname(" Web-01.Example.COM. ") == "web-01.example.com"
+    assert canonical_hostname(".") is None
+    assert canonical_hostname(None) is None
+
+
+def test_parse_timestamp():
+    """Test that timestamps become aware UTC datetimes"""
+    expected = datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+
+    assert parse_timestamp("2024-03-01T10:00:00") == expected
+    assert parse_timestamp("2024-03-01T10:00:00Z") == expected
+    assert parse_timestamp("2024-03-01T12:00:00+02:00") == expected
+    assert parse_timestamp(datetime(2024, 3, 1, 10)) == expected
+    assert parse_timestamp("yesterday") is None
+    assert parse_timestamp("") is None
+
+
+def test_os_family():
+    """Test OS family mapping"""
+    assert os_family("Amazon Linux 2") == "Linux"
+    assert os_family("Windows Server 2019") == "Windows"
+    assert os_family("Plan 9") == "Other"
+    assert os_family(None) == "Unknown"
@@ -0,0 +1,90 @@
+import os
+from unittest.mock import patch
+
+import pytest
+import requests
+from fetchers.base import BaseFetcher
+from fetchers.checkpoint import FileCheckpointStore
+from fetchers.retry import RetryPolicy
+
+
+class MockFetcher(BaseFetcher):
+    """Mock fetcher for testing checkpointed pagination"""
+
+
+def test_checkpoint_store_roundtrip(tmp_path):
+    """Test that saved pages are restored and cleared"""
+    store = FileCheckpointStore(str(tmp_path))
+
+    assert store.load("qualys") is None
+    store.save("qualys", 2, [{"name": "a"}, {"name": "b"}])
+    store.save("qualys", 4, [{"name": "c"}, {"name": "d"}])
+
+    checkpoint = store.load("qualys")
+    assert checkpoint.skip == 4
+    assert [h["name"] for h in checkpoint.hosts] == ["a", "b", "c", "d"]
+
+    store.clear("qualys")
+    assert store.load("qualys") is None
+
+
+def test_checkpoint_store_ignores_truncated_entry(tmp_path):
+    """Test that a partially written last entry is ignored"""
+    store = FileCheckpointStore(str(tmp_path))
+    store.save("crowdstrike", 2, [{"name": "a"}])
+    with (tmp_path / "crowdstrike.jsonl").open("a", encoding="utf-8") as f:
+        f.write('{"skip": 4, "hosts": [{"na')
+
+    checkpoint = store.load("crowdstrike")
+    assert checkpoint.skip == 2
+    assert checkpoint.hosts == [{"name": "a"}]
+
+
+def test_checkpoint_store_expires_stale_checkpoints(tmp_path):
+    """Test that checkpoints older than max_age are discarded"""
+    store = FileCheckpointStore(str(tmp_path), max_age=0)
+    store.save("qualys", 2, [{"name": "a"}])
+
+    with patch("fetchers.checkpoint.time.time", return_value=10**12):
+        assert store.load("qualys") is None
+    assert not (tmp_path / "qualys.jsonl").exists()
+
+
+def test_checkpoint_store_expire_keeps_fresh_checkpoints(tmp_path):
+    """Test that expire only removes checkpoints older than max_age"""
+    store = FileCheckpointStore(str(tmp_path), max_age=60)
+    store.save("qualys", 2, [{"name": "a"}])
+    store.save("crowdstrike", 2, [{"hostname": "b"}])
+    stale = tmp_path / "qualys.jsonl"
+    os.utime(stale, (0, 0))
+
+    assert store.expire() == 1
+    assert not stale.exists()
+    assert store.load("crowdstrike").skip == 2
+    assert FileCheckpointStore(str(tmp_path)).expire() == 0
+
+
+def test_fetch_resumes_from_checkpoint(tmp_path, fake_api):
+    """Test that a restarted fetch resumes from the last good skip"""
+    hosts = [{"hostname": f"host{i}"} for i in range(7)]
+    store = FileCheckpointStore(str(tmp_path))
+    fetcher = MockFetcher(
+        "http://test.com",
+        "test",
+        checkpoint_store=store,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    fetcher.api_token = "test_token"
+    api = fake_api(hosts, fail_at=4)
+
+    with patch("fetchers.transport.requests.Session.post", side_effect=api):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            fetcher.fetch()
+        assert store.load("test").skip == 4
+
+        api.calls.clear()
+        result = fetcher.fetch()
+
+    assert [h["hostname"] for h in result] == [h["hostname"] for h in hosts]
+    assert min(api.skips) == 4
+    assert store.load("test") is None
@@ -0,0 +1,113 @@
+import json
+
+from unittest.mock import MagicMock
+
+import pytest
+from pipeline.config import PipelineConfig
+from processors.deduplicate import DeduplicationProcessor
+from processors.merge import MergingDeduplicationProcessor
+from processors.normalize import HostNormalizer
+
+pytest.importorskip("polars")
+from processors.columnar import ColumnarTransformer  # noqa: E402
+
+RAW_HOSTS = [
+    {"source": "qualys", "name": "a", "address": "10.0.0.1", "os": "Linux"},
+    {"source": "crowdstrike", "hostname": "A.", "local_ip": " 10.0.0.1"},
+    {"name": "d", "address": "::FFFF:10.0.0.9", "modified": "2024-01-01T00:00:00Z"},
+    {"name": "e", "address": "not-an-ip", "modified": "2024-01-01 05:00:00"},
+    {"hostname": "b", "local_ip": "10.0.0.2", "platform_id": "7"},
+    {"name": "c", "address": "", "modified": "2024-01-01T00:00:00"},
+    {"hostname": "c", "platform_name": "Windows"},
+    {"address": "10.0.0.2"},
+    {"source": "other", "name": "skipped"},
+    {"name": None, "address": None},
+    {"name": "", "address": None},
+]
+
+
+def test_matches_python_processors():
+    """Test that the columnar engine yields the same unique hosts"""
+    hosts = DeduplicationProcessor().process(HostNormalizer().process(RAW_HOSTS))
+    # Only merging deduplication sets sources
+    expected = [host.to_document() for host in hosts]
+
+    assert ColumnarTransformer().process(RAW_HOSTS) == expected
+
+
+def test_detects_source_by_marker_key_presence():
+    """Test that a marker key set to null detects its source, as in HostNormalizer"""
+    raw = [
+        {"hostname": "f", "local_ip": "10.0.0.3", "platform_name": None},
+        {"name": "g", "address": "10.0.0.4"},
+    ]
+    expected = [host.to_document() for host in HostNormalizer().process(raw)]
+
+    unique = ColumnarTransformer().process(raw)
+
+    assert unique == expected
+    # Crowdstrike records read local_ip, Qualys records address
+    assert [(h["hostname"], h["ip"]) for h in unique] == [
+        ("f", "10.0.0.3"),
+        ("g", "10.0.0.4"),
+    ]
+
+
+def test_from_pages_tags_source():
+    """Test that raw page bodies are loaded with the source column set"""
+    transformer = ColumnarTransformer(canonical=False)
+    pages = [
+        json.dumps([{"name": "a", "address": "10.0.0.1", "id": 1}]).encode(),
+        json.dumps([{"name": "a", "address": "10.0.0.1", "os": "Linux"}]).encode(),
+    ]
+
+    unique = transformer.transform(transformer.from_pages(pages, "qualys")).to_dicts()
+
+    assert unique == [
+        {
+            "source": "qualys",
+            "hostname": "a",
+            "ip": "10.0.0.1",
+            "os": None,
+            "last_seen": None,
+            "source_id": "1",
+        }
+    ]
+
+
+def _config(normalizer, deduplicator, transformer):
+    return PipelineConfig(
+        fetchers=[],
+        normalizer=normalizer,
+        deduplicator=deduplicator,
+        storage=MagicMock(),
+        visualizer=MagicMock(),
+        transformer=transformer,
+    )
+
+
+def test_config_accepts_transformer_matching_processors():
+    """Test that a transformer built from the normalizer options is accepted"""
+    normalizer = HostNormalizer(canonical=False)
+    transformer = ColumnarTransformer(**normalizer.options())
+
+    config = _config(normalizer, DeduplicationProcessor(), transformer)
+
+    assert config.transformer is transformer
+
+
+@pytest.mark.parametrize(
+    "normalizer, deduplicator",
+    [
+        (HostNormalizer(default_source="crowdstrike"), None),
+        (HostNormalizer(canonical=False), None),
+        (HostNormalizer(), MergingDeduplicationProcessor()),
+        (HostNormalizer(), DeduplicationProcessor(workers=4)),
+    ],
+)
+def test_config_rejects_transformer_bypassing_processors(normalizer, deduplicator):
+    """Test that settings the columnar engine would ignore are rejected"""
+    with pytest.raises(ValueError):
+        _config(
+            normalizer, deduplicator or DeduplicationProcessor(), ColumnarTransformer()
+        )
@@ -0,0 +1,101 @@
+import json
+from datetime import datetime, timezone
+from ipaddress import ip_address
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fetchers.crowdstrike import CrowdstrikeFetcher
+from fetchers.decoders import (
+    JsonDecoder,
+    MsgspecDecoder,
+    OrjsonDecoder,
+    get_decoder,
+    pack,
+    unpack,
+)
+from fetchers.records import RECORD_TYPES, to_builtins
+from processors.normalize import HostNormalizer
+
+DOCS_DIR = Path(__file__).resolve().parents[2] / "docs"
+
+msgspec = pytest.importorskip("msgspec")
+
+
+def _sample(source):
+    return (DOCS_DIR / f"response-{source}.json").read_bytes()
+
+
+def test_get_decoder_prefers_typed_records():
+    """Test decoder selection and fallbacks"""
+    assert isinstance(get_decoder("qualys"), MsgspecDecoder)
+    assert isinstance(get_decoder("unknown"), (OrjsonDecoder, JsonDecoder))
+    assert isinstance(get_decoder("qualys", preferred="json"), JsonDecoder)
+
+
+@pytest.mark.parametrize("source", ["qualys", "crowdstrike"])
+def test_typed_records_normalize_like_dicts(source):
+    """Test that typed records normalize exactly like stdlib dicts"""
+    data = _sample(source)
+    plain = JsonDecoder().decode(data)
+    typed = get_decoder(source).decode(data)
+    for host in plain:
+        host["source"] = source
+
+    assert all(isinstance(host, RECORD_TYPES[source]) for host in typed)
+    assert all(host.source == source for host in typed)
+    normalizer = HostNormalizer()
+    assert normalizer.process(typed) == normalizer.process(plain)
+
+
+def test_typed_records_accept_numeric_and_string_ids():
+    """Test that a vendor id of either type does not fail the whole page"""
+    qualys = get_decoder("qualys").decode(b'[{"id": 7}, {"id": "q-8"}]')
+    crowdstrike = get_decoder("crowdstrike").decode(
+        b'[{"device_id": "abc", "platform_id": "0"}, {"device_id": 9, "platform_id": 1}]'
+    )
+
+    assert [host.id for host in qualys] == [7, "q-8"]
+    assert [host.device_id for host in crowdstrike] == ["abc", 9]
+    for source, hosts in (("qualys", qualys), ("crowdstrike", crowdstrike)):
+        for host in hosts:
+            host.source = source
+    normalized = HostNormalizer().process(qualys + crowdstrike)
+    assert [host.source_id for host in normalized] == ["7", "q-8", "abc", "9"]
+
+
+def test_typed_records_serialize_to_json():
+    """Test that typed records can be written to JSON checkpoints"""
+    (record,) = get_decoder("crowdstrike").decode(
+        b'[{"hostname": "h", "local_ip": "1.1.1.1", "unused": {"a": 1}}]'
+    )
+
+    restored = json.loads(json.dumps(record, default=to_builtins))
+    assert restored["hostname"] == "h"
+    assert restored["local_ip"] == "1.1.1.1"
+    assert "unused" not in restored
+
+
+def test_fetcher_decodes_pages_into_records(api_response):
+    """Test that a source fetcher tags decoded typed records"""
+    response = api_response(200, [{"hostname": "h", "local_ip": "1.1.1.1"}])
+    fetcher = CrowdstrikeFetcher()
+    fetcher.api_token = "test_token"
+
+    with patch("fetchers.transport.requests.Session.post", return_value=response):
+        hosts = fetcher.fetch()
+
+    assert isinstance(hosts[0], RECORD_TYPES["crowdstrike"])
+    assert hosts[0]["source"] == "crowdstrike"
+
+
+def test_pack_round_trips_canonical_hosts():
+    """Test that packed hosts keep IP addresses, datetimes and set fields only"""
+    host = RECORD_TYPES["crowdstrike"](hostname="h", local_ip="10.0.0.1")
+    seen = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    normalized = {"ip": ip_address("::1"), "last_seen": seen, "os": None}
+
+    assert unpack(pack([host, normalized])) == [
+        {"hostname": "h", "local_ip": "10.0.0.1"},
+        normalized,
+    ]
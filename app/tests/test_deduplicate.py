@@ -72,3 +72,55 @@ def test_deduplication_empty_data(mock_logger):
 
     # Check that appropriate log was called
     mock_logger.info.assert_called_with("📭 No data to deduplicate")
+
+
+def test_iter_process_is_lazy():
+    """Test that hosts are yielded while the input is still being read"""
+    consumed = []
+
+    def hosts():
+        for i in (1, 2, 1, 3):
+            consumed.append(i)
+            yield {"ip": f"10.0.0.{i}", "hostname": f"h{i}"}
+
+    stream = DeduplicationProcessor().iter_process(hosts())
+
+    assert next(stream)["hostname"] == "h1"
+    assert consumed == [1]
+    assert [h["hostname"] for h in stream] == ["h2", "h3"]
+
+
+@patch("processors.deduplicate.logger")
+def test_parallel_matches_sequential(mock_logger):
+    """Test that sharded deduplication keeps the same first-seen hosts"""
+    hosts = [
+        {"ip": f"10.0.0.{i % 7}" if i % 3 else None, "hostname": f"h{i % 5}"}
+        for i in range(200)
+    ] + [{"source": "qualys"}]
+    expected = DeduplicationProcessor().process(hosts)
+
+    processor = DeduplicationProcessor(workers=2, chunk_size=30)
+    result = processor.process(hosts)
+
+    assert result == expected
+    assert all(a is b for a, b in zip(result, expected))
+    mock_logger.warning.assert_called_with(
+        "⚠️ Host without IP and hostname: %s", {"source": "qualys"}
+    )
+    keys = [c.args[1] for c in mock_logger.debug.call_args_list if len(c.args) == 2]
+    assert keys[0] == keys[1]
+
+
+@patch("processors.deduplicate.logger")
+def test_duplicate_keys_only_listed_for_debug(mock_logger):
+    """Test that duplicate keys are only collected when debug logs are on"""
+    hosts = [{"ip": "10.0.0.1", "hostname": "a"}] * 3
+    mock_logger.isEnabledFor.return_value = False
+    DeduplicationProcessor().process(hosts)
+    assert all(len(c.args) != 2 for c in mock_logger.debug.call_args_list)
+
+    mock_logger.isEnabledFor.return_value = True
+    DeduplicationProcessor().process(hosts)
+    mock_logger.debug.assert_called_with(
+        "🔑 Duplicate keys: %s", [("10.0.0.1", "a"), ("10.0.0.1", "a")]
+    )
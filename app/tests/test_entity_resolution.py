@@ -0,0 +1,73 @@
+from ipaddress import ip_address
+from unittest.mock import patch
+
+from processors.entity_resolution import EntityResolver, features, similarity
+from processors.host import Host
+
+
+def _host(hostname, ip, os="Windows"):
+    return Host("qualys", hostname, ip and ip_address(ip), os, None, os)
+
+
+def test_similarity_scores():
+    web01 = features(_host("web01", "10.0.0.5"))
+
+    assert similarity(web01, features(_host("web01.corp.local", "10.0.0.5"))) > 0.9
+    assert similarity(web01, features(_host("web01", "10.0.0.9"))) >= 0.8
+    assert similarity(web01, features(_host("web02", "10.0.0.9"))) < 0.8
+    assert similarity(web01, features(_host("web-01", "10.0.0.5"))) >= 0.8
+    assert similarity(web01, features(_host("web011", "10.0.0.5"))) < 0.8
+    assert similarity(web01, features(_host("web01", "10.9.0.5", "Linux"))) < 0.8
+    assert similarity(web01, features(_host(None, None))) == 0
+
+
+@patch("processors.entity_resolution.logger")
+def test_merges_near_duplicate_clusters(mock_logger):
+    hosts = [
+        _host("web01", "10.0.0.5"),
+        _host("db01", "10.0.1.7", "Linux"),
+        _host("web01.corp.local", None),
+        _host("web02", "10.0.0.6"),
+        _host("web01", "10.0.0.44"),
+        {"hostname": None, "ip": "10.0.1.7", "os": "Ubuntu 22.04"},
+    ]
+    resolver = EntityResolver()
+
+    assert resolver.clusters(hosts) == [[0, 2, 4], [1], [3], [5]]
+    result = resolver.process(hosts)
+
+    assert [h["hostname"] for h in result] == ["web01", "db01", "web02", None]
+    assert result[0] is not hosts[0]
+
+
+@patch("processors.entity_resolution.logger")
+def test_keeps_generic_hostnames_on_other_networks_apart(mock_logger):
+    hosts = [
+        _host("ubuntu", "10.1.1.1", "Linux"),
+        _host("ubuntu", "192.168.5.5", "Linux"),
+        _host("localhost", "172.16.0.1", "Linux"),
+        _host("localhost", "10.9.0.1", "Linux"),
+    ]
+
+    assert similarity(features(hosts[0]), features(hosts[1])) == 0
+    assert EntityResolver().clusters(hosts) == [[0], [1], [2], [3]]
+
+
+@patch("processors.entity_resolution.logger")
+def test_fills_empty_fields_from_cluster(mock_logger):
+    hosts = [
+        {"hostname": "web01", "ip": None, "os": None, "source": "qualys"},
+        {"hostname": "WEB01.corp.local.", "ip": "10.0.0.5", "os": "Windows"},
+    ]
+
+    result = EntityResolver().process(hosts)
+
+    assert result == [
+        {"hostname": "web01", "ip": "10.0.0.5", "os": "Windows", "source": "qualys"}
+    ]
+
+
+@patch("processors.entity_resolution.logger")
+def test_empty_data(mock_logger):
+    assert EntityResolver().process([]) == []
+    mock_logger.info.assert_called_with("📭 No data to resolve")
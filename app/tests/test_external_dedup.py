@@ -0,0 +1,59 @@
+import random
+from datetime import datetime, timezone
+from ipaddress import ip_address
+from unittest.mock import patch
+
+from processors.deduplicate import DeduplicationProcessor
+from processors.external_dedup import ExternalDeduplicationProcessor
+from processors.host import Host
+
+
+def _random_hosts(count, seed=7):
+    rng = random.Random(seed)
+    hosts = []
+    for _ in range(count):
+        ip = rng.choice([None, ip_address(f"10.0.0.{rng.randint(1, 30)}")])
+        hostname = rng.choice([None, f"host{rng.randint(1, 30)}"])
+        seen = datetime(2024, 1, rng.randint(1, 28), tzinfo=timezone.utc)
+        hosts.append(Host("qualys", hostname, ip, "Ubuntu", seen, "Ubuntu"))
+    return hosts
+
+
+@patch("processors.external_dedup.logger")
+@patch("processors.deduplicate.logger")
+def test_matches_in_memory_processor(_dedup_logger, _logger, tmp_path):
+    hosts = _random_hosts(2000)
+    expected = DeduplicationProcessor().process(hosts)
+
+    processor = ExternalDeduplicationProcessor(
+        memory_budget=1024, partitions=4, spill_dir=str(tmp_path)
+    )
+    result = processor.process(hosts)
+
+    assert [h.astuple() for h in result] == [h.astuple() for h in expected]
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("processors.external_dedup.logger")
+@patch("processors.deduplicate.logger")
+def test_dict_hosts_and_iter_process(_dedup_logger, _logger):
+    hosts = [
+        {"ip": "1.1.1.1", "hostname": "host"},
+        {"source": "qualys", "os": "linux"},
+        {"ip": "1.1.1.1", "hostname": "host"},
+        {"ip": "1.1.1.1"},
+        {"source": "qualys", "os": "linux"},
+        {"hostname": "host"},
+        {"ip": "1.1.1.1"},
+    ]
+    processor = ExternalDeduplicationProcessor(memory_budget=64, partitions=2)
+
+    result = list(processor.iter_process(iter(hosts)))
+
+    assert result == DeduplicationProcessor().process(hosts)
+    assert len(result) == 5
+
+
+@patch("processors.deduplicate.logger")
+def test_empty_data(_logger):
+    assert not ExternalDeduplicationProcessor().process([])
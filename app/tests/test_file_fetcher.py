@@ -0,0 +1,83 @@
+import gzip
+import json
+
+import pytest
+from fetchers.base import BaseFetcher
+from fetchers.file import FileFetcher
+
+HOSTS = [{"hostname": f"host{i}", "ip": f"10.0.0.{i}"} for i in range(50)]
+
+
+def _expected(source="qualys"):
+    return [dict(h, source=source) for h in HOSTS]
+
+
+def _ndjson():
+    return "".join(json.dumps(h) + "\n" for h in HOSTS).encode()
+
+
+@pytest.fixture(
+    params=["ndjson", "ndjson.gz", "json", "json.gz"],
+)
+def export_file(request, tmp_path):
+    """Write the same hosts in each supported export format"""
+    if request.param.startswith("ndjson"):
+        data = _ndjson()
+    else:
+        data = json.dumps(HOSTS, indent=1).encode()
+    if request.param.endswith(".gz"):
+        data = gzip.compress(data)
+    path = tmp_path / f"hosts.{request.param}"
+    path.write_bytes(data)
+    return path
+
+
+def test_file_fetcher_reads_all_formats(export_file):
+    """Test that every export format yields the same tagged records"""
+    fetcher = FileFetcher(str(export_file), "qualys", batch_size=16)
+
+    assert isinstance(fetcher, BaseFetcher)
+    assert fetcher.fetch() == _expected()
+    assert [len(page) for page in fetcher.iter_pages()] == [16, 16, 16, 2]
+
+
+def test_split_ranges_cover_file_on_line_boundaries(tmp_path):
+    """Test that byte ranges align to lines and parse to the full file"""
+    path = tmp_path / "hosts.ndjson"
+    path.write_bytes(_ndjson())
+    fetcher = FileFetcher(str(path), "crowdstrike")
+
+    ranges = fetcher.split_ranges(7)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == path.stat().st_size
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    records = [r for a, b in ranges for r in fetcher.iter_range(a, b)]
+    assert records == _expected("crowdstrike")
+
+
+def test_split_ranges_rejects_compressed_files(tmp_path):
+    """Test that gzip exports cannot be split into byte ranges"""
+    path = tmp_path / "hosts.ndjson.gz"
+    path.write_bytes(gzip.compress(_ndjson()))
+
+    with pytest.raises(ValueError):
+        FileFetcher(str(path), "qualys").split_ranges(2)
+
+
+def test_fetch_parallel_preserves_order(tmp_path):
+    """Test that parallel parsing returns records in file order"""
+    path = tmp_path / "hosts.ndjson"
+    path.write_bytes(_ndjson() + b"\n\n")
+
+    assert FileFetcher(str(path), "qualys").fetch_parallel(3) == _expected()
+
+
+def test_empty_file(tmp_path):
+    """Test that an empty export yields no hosts"""
+    path = tmp_path / "empty.ndjson"
+    path.write_bytes(b"")
+    fetcher = FileFetcher(str(path), "qualys")
+
+    assert fetcher.fetch() == []
+    assert fetcher.split_ranges(4) == []
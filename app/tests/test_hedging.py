@@ -0,0 +1,108 @@
+import time
+from unittest.mock import patch
+
+from fetchers.base import BaseFetcher
+from fetchers.hedging import HedgePolicy
+
+
+class MockFetcher(BaseFetcher):
+    """Mock fetcher for testing hedged requests"""
+
+
+def _warm_policy(latency=0.01, **kwargs):
+    policy = HedgePolicy(min_samples=5, **kwargs)
+    for _ in range(5):
+        policy.record(latency)
+    return policy
+
+
+def test_policy_waits_for_samples_before_hedging():
+    """Test that no hedge delay is given until enough latencies are known"""
+    policy = HedgePolicy(percentile=0.5, min_samples=3)
+    policy.record(0.1)
+    policy.record(0.3)
+    assert policy.delay() is None
+
+    policy.record(0.2)
+    assert policy.delay() == 0.2
+
+
+def test_policy_caps_hedge_ratio():
+    """Test that the share of hedged requests stays under the cap"""
+    policy = _warm_policy(max_hedge_ratio=0.1)
+
+    hedged = 0
+    for _ in range(100):
+        policy.delay()
+        hedged += policy.try_hedge()
+
+    assert hedged == 10
+
+
+@patch("fetchers.base.logger")
+def test_slow_request_is_hedged(mock_logger, api_response):
+    """Test that a duplicate request wins over a slow primary"""
+    fetcher = MockFetcher(
+        "http://hedge.test", "test", hedge_policy=_warm_policy(max_hedge_ratio=1.0)
+    )
+    fetcher.api_token = "test_token"
+    calls = []
+
+    def post(*args, **kwargs):
+        calls.append(kwargs["params"])
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return api_response(200, [{"hostname": "slow"}])
+        return api_response(200, [{"hostname": "fast"}])
+
+    with patch("fetchers.transport.requests.Session.post", side_effect=post):
+        response = fetcher._send_hedged(0, 1)
+
+    assert response.json() == [{"hostname": "fast"}]
+    assert calls[0] == calls[1]
+    assert fetcher.stats.hedges == 1
+    assert fetcher.stats.hedges_won == 1
+
+
+@patch("fetchers.base.logger")
+def test_no_hedge_over_budget(mock_logger, api_response):
+    """Test that slow requests are not duplicated once the budget is spent"""
+    fetcher = MockFetcher(
+        "http://hedge.test", "test", hedge_policy=_warm_policy(max_hedge_ratio=0.0)
+    )
+    fetcher.api_token = "test_token"
+
+    def post(*args, **kwargs):
+        time.sleep(0.05)
+        return api_response(200, [{"hostname": "slow"}])
+
+    with patch(
+        "fetchers.transport.requests.Session.post", side_effect=post
+    ) as mock_post:
+        response = fetcher._send_hedged(0, 1)
+
+    assert response.json() == [{"hostname": "slow"}]
+    assert mock_post.call_count == 1
+    assert fetcher.stats.hedges == 0
+
+
+@patch("fetchers.base.logger")
+def test_hedge_pool_is_shut_down_after_fetch(mock_logger, fake_api):
+    """Test that each fetch stops its hedge threads and leaves a fresh pool"""
+    hosts = [{"hostname": f"host{i}"} for i in range(5)]
+    fetcher = MockFetcher(
+        "http://hedge.test", "test", hedge_policy=_warm_policy(max_hedge_ratio=1.0)
+    )
+    fetcher.api_token = "test_token"
+    pools = []
+
+    with patch("fetchers.transport.requests.Session.post", side_effect=fake_api(hosts)):
+        for _ in range(2):
+            pools.append(fetcher._hedge_executor)
+            assert [h["hostname"] for h in fetcher.fetch()] == [
+                h["hostname"] for h in hosts
+            ]
+
+    assert pools[0] is not pools[1]
+    assert all(pool._shutdown for pool in pools)
+    assert MockFetcher("http://hedge.test", "test")._hedge_executor is None
@@ -0,0 +1,35 @@
+from ipaddress import ip_address
+
+import pytest
+from processors.host import Host
+
+
+def test_host_mapping_access():
+    """Test that Host behaves like the normalized host dicts it replaces"""
+    host = Host("qualys", "h", ip_address("10.0.0.1"))
+
+    assert host["hostname"] == "h"
+    assert host.get("os") is None
+    assert host.get("unknown", "x") == "x"
+    assert "last_seen" in host
+    with pytest.raises(KeyError):
+        host["unknown"]
+
+    host["os"] = "Linux"
+    assert dict(host)["os"] == "Linux"
+    assert not hasattr(host, "__dict__")
+
+
+def test_host_to_document():
+    """Test that documents hold BSON-encodable values"""
+    host = Host("qualys", "h", ip_address("10.0.0.1"), os_family="Linux")
+
+    assert host.to_document() == {
+        "source": "qualys",
+        "hostname": "h",
+        "ip": "10.0.0.1",
+        "os": None,
+        "last_seen": None,
+        "os_family": "Linux",
+        "source_id": None,
+    }
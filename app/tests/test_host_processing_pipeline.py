@@ -1,9 +1,19 @@
 from unittest.mock import MagicMock, patch
 import pytest
+from fetchers.base import BaseFetcher
 from pipeline.config import PipelineConfig
+from processors.columnar import ColumnarTransformer
 from pipeline.host_processing_pipeline import HostProcessingPipeline
 
 
+class DummyFetcher(BaseFetcher):
+    def __init__(self):
+        super().__init__("http://dummy.com", "dummy")
+
+    def fetch(self):
+        return [{"ip": "1.1.1.1", "hostname": "h"}]
+
+
 @pytest.fixture
 def mock_config():
     """Create a mock configuration with all necessary components."""
@@ -23,6 +33,10 @@ def mock_config():
     fetcher2.__str__.return_value = "MockFetcher2"
 
     config.fetchers = [fetcher1, fetcher2]
+    config.extract_concurrency = 2
+    config.streaming = False
+    config.transformer = None
+    config.resolver = None
 
     # Mock normalizer, deduplicator, storage, and visualizer
     config.normalizer = MagicMock()
@@ -91,6 +105,32 @@ def test_extract_method(mock_logger, mock_config):
     assert mock_logger.debug.call_count >= 2
 
 
+@patch("pipeline.host_processing_pipeline.logger")
+def test_extract_isolates_failing_source(mock_logger, mock_config):
+    """Test that one failing source does not discard the others' results."""
+    mock_config.fetchers[0].fetch.side_effect = RuntimeError("source down")
+    pipeline = HostProcessingPipeline(mock_config)
+
+    result = pipeline._extract()
+
+    assert [host["hostname"] for host in result] == ["host2"]
+    assert pipeline.extract_results[0].error is not None
+    assert pipeline.extract_results[1].error is None
+    assert all(r.duration >= 0 for r in pipeline.extract_results)
+    mock_logger.error.assert_called()
+
+
+@patch("pipeline.host_processing_pipeline.logger")
+def test_extract_raises_when_all_sources_fail(mock_logger, mock_config):
+    """Test that extraction fails when no source succeeded."""
+    for fetcher in mock_config.fetchers:
+        fetcher.fetch.side_effect = RuntimeError("source down")
+    pipeline = HostProcessingPipeline(mock_config)
+
+    with pytest.raises(RuntimeError):
+        pipeline._extract()
+
+
 @patch("pipeline.host_processing_pipeline.logger")
 def test_transform_method(mock_logger, mock_config):
     """Test the _transform method that normalizes and deduplicates data."""
@@ -188,3 +228,75 @@ def test_run_method(mock_logger, mock_config):
 
     # Check that logging happened
     assert mock_logger.info.call_count >= 8  # Multiple log messages in run method
+
+
+@patch("pipeline.host_processing_pipeline.logger")
+def test_extract_reports_fetcher_stats(mock_logger, mock_config):
+    """Test that retry statistics of real fetchers reach the run summary."""
+    fetcher = DummyFetcher()
+    fetcher.stats.add(requests=3, retries=2, backoff_seconds=1.5)
+    mock_config.fetchers = [fetcher]
+    pipeline = HostProcessingPipeline(mock_config)
+
+    pipeline._extract()
+
+    stats = pipeline.extract_results[0].stats
+    assert stats["retries"] == 2
+    assert stats["backoff_seconds"] == 1.5
+
+
+@patch("pipeline.host_processing_pipeline.logger")
+def test_streaming_run(mock_logger, mock_config):
+    """Test that streaming mode passes hosts lazily from fetchers to storage."""
+    failing = MagicMock()
+    failing.fetch.side_effect = RuntimeError("boom")
+    mock_config.fetchers = [DummyFetcher(), failing]
+    mock_config.streaming = True
+    mock_config.normalizer.iter_process.side_effect = lambda hosts: hosts
+    mock_config.deduplicator.iter_process.side_effect = lambda hosts: hosts
+    mock_config.storage.save_iter.side_effect = lambda hosts: len(list(hosts))
+    pipeline = HostProcessingPipeline(mock_config)
+
+    with patch.object(
+        DummyFetcher, "iter_hosts", return_value=iter([{"ip": "1.1.1.1"}])
+    ):
+        pipeline.run()
+
+    mock_config.storage.save_iter.assert_called_once()
+    mock_config.storage.save.assert_not_called()
+    assert [r.error is None for r in pipeline.extract_results] == [True, False]
+    mock_config.visualizer.generate.assert_called_once()
+
+
+@patch("processors.columnar.logger")
+@patch("pipeline.host_processing_pipeline.logger")
+def test_transform_columnar_engine(mock_logger, mock_columnar_logger, mock_config):
+    """Test that the columnar engine replaces the per-dict processors."""
+    pytest.importorskip("polars")
+    mock_config.transformer = ColumnarTransformer()
+    pipeline = HostProcessingPipeline(mock_config)
+
+    unique = pipeline._transform(
+        [
+            {"source": "qualys", "name": "h", "address": "1.1.1.1"},
+            {"source": "crowdstrike", "hostname": "h", "local_ip": "1.1.1.1"},
+        ]
+    )
+
+    assert [(h["source"], h["hostname"]) for h in unique] == [("qualys", "h")]
+    mock_config.normalizer.process.assert_not_called()
+
+
+@patch("pipeline.host_processing_pipeline.logger")
+def test_transform_runs_resolver(mock_logger, mock_config):
+    """Test that the entity resolver runs on the deduplicated hosts."""
+    mock_config.resolver = MagicMock()
+    mock_config.resolver.process.return_value = [{"hostname": "host1"}]
+    pipeline = HostProcessingPipeline(mock_config)
+
+    unique = pipeline._transform([{"hostname": "host1"}])
+
+    mock_config.resolver.process.assert_called_once_with(
+        mock_config.deduplicator.process.return_value
+    )
+    assert unique == [{"hostname": "host1"}]
@@ -2,6 +2,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 
+@patch("main.FileCheckpointStore")
 @patch("main.HostProcessingPipeline")
 @patch("main.PipelineConfig")
 @patch("main.ChartsVisualizer")
@@ -23,6 +24,7 @@ def test_main_success(
     mock_visualizer,
     mock_config,
     mock_pipeline,
+    mock_checkpoints,
 ):
     """Test successful execution of the main function."""
     # Setup mocks
@@ -70,9 +72,14 @@ def test_main_success(
         deduplicator=mock_deduplicator_instance,
         storage=mock_storage_instance,
         visualizer=mock_visualizer_instance,
+        streaming=False,
+        transformer=None,
+        resolver=None,
     )
     mock_pipeline.assert_called_once_with(mock_config_instance)
     mock_pipeline_instance.run.assert_called_once()
+    mock_checkpoints.assert_called_once_with("checkpoints", max_age=86400.0)
+    mock_checkpoints.return_value.expire.assert_called_once()
 
     # Verify logging
     assert mock_logger.info.call_count >= 4
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from ipaddress import ip_address
+from unittest.mock import patch
+
+from processors.host import Host
+from processors.merge import MergingDeduplicationProcessor
+
+QUALYS = Host(
+    "qualys",
+    "web",
+    ip_address("10.0.0.1"),
+    "Ubuntu 22.04",
+    datetime(2024, 1, 2, tzinfo=timezone.utc),
+    "Ubuntu",
+    "17",
+)
+CROWDSTRIKE = Host(
+    "crowdstrike",
+    "web",
+    ip_address("10.0.0.1"),
+    "Linux",
+    datetime(2024, 1, 1, tzinfo=timezone.utc),
+    "Linux",
+    "a1",
+)
+
+
+@patch("processors.deduplicate.logger")
+def test_merges_fields_by_precedence(mock_logger):
+    other = Host("qualys", "db", ip_address("10.0.0.2"))
+
+    result = MergingDeduplicationProcessor().process([QUALYS, other, CROWDSTRIKE])
+
+    assert result[1] == Host(*other.astuple()[:-1], sources=["qualys"])
+    assert result[0].astuple() == (
+        "crowdstrike",
+        "web",
+        ip_address("10.0.0.1"),
+        "Linux",
+        datetime(2024, 1, 2, tzinfo=timezone.utc),
+        "Linux",
+        "a1",
+        ["crowdstrike", "qualys"],
+    )
+    assert QUALYS.sources is None
+
+
+@patch("processors.deduplicate.logger")
+def test_merge_does_not_depend_on_order(mock_logger):
+    processor = MergingDeduplicationProcessor()
+
+    assert processor.process([QUALYS, CROWDSTRIKE]) == processor.process(
+        [CROWDSTRIKE, QUALYS]
+    )
+
+
+@patch("processors.merge.logger")
+@patch("processors.deduplicate.logger")
+def test_custom_precedence_and_dicts(mock_logger, mock_merge_logger):
+    hosts = [
+        {"ip": "10.0.0.1", "os": "Linux", "source": "crowdstrike", "owner": None},
+        {"ip": "10.0.0.1", "os": "Ubuntu", "source": "qualys", "owner": "ops"},
+        {"source": "qualys"},
+    ]
+    processor = MergingDeduplicationProcessor({"os": ["qualys"]})
+
+    assert processor.process(hosts) == [
+        {
+            "ip": "10.0.0.1",
+            "os": "Ubuntu",
+            "source": "crowdstrike",
+            "owner": "ops",
+            "sources": ["crowdstrike", "qualys"],
+        },
+        {"source": "qualys", "sources": ["qualys"]},
+    ]
@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+from processors.deduplicate import DeduplicationProcessor
+from processors.multi_key_dedup import MultiKeyDeduplicationProcessor
+
+
+@patch("processors.deduplicate.logger")
+@patch("processors.multi_key_dedup.logger")
+def test_merges_hosts_sharing_any_identifier(mock_logger, mock_dedup_logger):
+    hosts = [
+        {"ip": "10.0.0.1", "source": "qualys"},
+        {"hostname": "db", "source": "qualys", "source_id": "7"},
+        {"ip": "10.0.0.1", "hostname": "web", "source": "crowdstrike"},
+        {"hostname": "web", "source": "crowdstrike", "source_id": "a1"},
+        {"ip": "10.0.0.2", "source": "crowdstrike", "source_id": "a1"},
+        {"ip": "10.0.0.3", "source": "crowdstrike", "source_id": "7"},
+        {"source": "qualys", "os": "Linux"},
+    ]
+    processor = MultiKeyDeduplicationProcessor()
+
+    assert processor.clusters(hosts) == [[0, 2, 3, 4], [1], [5], [6]]
+    assert processor.process(hosts) == [hosts[0], hosts[1], hosts[5], hosts[6]]
+    assert len(DeduplicationProcessor().process(hosts)) == 7
+    mock_logger.warning.assert_called_with("⚠️ Host without identifiers: %s", hosts[6])
+
+
+@patch("processors.deduplicate.logger")
+@patch("processors.multi_key_dedup.logger")
+def test_custom_keys(mock_logger, mock_dedup_logger):
+    hosts = [{"ip": "10.0.0.1", "hostname": "a"}, {"ip": "10.0.0.1", "hostname": "b"}]
+
+    assert len(MultiKeyDeduplicationProcessor(keys=["hostname"]).process(hosts)) == 2
+    assert len(list(MultiKeyDeduplicationProcessor().iter_process(iter(hosts)))) == 1
@@ -1,3 +1,8 @@
+from datetime import datetime, timezone
+from ipaddress import ip_address
+
+import pytest
+from processors.host import Host
 from processors.normalize import HostNormalizer
 
 
@@ -49,8 +54,10 @@ def test_normalize_with_source_detection():
 
     # Check other fields
     assert normalized_cs[0]["os"] == "Windows Server 2019"
-    assert normalized_cs[0]["ip"] == "192.168.1.10"
-    assert normalized_unknown[0]["last_seen"] == "2023-06-20T09:45:00"
+    assert normalized_cs[0]["ip"] == ip_address("192.168.1.10")
+    assert normalized_unknown[0]["last_seen"] == datetime(
+        2023, 6, 20, 9, 45, tzinfo=timezone.utc
+    )
 
 
 def test_normalize_mixed_data():
@@ -100,3 +107,108 @@ def test_normalize_mixed_data():
         assert "hostname" in host
         assert "ip" in host
         assert "source" in host
+
+
+def test_normalize_custom_source_mapping():
+    """Test that a new source only needs a declarative mapping"""
+    normalizer = HostNormalizer(
+        mappings={
+            "qualys": {"hostname": "name", "ip": "address"},
+            "tenable": {"hostname": "fqdn", "ip": "ipv4", "os": "operating_system"},
+        },
+        markers={"tenable": ("fqdn",)},
+        canonical=False,
+    )
+    raw = [
+        {"source": "tenable", "fqdn": "t-host", "ipv4": "10.0.0.1"},
+        {"fqdn": "t-host-2", "operating_system": "Linux"},
+        {"source": "unknown", "fqdn": "skipped"},
+        {"name": "q-host", "address": "10.0.0.2"},
+    ]
+
+    normalized = normalizer.process(raw)
+
+    assert normalized == [
+        Host("tenable", "t-host", "10.0.0.1"),
+        Host(None, "t-host-2", os="Linux"),
+        Host(None, "q-host", "10.0.0.2"),
+    ]
+
+
+def test_normalize_typed_records():
+    """Test that typed records normalize like their dict equivalents"""
+    pytest.importorskip("msgspec")
+    from fetchers.records import QualysHost
+
+    host = QualysHost(source="qualys", id=1, name="q", address="1.1.1.1", os="Linux")
+
+    normalized = HostNormalizer().process([host])
+
+    assert normalized == HostNormalizer().process([host.to_dict()])
+    assert normalized[0]["hostname"] == "q"
+
+
+def test_iter_process_matches_process():
+    """Test that streaming normalization yields the same hosts lazily"""
+    raw = [
+        {"source": "qualys", "name": "q", "address": "1.1.1.1"},
+        {"hostname": "c", "local_ip": "2.2.2.2", "platform_name": "Windows"},
+    ]
+    normalizer = HostNormalizer()
+
+    stream = normalizer.iter_process(iter(raw))
+
+    assert not isinstance(stream, list)
+    assert list(stream) == normalizer.process(raw)
+
+
+def test_process_parallel_preserves_order():
+    """Test that chunks normalized in worker processes keep the input order"""
+    raw = [
+        {"source": "qualys", "name": f"q{i}", "address": f"10.0.0.{i}"}
+        for i in range(5)
+    ] + [{"hostname": "c", "local_ip": "10.0.1.1", "platform_id": "7"}]
+    normalizer = HostNormalizer(workers=2, chunk_size=2)
+
+    assert normalizer.process(raw) == list(HostNormalizer().iter_process(raw))
+
+
+def test_normalize_canonical_fields():
+    """Test that equivalent spellings of a host normalize to equal values"""
+    raw = [
+        {
+            "source": "qualys",
+            "name": " Web-01.Example.COM. ",
+            "address": "10.0.0.1",
+            "os": "Ubuntu 22.04",
+            "modified": "2024-03-01T10:00:00Z",
+        },
+        {
+            "source": "crowdstrike",
+            "hostname": "web-01.example.com",
+            "local_ip": " 10.0.0.1",
+            "platform_name": "Windows",
+            "last_seen": "2024-03-01T12:00:00+02:00",
+        },
+    ]
+
+    first, second = HostNormalizer().process(raw)
+
+    assert first["hostname"] == second["hostname"] == "web-01.example.com"
+    assert first["ip"] == second["ip"] == ip_address("10.0.0.1")
+    assert first["last_seen"] == second["last_seen"]
+    assert first["os"] == "Ubuntu 22.04"
+    assert (first["os_family"], second["os_family"]) == ("Ubuntu", "Windows")
+
+
+def test_normalize_unknown_target_gives_dicts():
+    """Test that mappings with fields Host does not have produce dicts"""
+    normalizer = HostNormalizer(
+        mappings={"qualys": {"hostname": "name", "mac": "mac_address"}},
+        markers={},
+        canonical=False,
+    )
+
+    assert normalizer.process([{"name": "h", "mac_address": "aa"}]) == [
+        {"source": None, "hostname": "h", "mac": "aa"}
+    ]
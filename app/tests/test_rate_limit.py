@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from fetchers.qualys import QualysFetcher, QUALYS_URL
+from fetchers.rate_limit import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    configure_rate_limit,
+    get_rate_limiter,
+)
+
+
+def test_token_bucket_limits_rate():
+    """Test that requests beyond the burst wait for new tokens"""
+    bucket = TokenBucket(rate=50, burst=2)
+
+    start = time.monotonic()
+    waits = [bucket.acquire() for _ in range(4)]
+    elapsed = time.monotonic() - start
+
+    assert waits[:2] == [0.0, 0.0]
+    assert elapsed >= 0.03
+
+
+def test_adaptive_concurrency_backs_off_and_ramps_up():
+    """Test AIMD: halve on errors, grow additively while healthy"""
+    concurrency = AdaptiveConcurrency(initial=8, minimum=1, maximum=10)
+
+    concurrency.acquire()
+    concurrency.release(0.1, healthy=False)
+    assert concurrency.limit == 4
+
+    for _ in range(60):
+        concurrency.acquire()
+        concurrency.release(0.1, healthy=True)
+    assert 8 < concurrency.limit <= 10
+
+
+def test_adaptive_concurrency_backs_off_on_latency_spike():
+    """Test that a latency spike reduces the limit even when healthy"""
+    concurrency = AdaptiveConcurrency(initial=8, latency_factor=3.0)
+    for _ in range(5):
+        concurrency.acquire()
+        concurrency.release(0.1, healthy=True)
+    limit = concurrency.limit
+
+    concurrency.acquire()
+    concurrency.release(1.0, healthy=True)
+    assert concurrency.limit == pytest.approx(limit / 2)
+
+
+def test_slot_marks_exceptions_unhealthy():
+    """Test that a failing request counts as unhealthy"""
+    limiter = RateLimiter(initial=4)
+
+    with pytest.raises(ConnectionError):
+        with limiter.slot():
+            raise ConnectionError("refused")
+    assert limiter.concurrency.limit == 2
+
+
+def test_rate_limiter_shared_per_endpoint(monkeypatch):
+    """Test that fetchers share the limiter configured for their endpoint"""
+    # Keep the limiter configured here out of the process-wide registry
+    monkeypatch.setattr("fetchers.rate_limit._limiters", {})
+    limiter = configure_rate_limit(QUALYS_URL, rate=5, burst=5, maximum=8)
+
+    assert get_rate_limiter(QUALYS_URL) is limiter
+    assert QualysFetcher().rate_limiter is limiter
+    assert QualysFetcher().rate_limiter is QualysFetcher().rate_limiter
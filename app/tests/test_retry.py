@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+from fetchers.base import BaseFetcher
+from fetchers.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class MockFetcher(BaseFetcher):
+    """Mock fetcher for testing retries"""
+
+
+def _fetcher(**kwargs):
+    fetcher = MockFetcher("http://retry.test", "test", **kwargs)
+    fetcher.api_token = "test_token"
+    return fetcher
+
+
+def test_backoff_is_jittered_and_capped():
+    """Test full-jitter backoff stays within the exponential cap"""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    for attempt in range(1, 8):
+        delay = policy.backoff(attempt)
+        assert 0 <= delay <= min(5.0, 2 ** (attempt - 1))
+
+
+@patch("fetchers.base.logger")
+@patch("fetchers.base.time.sleep")
+def test_transient_errors_are_retried(mock_sleep, mock_logger, api_response):
+    """Test that a page is retried after transient failures"""
+    fetcher = _fetcher(retry_policy=RetryPolicy(max_attempts=3))
+    responses = [
+        requests.exceptions.ConnectionError("reset"),
+        api_response(503, b"Service Unavailable"),
+        api_response(200, [{"hostname": "host1"}]),
+    ]
+
+    with patch("fetchers.transport.requests.Session.post", side_effect=responses):
+        result = fetcher.fetch()
+
+    assert [h["hostname"] for h in result] == ["host1"]
+    assert fetcher.stats.retries == 2
+    assert fetcher.stats.requests == 3
+    assert fetcher.stats.backoff_seconds == sum(
+        c.args[0] for c in mock_sleep.call_args_list
+    )
+
+
+@patch("fetchers.base.time.sleep")
+def test_non_idempotent_requests_are_not_retried(mock_sleep, api_response):
+    """Test that retries are skipped for non-idempotent requests"""
+    fetcher = _fetcher()
+
+    with patch(
+        "fetchers.transport.requests.Session.post",
+        return_value=api_response(503, b"Service Unavailable"),
+    ) as mock_post:
+        response = fetcher._post(0, 2, idempotent=False)
+
+    assert response.status_code == 503
+    assert mock_post.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("fetchers.base.logger")
+@patch("fetchers.base.time.sleep")
+def test_circuit_breaker_stops_calling_down_source(mock_sleep, mock_logger):
+    """Test that an open circuit refuses requests without calling the API"""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    fetcher = _fetcher(
+        retry_policy=RetryPolicy(max_attempts=2), circuit_breaker=breaker
+    )
+
+    with patch(
+        "fetchers.transport.requests.Session.post",
+        side_effect=requests.exceptions.ConnectionError("refused"),
+    ) as mock_post:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            fetcher.fetch()
+        with pytest.raises(CircuitOpenError):
+            fetcher.fetch()
+
+    assert mock_post.call_count == 3
+    assert fetcher.stats.circuit_rejections == 1
+    mock_logger.warning.assert_called()
+
+
+def test_circuit_breaker_half_opens_after_timeout():
+    """Test that the breaker lets a probe through after the reset timeout"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    with patch("fetchers.retry.time.monotonic", return_value=breaker.opened_at + 11):
+        assert breaker.allow()
+
+    breaker.record_success()
+    assert breaker.allow()
+
+
+def test_circuit_breaker_lets_one_probe_through():
+    """Test that a half-open breaker allows a single probe until it completes"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    expired = breaker.opened_at + 11
+
+    with patch("fetchers.retry.time.monotonic", return_value=expired):
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_failure()
+        # A failed probe re-arms the timeout
+        assert not breaker.allow()
+
+    with patch("fetchers.retry.time.monotonic", return_value=expired + 11):
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.allow()
+        assert breaker.allow()
@@ -1,3 +1,4 @@
+from ipaddress import ip_address
 from unittest.mock import patch, Mock
 from pymongo.errors import OperationFailure
 from storage.mongo import MongoStorage
@@ -70,3 +71,40 @@ def test_save_to_mongo_with_error(mock_logger, mock_collection):
     # Check that error logs were called
     mock_logger.warning.assert_called_once()
     mock_logger.error.assert_called_once()
+
+
+@patch("storage.mongo.collection")
+@patch("storage.mongo.logger")
+def test_save_iter_batches_stream(mock_logger, mock_collection):
+    """Test that a host stream is written batch by batch"""
+    storage = MongoStorage()
+    mock_result = Mock()
+    mock_result.upserted_count = 2
+    mock_result.modified_count = 0
+    mock_collection.bulk_write.return_value = mock_result
+
+    hosts = ({"ip": f"1.1.1.{i}", "hostname": f"h{i}"} for i in range(5))
+    count = storage.save_iter(hosts, batch_size=2)
+
+    assert count == 5
+    assert [len(c.args[0]) for c in mock_collection.bulk_write.call_args_list] == [
+        2,
+        2,
+        1,
+    ]
+
+
+@patch("storage.mongo.collection")
+@patch("storage.mongo.logger")
+def test_save_converts_canonical_ip(mock_logger, mock_collection):
+    """Test that IP address objects are written as strings"""
+    storage = MongoStorage()
+    mock_result = Mock()
+    mock_result.upserted_count = 1
+    mock_result.modified_count = 0
+    mock_collection.bulk_write.return_value = mock_result
+
+    storage.save([{"ip": ip_address("10.0.0.1"), "hostname": "h"}])
+
+    operation = mock_collection.bulk_write.call_args.args[0][0]
+    assert operation._filter == {"ip": "10.0.0.1", "hostname": "h"}
@@ -0,0 +1,95 @@
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+from fetchers.base import BaseFetcher
+from fetchers.streaming import gunzip_chunks, iter_json_array, maybe_gunzip
+
+
+class MockFetcher(BaseFetcher):
+    """Mock fetcher for testing streamed pages"""
+
+
+def _chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+HOSTS = [
+    {"hostname": "a]b", "ip": "1.1.1.1", "tags": ["x,y", {"z": "}"}]},
+    {"hostname": "ünïcode", "ip": None, "port": 12345},
+    12345678,
+    {"hostname": "last", "nested": {"deep": [1, 2, [3]]}},
+]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1024])
+def test_iter_json_array_across_chunk_boundaries(size):
+    """Test that elements split across arbitrary chunks are parsed intact"""
+    data = json.dumps(HOSTS, ensure_ascii=False, indent=1).encode()
+
+    assert list(iter_json_array(_chunks(data, size))) == HOSTS
+
+
+@pytest.mark.parametrize("size", range(1, 8))
+def test_iter_json_array_numbers_across_chunk_boundaries(size):
+    """Test that numbers split at a '.' or 'e' chunk boundary are not truncated"""
+    data = b"[1, -1.5e10, 0.25 , 7E-3]"
+
+    assert list(iter_json_array(_chunks(data, size))) == [1, -1.5e10, 0.25, 7e-3]
+
+
+def test_iter_json_array_is_incremental():
+    """Test that the first element is yielded before the body is fully read"""
+    consumed = []
+
+    def chunks():
+        for chunk in _chunks(json.dumps(HOSTS).encode(), 16):
+            consumed.append(chunk)
+            yield chunk
+
+    first = next(iter_json_array(chunks()))
+
+    assert first == HOSTS[0]
+    assert sum(map(len, consumed)) < len(json.dumps(HOSTS))
+
+
+@pytest.mark.parametrize("body", [b"[]", b" [ ] ", b"[1, 2"])
+def test_iter_json_array_edge_cases(body):
+    """Test empty arrays and truncated bodies"""
+    if body == b"[1, 2":
+        with pytest.raises(ValueError):
+            list(iter_json_array([body]))
+    else:
+        assert list(iter_json_array([body])) == []
+
+
+def test_gzip_streams_are_decompressed():
+    """Test gzip sniffing and multi-member decompression"""
+    data = json.dumps(HOSTS).encode()
+    compressed = gzip.compress(data[:10]) + gzip.compress(data[10:])
+
+    assert b"".join(gunzip_chunks(_chunks(compressed, 5))) == data
+    assert list(iter_json_array(maybe_gunzip(_chunks(compressed, 3)))) == HOSTS
+    assert b"".join(maybe_gunzip([data])) == data
+
+
+@pytest.mark.parametrize("gzipped", [False, True])
+@patch("fetchers.base.logger")
+def test_streamed_fetch_matches_paged_fetch(mock_logger, gzipped, fake_api):
+    """Test that streaming mode yields the same hosts as the paged mode"""
+    hosts = [{"hostname": f"host{i}"} for i in range(5)]
+    streamed = MockFetcher("http://test.com", "test", stream=True)
+    paged = MockFetcher("http://test.com", "test")
+    streamed.api_token = paged.api_token = "test_token"
+
+    with patch(
+        "fetchers.transport.requests.Session.post",
+        side_effect=fake_api(hosts, gzipped=gzipped),
+    ):
+        result = list(streamed.iter_hosts())
+    with patch("fetchers.transport.requests.Session.post", side_effect=fake_api(hosts)):
+        expected = paged.fetch()
+
+    assert result == expected
+    assert [h["hostname"] for h in result] == [h["hostname"] for h in hosts]
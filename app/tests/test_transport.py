@@ -0,0 +1,58 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fetchers.crowdstrike import CrowdstrikeFetcher
+from fetchers.qualys import QualysFetcher
+from fetchers.transport import HttpTransport, get_default_transport
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler returning the received token header"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = f'["{self.headers.get("token")}"]'.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/hosts"
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_reuses_connections(server_url):
+    """Test that consecutive requests share one kept-alive connection"""
+    transport = HttpTransport(pool_maxsize=2, headers={"token": "secret"})
+
+    for skip in range(3):
+        response = transport.post(server_url, params={"skip": skip, "limit": 2})
+        assert response.json() == ["secret"]
+
+    stats = transport.stats()
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+    transport.close()
+
+
+def test_fetchers_share_default_transport():
+    """Test that fetchers use the shared transport unless given their own"""
+    own = HttpTransport(timeout=5)
+
+    assert QualysFetcher().transport is get_default_transport()
+    assert CrowdstrikeFetcher().transport is get_default_transport()
+    assert QualysFetcher(transport=own).transport is own
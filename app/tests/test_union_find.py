@@ -0,0 +1,21 @@
+from processors.union_find import UnionFind
+
+
+def test_union_merges_sets_transitively():
+    sets = UnionFind(5)
+
+    assert sets.union(0, 3)
+    assert sets.union(3, 4)
+    assert not sets.union(4, 0)
+
+    assert sets.find(0) == sets.find(4)
+    assert sets.groups() == [[0, 3, 4], [1], [2]]
+
+
+def test_add_creates_singletons():
+    sets = UnionFind()
+    first, second = sets.add(), sets.add()
+    sets.union(second, first)
+
+    assert len(sets) == 2
+    assert sets.groups() == [[0, 1]]
@@ -180,3 +180,18 @@ def test_chart_file_creation(mock_find, mock_savefig, mock_close):
         assert kwargs.get("bbox_inches") == "tight"
         # Check that filename contains expected extension
         assert str(args[0]).endswith(".png")
+
+
+@patch("visualizations.charts.collection.find")
+@patch("visualizations.charts.plt")
+def test_generate_with_canonical_fields(mock_plt, mock_find):
+    """Test that stored datetimes and OS families are used as they are"""
+    mock_find.return_value = [
+        {"os": "Ubuntu 22.04", "os_family": "Ubuntu", "last_seen": datetime.now()},
+        {"os": "Windows", "os_family": "Windows", "last_seen": datetime(2020, 1, 1)},
+    ]
+
+    stats = ChartsVisualizer().generate()
+
+    assert stats["by_os"] == {"Ubuntu": 1, "Windows": 1}
+    assert (stats["old_hosts"], stats["recent_hosts"]) == (1, 1)
@@ -1,11 +1,12 @@
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Any
 import matplotlib.pyplot as plt
 
 from pymongo import MongoClient
 
+from processors.canonical import os_family, parse_timestamp
 from visualizations.base import BaseVisualizer
 
 client: MongoClient = MongoClient(os.getenv("MONGO_URI", "mongodb://mongo:27017"))
@@ -20,29 +21,7 @@ IMAGES_DIR = Path("visualizations/images")
 class ChartsVisualizer(BaseVisualizer):
     def normalize_os_name(self, os_name: str) -> str:
         """Normalize OS names for better chart display"""
-        if not os_name:
-            return "Unknown"
-
-        os_name = os_name.lower()
-
-        # OS mapping dictionary to reduce return statements
-        os_mapping = {
-            "amazon linux": "Linux",
-            "linux": "Linux",
-            "windows": "Windows",
-            "mac": "macOS",
-            "darwin": "macOS",
-            "ubuntu": "Ubuntu",
-            "centos": "CentOS",
-            "red hat": "Red Hat",
-            "rhel": "Red Hat",
-        }
-
-        for os_key, normalized_name in os_mapping.items():
-            if os_key in os_name:
-                return normalized_name
-
-        return "Other"
+        return os_family(os_name)
 
     def generate(self) -> Dict[str, Any]:
         """Generate charts and statistics"""
@@ -57,24 +36,21 @@ class ChartsVisualizer(BaseVisualizer):
         # Count by OS (with normalization)
         os_counts: Dict[str, int] = {}
         for host in hosts:
-            os_name = host.get("os", "unknown")
-            normalized_os = self.normalize_os_name(os_name)
+            normalized_os = host.get("os_family") or self.normalize_os_name(
+                host.get("os", "unknown")
+            )
             os_counts[normalized_os] = os_counts.get(normalized_os, 0) + 1
 
         # Count old hosts (not seen in 30 days)
-        threshold = datetime.now() - timedelta(days=30)
+        # last_seen is a datetime since normalization parses it once; older
+        # documents may still hold strings
+        threshold = datetime.now(timezone.utc) - timedelta(days=30)
         old = 0
         recent = 0
         for host in hosts:
-            if "last_seen" in host and host["last_seen"]:
-                try:
-                    seen = datetime.strptime(host["last_seen"], "%Y-%m-%dT%H:%M:%S")
-                    if seen < threshold:
-                        old += 1
-                    else:
-                        recent += 1
-                except ValueError:
-                    old += 1
+            seen = parse_timestamp(host.get("last_seen"))
+            if seen is not None and seen >= threshold:
+                recent += 1
             else:
                 old += 1
 